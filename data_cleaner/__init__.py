@@ -7,6 +7,7 @@ import pandas as pd
 
 from logger import get_logger
 from .operations import DataCleanerOperations
+from .sql import clean_dataframe_sql, operations_to_sql
 from .summary import get_data_summary
 
 logger = get_logger()
@@ -29,6 +30,34 @@ class DataCleaner:
         """
         return DataCleanerOperations.apply_operations(df, operations)
     
+    @staticmethod
+    def to_sql(operations: List[Dict[str, Any]], view: str) -> Optional[str]:
+        """
+        Translate cleaning operations into a single DuckDB SQL query.
+        
+        Args:
+            operations: List of cleaning operations
+            view: Name of the registered table/view to read from
+            
+        Returns:
+            SQL query, or None if an operation has no SQL equivalent
+        """
+        return operations_to_sql(operations, view)
+    
+    @staticmethod
+    def clean_dataframe_sql(df: pd.DataFrame, operations: List[Dict[str, Any]]) -> Optional[pd.DataFrame]:
+        """
+        Apply cleaning operations with DuckDB instead of pandas.
+        
+        Args:
+            df: Input DataFrame (not modified)
+            operations: List of cleaning operations
+            
+        Returns:
+            Cleaned DataFrame, or None if the operations cannot be pushed down
+        """
+        return clean_dataframe_sql(df, operations)
+    
     @staticmethod
     def get_data_summary(df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -0,0 +1,203 @@
+"""
+DuckDB SQL pushdown for data cleaning operations.
+"""
+from typing import Any, Dict, List, Optional
+import pandas as pd
+
+from logger import get_logger
+
+logger = get_logger()
+
+
+def _quote(name: str) -> str:
+    """Quote a column name as a SQL identifier."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _number(value: Any) -> str:
+    """Render a numeric parameter as a SQL literal."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Expected a number, got {value!r}")
+    return repr(value)
+
+
+def _drop_na_sql(prev: str, params: Dict[str, Any]) -> Optional[str]:
+    """Build the drop_na step."""
+    subset = params.get("subset")
+    how = params.get("how", "any")
+    if not subset:
+        # COLUMNS(*) conditions are combined with AND, which only expresses how="any"
+        if how != "any":
+            return None
+        return f"SELECT * FROM {prev} WHERE COLUMNS(*) IS NOT NULL"
+    joiner = " AND " if how == "any" else " OR "
+    condition = joiner.join(f"{_quote(c)} IS NOT NULL" for c in subset)
+    return f"SELECT * FROM {prev} WHERE {condition}"
+
+
+def _drop_columns_sql(prev: str, params: Dict[str, Any]) -> Optional[str]:
+    """Build the drop_columns step."""
+    columns = params.get("columns", [])
+    if not columns:
+        return f"SELECT * FROM {prev}"
+    return f"SELECT * EXCLUDE ({', '.join(_quote(c) for c in columns)}) FROM {prev}"
+
+
+def _rename_columns_sql(prev: str, params: Dict[str, Any]) -> Optional[str]:
+    """Build the rename_columns step."""
+    mapping = params.get("mapping", {})
+    if not mapping:
+        return f"SELECT * FROM {prev}"
+    renames = ", ".join(f"{_quote(old)} AS {_quote(new)}" for old, new in mapping.items())
+    return f"SELECT * RENAME ({renames}) FROM {prev}"
+
+
+def _clip_values_sql(prev: str, params: Dict[str, Any]) -> Optional[str]:
+    """Build the clip_values step."""
+    column = params.get("column")
+    min_val = params.get("min")
+    max_val = params.get("max")
+    if not column or (min_val is None and max_val is None):
+        return f"SELECT * FROM {prev}"
+    col = _quote(column)
+    # CASE keeps NULLs as NULL, like Series.clip (LEAST/GREATEST would skip them)
+    branches = []
+    if min_val is not None:
+        branches.append(f"WHEN {col} < {_number(min_val)} THEN {_number(min_val)}")
+    if max_val is not None:
+        branches.append(f"WHEN {col} > {_number(max_val)} THEN {_number(max_val)}")
+    return f"SELECT * REPLACE (CASE {' '.join(branches)} ELSE {col} END AS {col}) FROM {prev}"
+
+
+def _round_values_sql(prev: str, params: Dict[str, Any]) -> Optional[str]:
+    """Build the round_values step."""
+    columns = params.get("columns")
+    if not columns:
+        # The default (all numeric columns) depends on dtypes the SQL does not know
+        return None
+    decimals = int(params.get("decimals", 2))
+    # round_even matches pandas' round-half-to-even
+    replaced = ", ".join(f"round_even({_quote(c)}, {decimals}) AS {_quote(c)}" for c in columns)
+    return f"SELECT * REPLACE ({replaced}) FROM {prev}"
+
+
+def _remove_outliers_sql(prev: str, params: Dict[str, Any]) -> Optional[str]:
+    """Build a remove_outliers step for a single column."""
+    column = params.get("column")
+    if column is None:
+        return None
+    col = _quote(column)
+    method = params.get("method", "iqr")
+    if method == "iqr":
+        q1 = f"quantile_cont({col}, 0.25)"
+        q3 = f"quantile_cont({col}, 0.75)"
+        return (
+            f"SELECT * FROM {prev} WHERE {col} BETWEEN "
+            f"(SELECT {q1} - 1.5 * ({q3} - {q1}) FROM {prev}) AND "
+            f"(SELECT {q3} + 1.5 * ({q3} - {q1}) FROM {prev})"
+        )
+    if method == "zscore":
+        threshold = _number(params.get("threshold", 3))
+        return (
+            f"SELECT * FROM {prev} WHERE abs(({col} - (SELECT avg({col}) FROM {prev})) / "
+            f"(SELECT stddev_samp({col}) FROM {prev})) < {threshold}"
+        )
+    return None
+
+
+def _expand_operations(operations: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """Split remove_outliers into one step per column, as pandas filters them sequentially."""
+    expanded = []
+    for op in operations:
+        params = op.get("params", {}) or {}
+        if op.get("operation") != "remove_outliers":
+            expanded.append({"operation": op.get("operation"), "params": params})
+            continue
+        columns = params.get("columns")
+        if not columns:
+            # The default (all numeric columns) depends on dtypes the SQL does not know
+            return None
+        for column in columns:
+            expanded.append({"operation": "remove_outliers", "params": {**params, "column": column}})
+    return expanded
+
+
+_SQL_BUILDERS = {
+    "drop_na": _drop_na_sql,
+    "drop_columns": _drop_columns_sql,
+    "rename_columns": _rename_columns_sql,
+    "clip_values": _clip_values_sql,
+    "round_values": _round_values_sql,
+    "remove_outliers": _remove_outliers_sql,
+}
+
+
+def operations_to_sql(operations: List[Dict[str, Any]], view: str) -> Optional[str]:
+    """
+    Translate cleaning operations into a single DuckDB query.
+
+    Args:
+        operations: List of cleaning operations (same format as clean_dataframe)
+        view: Name of the registered table/view to read from
+
+    Returns:
+        SQL query, or None if any operation has no SQL equivalent
+    """
+    expanded = _expand_operations(operations)
+    if expanded is None:
+        return None
+
+    ctes = []
+    prev = _quote(view)
+    try:
+        for op in expanded:
+            builder = _SQL_BUILDERS.get(op["operation"])
+            if builder is None:
+                return None
+            query = builder(prev, op["params"])
+            if query is None:
+                return None
+            step = f"step{len(ctes) + 1}"
+            ctes.append(f"{step} AS ({query})")
+            prev = step
+    except (ValueError, TypeError) as e:
+        logger.debug(f"Cannot translate cleaning operations to SQL: {e}")
+        return None
+
+    if not ctes:
+        return f"SELECT * FROM {prev}"
+    return f"WITH {', '.join(ctes)} SELECT * FROM {prev}"
+
+
+def clean_dataframe_sql(df: pd.DataFrame, operations: List[Dict[str, Any]]) -> Optional[pd.DataFrame]:
+    """
+    Apply cleaning operations to a DataFrame with DuckDB.
+
+    Args:
+        df: Input DataFrame (not modified)
+        operations: List of cleaning operations
+
+    Returns:
+        Cleaned DataFrame with a fresh index, or None if the operations cannot
+        be pushed down (caller should fall back to clean_dataframe)
+    """
+    query = operations_to_sql(operations, "src")
+    if query is None:
+        return None
+
+    try:
+        import duckdb
+    except ImportError:
+        logger.debug("duckdb not available, cannot push down cleaning operations")
+        return None
+
+    con = duckdb.connect()
+    try:
+        con.register("src", df)
+        return con.execute(query).df()
+    except Exception as e:
+        # e.g. a column referenced by an operation does not exist
+        logger.debug(f"DuckDB cleaning pushdown failed, falling back to pandas: {e}")
+        return None
+    finally:
+        con.close()
@@ -16,14 +16,19 @@ class FormatHandlers:
     """Handlers for different file formats."""
     
     @staticmethod
-    def load_json(file_path: str) -> list:
-        """Load data from JSON file."""
-        return TextFormatHandlers.load_json(file_path)
+    def load_json(source) -> list:
+        """Load data from JSON file (path or bytes)."""
+        return TextFormatHandlers.load_json(source)
     
     @staticmethod
-    def load_csv(file_path: str, has_header: bool = True) -> list:
-        """Load data from CSV file."""
-        return TextFormatHandlers.load_csv(file_path, has_header)
+    def load_jsonl(source) -> list:
+        """Load data from JSONL file (path or bytes)."""
+        return TextFormatHandlers.load_jsonl(source)
+    
+    @staticmethod
+    def load_csv(source, has_header: bool = True) -> list:
+        """Load data from CSV file (path or bytes)."""
+        return TextFormatHandlers.load_csv(source, has_header)
     
     @staticmethod
     def load_txt(file_path: str, delimiter: str = "\t") -> list:
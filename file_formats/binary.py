@@ -7,6 +7,9 @@ from logger import get_logger
 
 logger = get_logger()
 
+# Rows decoded per Arrow batch when reading Parquet
+PARQUET_BATCH_ROWS = 100_000
+
 
 class BinaryFormatHandlers:
     """Binary format handlers."""
@@ -14,12 +17,37 @@ class BinaryFormatHandlers:
     @staticmethod
     def load_parquet(file_path: str) -> List[Dict[str, Any]]:
         """Load data from Parquet file."""
+        try:
+            import pyarrow.parquet as pq
+
+            # Memory-map the file and convert Arrow batches straight to records,
+            # skipping the intermediate pandas DataFrame. Reading batch by batch
+            # keeps only one decoded batch in memory next to the records.
+            parquet_file = pq.ParquetFile(file_path, memory_map=True)
+            schema = parquet_file.schema_arrow
+
+            # Drop stored pandas index columns, matching DataFrame.to_dict("records")
+            pandas_metadata = schema.pandas_metadata or {}
+            index_columns = {c for c in pandas_metadata.get("index_columns", []) if isinstance(c, str)}
+            columns = [name for name in schema.names if name not in index_columns]
+
+            records = []
+            for batch in parquet_file.iter_batches(batch_size=PARQUET_BATCH_ROWS, columns=columns):
+                records.extend(batch.to_pylist())
+
+            logger.info(f"Loaded {len(records)} records from Parquet file")
+            return records
+        except ImportError:
+            logger.debug("pyarrow not available, falling back to pandas for Parquet")
+        except Exception as e:
+            logger.warning(f"Arrow read of Parquet file {file_path} failed, falling back to pandas: {e}")
+
         try:
             import pandas as pd
-            
+
             df = pd.read_parquet(file_path)
             records = df.to_dict("records")
-            
+
             logger.info(f"Loaded {len(records)} records from Parquet file")
             return records
         except ImportError:
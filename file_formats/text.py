@@ -2,37 +2,96 @@
 Text format loaders (JSON, CSV, TXT).
 """
 import csv
+import io
 import json
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from logger import get_logger
 
 logger = get_logger()
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# A file path, or the file contents already in memory (e.g. a storage blob)
+Source = Union[str, bytes]
+
+
+def _describe(source: Source) -> str:
+    """Name a source in log messages."""
+    return "in-memory data" if isinstance(source, (bytes, bytearray)) else str(source)
+
+
+def _read_bytes(source: Source) -> bytes:
+    """Raw contents of a source."""
+    if isinstance(source, (bytes, bytearray)):
+        return source
+    with open(source, "rb") as f:
+        return f.read()
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON with orjson when available, else the standard library."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and >64-bit integers that json accepts
+            pass
+    return json.loads(raw)
+
 
 class TextFormatHandlers:
     """Text format handlers."""
     
     @staticmethod
-    def load_json(file_path: str) -> List[Dict[str, Any]]:
-        """Load data from JSON file."""
+    def load_json(source: Source) -> List[Dict[str, Any]]:
+        """Load data from a JSON file path or JSON bytes."""
         try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
+            data = _json_loads(_read_bytes(source))
             
             if isinstance(data, dict):
                 return [data]
             elif isinstance(data, list):
                 return data
             else:
-                logger.error(f"Invalid JSON structure in {file_path}")
+                logger.error(f"Invalid JSON structure in {_describe(source)}")
                 return []
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in {file_path}: {e}")
+            logger.error(f"Invalid JSON in {_describe(source)}: {e}")
             return []
         except Exception as e:
-            logger.error(f"Error loading JSON file {file_path}: {e}")
+            logger.error(f"Error loading JSON file {_describe(source)}: {e}")
+            return []
+    
+    @staticmethod
+    def load_jsonl(source: Source) -> List[Dict[str, Any]]:
+        """Load data from a JSONL (one JSON object per line) file path or bytes."""
+        try:
+            records = []
+            line_count = 0
+            error_lines = []
+            for line_num, line in enumerate(_read_bytes(source).splitlines(), 1):
+                line_count += 1
+                line = line.strip()
+                if line:
+                    try:
+                        records.append(_json_loads(line))
+                    except ValueError as je:
+                        error_lines.append(line_num)
+                        logger.debug(f"JSONL parse error at line {line_num}: {je}")
+
+            logger.info(f"JSONL: processed {line_count} lines, loaded {len(records)} records")
+            if error_lines:
+                logger.warning(f"JSONL: {len(error_lines)} lines failed to parse")
+            return records
+        except Exception as e:
+            logger.error(f"Error loading JSONL file {_describe(source)}: {e}", exc_info=True)
             return []
     
     @staticmethod
@@ -118,12 +177,16 @@ class TextFormatHandlers:
         return normalized
     
     @staticmethod
-    def load_csv(file_path: str, has_header: bool = True) -> List[Dict[str, Any]]:
-        """Load data from CSV file and normalize to VARIOSYNC format."""
+    def load_csv(source: Source, has_header: bool = True) -> List[Dict[str, Any]]:
+        """Load data from a CSV file path or CSV bytes and normalize to VARIOSYNC format."""
         try:
             records = []
             
-            with open(file_path, "r", encoding="utf-8") as f:
+            if isinstance(source, (bytes, bytearray)):
+                f = io.StringIO(source.decode("utf-8"), newline="")
+            else:
+                f = open(source, "r", encoding="utf-8")
+            with f:
                 reader = csv.DictReader(f) if has_header else csv.reader(f)
                 
                 if has_header:
@@ -148,7 +211,7 @@ class TextFormatHandlers:
             logger.info(f"Loaded {len(records)} records from CSV file")
             return records
         except Exception as e:
-            logger.error(f"Error loading CSV file {file_path}: {e}", exc_info=True)
+            logger.error(f"Error loading CSV file {_describe(source)}: {e}", exc_info=True)
             return []
     
     @staticmethod
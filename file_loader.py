@@ -146,6 +146,38 @@ class FileLoader:
         )
     
     
+    @staticmethod
+    def _validate_records(records: List[Dict[str, Any]], format_name: str) -> List[Dict[str, Any]]:
+        """Validate loaded records and log details."""
+        if records is None:
+            logger.error(f"[FileLoader.load] {format_name} handler returned None")
+            return []
+
+        if not isinstance(records, list):
+            logger.error(f"[FileLoader.load] {format_name} handler returned non-list: {type(records)}")
+            return []
+
+        logger.info(f"[FileLoader.load] Loaded {len(records)} records from {format_name} format")
+
+        if len(records) == 0:
+            logger.warning(f"[FileLoader.load] No records found in {format_name} file")
+            return []
+
+        # Log sample record structure
+        sample = records[0]
+        if isinstance(sample, dict):
+            keys = list(sample.keys())
+            logger.debug(f"[FileLoader.load] Sample record keys: {keys[:10]}{'...' if len(keys) > 10 else ''}")
+
+            # Check for common required fields
+            has_timestamp = 'timestamp' in sample or 'date' in sample or 'time' in sample
+            has_measurements = 'measurements' in sample
+            logger.debug(f"[FileLoader.load] Has timestamp field: {has_timestamp}, Has measurements: {has_measurements}")
+        else:
+            logger.warning(f"[FileLoader.load] First record is not a dict: {type(sample)}")
+
+        return records
+
     @staticmethod
     def load(file_path: str, file_format: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -196,36 +228,7 @@ class FileLoader:
         
         handlers = FormatHandlers()
 
-        def validate_and_log_records(records: List[Dict[str, Any]], format_name: str) -> List[Dict[str, Any]]:
-            """Validate loaded records and log details."""
-            if records is None:
-                logger.error(f"[FileLoader.load] {format_name} handler returned None")
-                return []
-
-            if not isinstance(records, list):
-                logger.error(f"[FileLoader.load] {format_name} handler returned non-list: {type(records)}")
-                return []
-
-            logger.info(f"[FileLoader.load] Loaded {len(records)} records from {format_name} format")
-
-            if len(records) == 0:
-                logger.warning(f"[FileLoader.load] No records found in {format_name} file")
-                return []
-
-            # Log sample record structure
-            sample = records[0]
-            if isinstance(sample, dict):
-                keys = list(sample.keys())
-                logger.debug(f"[FileLoader.load] Sample record keys: {keys[:10]}{'...' if len(keys) > 10 else ''}")
-
-                # Check for common required fields
-                has_timestamp = 'timestamp' in sample or 'date' in sample or 'time' in sample
-                has_measurements = 'measurements' in sample
-                logger.debug(f"[FileLoader.load] Has timestamp field: {has_timestamp}, Has measurements: {has_measurements}")
-            else:
-                logger.warning(f"[FileLoader.load] First record is not a dict: {type(sample)}")
-
-            return records
+        validate_and_log_records = FileLoader._validate_records
 
         # Direct load formats
         if file_format == "json":
@@ -233,29 +236,8 @@ class FileLoader:
             return validate_and_log_records(records, "JSON")
         elif file_format == "jsonl" or file_format == "ndjson":
             # JSONL is one JSON object per line
-            try:
-                records = []
-                line_count = 0
-                error_lines = []
-                with open(file_path, "r", encoding="utf-8") as f:
-                    import json
-                    for line_num, line in enumerate(f, 1):
-                        line_count += 1
-                        line = line.strip()
-                        if line:
-                            try:
-                                records.append(json.loads(line))
-                            except json.JSONDecodeError as je:
-                                error_lines.append(line_num)
-                                logger.debug(f"[FileLoader.load] JSONL parse error at line {line_num}: {je}")
-
-                logger.info(f"[FileLoader.load] JSONL: processed {line_count} lines, loaded {len(records)} records")
-                if error_lines:
-                    logger.warning(f"[FileLoader.load] JSONL: {len(error_lines)} lines failed to parse")
-                return validate_and_log_records(records, "JSONL")
-            except Exception as e:
-                logger.error(f"[FileLoader.load] Error loading JSONL file: {e}", exc_info=True)
-                return []
+            records = handlers.load_jsonl(file_path)
+            return validate_and_log_records(records, "JSONL")
         elif file_format == "csv":
             records = handlers.load_csv(file_path)
             return validate_and_log_records(records, "CSV")
@@ -394,3 +376,54 @@ class FileLoader:
             logger.warning(f"[FileLoader.load] Unknown format {file_format}, trying JSON")
             records = handlers.load_json(file_path)
             return validate_and_log_records(records, f"Unknown ({file_format})")
+
+    @staticmethod
+    def load_bytes(data: bytes, suffix: str, file_format: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Load data from file contents already in memory (e.g. a storage blob).
+
+        JSON, JSONL, CSV, Parquet, Feather and Arrow are parsed straight from the
+        buffer; other formats are spooled to a temporary file and passed to load().
+
+        Args:
+            data: Raw file contents
+            suffix: File extension used for format detection (e.g. ".csv")
+            file_format: Optional format override
+
+        Returns:
+            List of records
+        """
+        if not data:
+            logger.warning("[FileLoader.load_bytes] No data provided")
+            return []
+
+        if file_format is None:
+            file_format = FileLoader.detect_format(f"data{suffix}") or "json"
+
+        logger.info(f"[FileLoader.load_bytes] Loading {len(data)} bytes as {file_format} format")
+
+        handlers = FormatHandlers()
+        if file_format == "json":
+            return FileLoader._validate_records(handlers.load_json(data), "JSON")
+        if file_format in ("jsonl", "ndjson"):
+            return FileLoader._validate_records(handlers.load_jsonl(data), "JSONL")
+        if file_format == "csv":
+            return FileLoader._validate_records(handlers.load_csv(data), "CSV")
+
+        if file_format in ("parquet", "feather", "arrow"):
+            import io
+            if file_format == "parquet":
+                records = handlers.load_parquet(io.BytesIO(data))
+            else:
+                records = handlers.load_feather(io.BytesIO(data))
+            return FileLoader._validate_records(records, file_format.capitalize())
+
+        # Remaining formats need a real file (SQLite, HDF5, archives, ...)
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+            tmp.write(data)
+            temp_path = tmp.name
+        try:
+            return FileLoader.load(temp_path, file_format)
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
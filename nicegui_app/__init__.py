@@ -2,9 +2,12 @@
 VARIOSYNC NiceGUI Web Application
 Modern web UI for time-series data processing and visualization.
 """
+import hashlib
+import importlib.util
 import os
 import urllib.parse
 from pathlib import Path
+from types import SimpleNamespace
 
 from nicegui import ui, app
 from logger import get_logger
@@ -12,42 +15,67 @@ from main import VariosyncApp
 
 logger = get_logger()
 
-# Matplotlib support
+# Matplotlib support: only probe for the package here, importing pyplot is
+# deferred to the first matplotlib chart (see get_matplotlib)
 try:
-    import matplotlib
-    matplotlib.use('Agg')
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    from matplotlib.figure import Figure
-    from io import BytesIO
-    import base64
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
+    MATPLOTLIB_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
+except (ImportError, ValueError):
     MATPLOTLIB_AVAILABLE = False
+if not MATPLOTLIB_AVAILABLE:
     logger.warning("Matplotlib not available. Install with: pip install matplotlib")
 
+_matplotlib = None
+
+
+def get_matplotlib() -> SimpleNamespace:
+    """
+    Import matplotlib with the non-interactive backend on first use.
+
+    Returns:
+        Namespace with the pyplot (``plt``) and dates (``mdates``) modules
+    """
+    global _matplotlib
+    if _matplotlib is None:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        import matplotlib.dates as mdates
+        _matplotlib = SimpleNamespace(plt=plt, mdates=mdates)
+    return _matplotlib
+
 # Static files and favicon configuration
 STATIC_DIR = Path(__file__).parent.parent / "static"
 STATIC_DIR.mkdir(exist_ok=True)
 
-# Always register static files directory
-app.add_static_files("/static", str(STATIC_DIR))
-
 FAVICON_PATH = STATIC_DIR / "favicon.ico"
 FAVICON_SVG_PATH = STATIC_DIR / "favicon.svg"
+FAVICON_SVG = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#3b82f6"><path d="M12 4V1L8 5l4 4V6c3.31 0 6 2.69 6 6 0 1.01-.25 1.97-.7 2.8l1.46 1.46C19.54 15.03 20 13.57 20 12c0-4.42-3.58-8-8-8zm0 14c-3.31 0-6-2.69-6-6 0-1.01.25-1.97.7-2.8L5.24 7.74C4.46 8.97 4 10.43 4 12c0 4.42 3.58 8 8 8v3l4-4-4-4v3z"/></svg>"""
+
+# Always register static files directory (precompressed, cached by ETag or content version)
+from .static_files import register_static_files
+register_static_files("/static", STATIC_DIR)
+
+
+def _static_url(path: Path) -> str:
+    """URL of a file in STATIC_DIR with a content hash, so browsers may cache it as immutable."""
+    version = hashlib.blake2b(path.read_bytes(), digest_size=4).hexdigest()
+    return f"/static/{path.name}?v={version}"
+
 
 if FAVICON_PATH.exists():
+    favicon_url = _static_url(FAVICON_PATH)
     ui.add_head_html(f'''
-    <link rel="icon" type="image/x-icon" href="/static/favicon.ico">
-    <link rel="shortcut icon" type="image/x-icon" href="/static/favicon.ico">
+    <link rel="icon" type="image/x-icon" href="{favicon_url}">
+    <link rel="shortcut icon" type="image/x-icon" href="{favicon_url}">
     ''', shared=True)
 elif FAVICON_SVG_PATH.exists():
+    favicon_url = _static_url(FAVICON_SVG_PATH)
     ui.add_head_html(f'''
-    <link rel="icon" type="image/svg+xml" href="/static/favicon.svg">
-    <link rel="shortcut icon" type="image/svg+xml" href="/static/favicon.svg">
+    <link rel="icon" type="image/svg+xml" href="{favicon_url}">
+    <link rel="shortcut icon" type="image/svg+xml" href="{favicon_url}">
     ''', shared=True)
 else:
-    FAVICON_SVG = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#3b82f6"><path d="M12 4V1L8 5l4 4V6c3.31 0 6 2.69 6 6 0 1.01-.25 1.97-.7 2.8l1.46 1.46C19.54 15.03 20 13.57 20 12c0-4.42-3.58-8-8-8zm0 14c-3.31 0-6-2.69-6-6 0-1.01.25-1.97.7-2.8L5.24 7.74C4.46 8.97 4 10.43 4 12c0 4.42 3.58 8 8 8v3l4-4-4-4v3z"/></svg>"""
+    # No icon file shipped: fall back to the inline data URI
     encoded_svg = urllib.parse.quote(FAVICON_SVG)
     ui.add_head_html(f'''
     <link rel="icon" type="image/svg+xml" href="data:image/svg+xml,{encoded_svg}">
@@ -76,60 +104,79 @@ from .navbar import create_navbar
 # from .dashboard import dashboard_page  # TODO: Extract dashboard_page to dashboard.py
 from .health import health_check
 from .state import get_state, UIState
-from .visualization import (
-    load_timeseries_data,
-    load_timeseries_from_file,
-    get_available_series,
-    is_financial_data,
-    get_available_metrics,
-    extract_ohlcv_data,
-    create_matplotlib_financial_plot,
-    create_matplotlib_plot,
-    matplotlib_figure_to_base64,
-    create_financial_plot,
-    create_plot,
-)
-
-# Import additional visualization libraries
-try:
-    from .altair_viz import (
-        create_altair_financial_plot,
-        create_altair_plot,
-        create_altair_plot_wrapper,
-        altair_chart_to_dict,
-        altair_chart_to_html,
-        ALTAIR_AVAILABLE,
-    )
-except ImportError:
-    ALTAIR_AVAILABLE = False
+# Plotting modules pull in plotly, altair and friends, so their names are
+# resolved on first access (PEP 562) instead of at package import
+_LAZY_MODULES = {
+    '.visualization': (
+        'load_timeseries_data',
+        'load_timeseries_from_file',
+        'get_available_series',
+        'is_financial_data',
+        'get_available_metrics',
+        'extract_ohlcv_data',
+        'extract_ohlcv_frame',
+        'downsample_for_plot',
+        'create_matplotlib_financial_plot',
+        'create_matplotlib_plot',
+        'matplotlib_figure_to_base64',
+        'matplotlib_figure_to_png',
+        'create_financial_plot',
+        'create_plot',
+    ),
+    '.altair_viz': (
+        'create_altair_financial_plot',
+        'create_altair_plot',
+        'create_altair_plot_wrapper',
+        'altair_chart_to_dict',
+        'altair_chart_to_html',
+        'ALTAIR_AVAILABLE',
+    ),
+    '.highcharts_viz': (
+        'create_highcharts_financial_plot',
+        'create_highcharts_plot',
+        'create_highcharts_plot_wrapper',
+        'highcharts_config_to_html',
+        'HIGHCHARTS_AVAILABLE',
+    ),
+    '.echarts_viz': (
+        'create_echarts_financial_plot',
+        'create_echarts_plot',
+        'create_echarts_plot_wrapper',
+        'echarts_config_to_html',
+        'ECHARTS_AVAILABLE',
+    ),
+}
+_LAZY = {name: module for module, names in _LAZY_MODULES.items() for name in names}
 
-try:
-    from .highcharts_viz import (
-        create_highcharts_financial_plot,
-        create_highcharts_plot,
-        create_highcharts_plot_wrapper,
-        highcharts_config_to_html,
-        HIGHCHARTS_AVAILABLE,
-    )
-except ImportError:
-    HIGHCHARTS_AVAILABLE = False
 
-try:
-    from .echarts_viz import (
-        create_echarts_financial_plot,
-        create_echarts_plot,
-        create_echarts_plot_wrapper,
-        echarts_config_to_html,
-        ECHARTS_AVAILABLE,
-    )
-except ImportError:
-    ECHARTS_AVAILABLE = False
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    try:
+        module = importlib.import_module(module_name, __name__)
+    except ImportError:
+        # A library whose wrapper module cannot be imported is unavailable
+        if name.endswith('_AVAILABLE'):
+            globals()[name] = False
+            return False
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     'create_navbar',
     # 'dashboard_page',  # TODO: Uncomment when dashboard.py is created
     'health_check',
     'get_app_instance',
+    'get_matplotlib',
     'get_state',
     'UIState',
     'MATPLOTLIB_AVAILABLE',
@@ -142,9 +189,12 @@ __all__ = [
     'is_financial_data',
     'get_available_metrics',
     'extract_ohlcv_data',
+    'extract_ohlcv_frame',
+    'downsample_for_plot',
     'create_matplotlib_financial_plot',
     'create_matplotlib_plot',
     'matplotlib_figure_to_base64',
+    'matplotlib_figure_to_png',
     'create_financial_plot',
     'create_plot',
     # Altair functions
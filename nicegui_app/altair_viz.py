@@ -2,18 +2,28 @@
 NiceGUI App Altair Visualization Functions
 Altair-based plotting functions for time-series and financial data.
 """
+import hashlib
 import json
-from typing import Optional, Tuple, List, Dict, Any
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Tuple, List, Dict, Any, NamedTuple
 
+import numpy as np
 import pandas as pd
+from fastapi import Request
+from fastapi.responses import Response
+from nicegui import app
 
 from logger import get_logger
+from .static_files import encoded_response, precompress
 from .visualization import (
     load_timeseries_data,
     get_available_series,
     is_financial_data,
     get_available_metrics,
-    extract_ohlcv_data,
+    extract_ohlcv_frame,
+    extract_metric_values,
+    lttb_indices,
 )
 
 logger = get_logger()
@@ -21,242 +31,105 @@ logger = get_logger()
 # Altair imports
 try:
     import altair as alt
-    alt.data_transformers.disable_max_rows()  # Allow large datasets
     ALTAIR_AVAILABLE = True
+
+    # VegaFusion evaluates data transforms server-side and ships only their
+    # results; without it, allow large frames through the default transformer
+    try:
+        import vegafusion  # noqa: F401
+        alt.data_transformers.enable("vegafusion")
+        VEGAFUSION_AVAILABLE = True
+    except ImportError:
+        alt.data_transformers.enable("default", max_rows=1_000_000)
+        VEGAFUSION_AVAILABLE = False
 except ImportError:
     ALTAIR_AVAILABLE = False
+    VEGAFUSION_AVAILABLE = False
     logger.warning("Altair not available. Install with: pip install altair")
 
+# Rows per series handed to Altair; the spec embeds every row as JSON
+ALTAIR_MAX_POINTS = 2000
 
-def create_altair_financial_plot(
-    df: pd.DataFrame, 
-    series_id: Optional[str] = None, 
-    chart_type: str = "candlestick", 
-    show_volume: bool = True
-):
-    """Create Altair financial chart (candlestick or OHLC) with optional volume subplot."""
-    if not ALTAIR_AVAILABLE:
-        return None
-    
-    ohlcv = extract_ohlcv_data(df, series_id)
+
+def _downsample(df: pd.DataFrame, y: str, x: str = 'timestamp', n_out: int = ALTAIR_MAX_POINTS) -> pd.DataFrame:
+    """Keep the rows LTTB picks for the shape of df[y] over df[x]."""
+    if len(df) <= n_out:
+        return df
+    x_values = df[x]
+    if pd.api.types.is_datetime64_any_dtype(x_values):
+        x_values = x_values.astype('int64')
+    x_values = pd.to_numeric(x_values, errors='coerce').to_numpy(dtype=np.float64)
+    y_values = pd.to_numeric(df[y], errors='coerce').to_numpy(dtype=np.float64)
+    return df.iloc[lttb_indices(x_values, y_values, n_out)]
+
+
+def _financial_frame(df: pd.DataFrame, series_id: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """Build the OHLCV rows for a financial chart, or None if there are none."""
+    chart_df = extract_ohlcv_frame(df, series_id)
     
-    if len(ohlcv['timestamp']) == 0:
+    if len(chart_df) == 0:
         return None
     
-    # Convert to DataFrame for Altair
-    chart_df = pd.DataFrame({
-        'timestamp': pd.to_datetime(ohlcv['timestamp']),
-        'open': ohlcv['open'],
-        'high': ohlcv['high'],
-        'low': ohlcv['low'],
-        'close': ohlcv['close'],
-        'volume': ohlcv['volume']
-    })
-    
     # Determine if price increased (for color coding)
-    chart_df['is_increasing'] = chart_df['close'] >= chart_df['open']
+    chart_df['is_increasing'] = chart_df['close'].to_numpy() >= chart_df['open'].to_numpy()
     
-    # Base chart configuration
-    base = alt.Chart(chart_df).encode(
-        x=alt.X('timestamp:T', title='Time', axis=alt.Axis(format='%Y-%m-%d'))
-    )
+    # Thin long histories, keeping whole OHLCV rows at the points that shape the close
+    chart_df = _downsample(chart_df, 'close')
     
-    if chart_type == "candlestick":
-        # Create candlestick chart
-        # High-Low lines
-        high_low = base.mark_rule(
-            strokeWidth=1,
-            color='gray'
-        ).encode(
-            y=alt.Y('low:Q', title='Price'),
-            y2='high:Q'
-        )
-        
-        # Open-Close rectangles
-        body = base.mark_bar(
-            width=8
-        ).encode(
-            y=alt.Y('open:Q', title='Price'),
-            y2='close:Q',
-            color=alt.condition(
-                alt.datum.is_increasing,
-                alt.value('#26a69a'),  # Green for up
-                alt.value('#ef5350')   # Red for down
-            )
-        )
-        
-        price_chart = alt.layer(high_low, body).resolve_scale(color='independent')
-        
-    elif chart_type == "ohlc":
-        # Create OHLC chart
-        # High-Low lines
-        high_low = base.mark_rule(
-            strokeWidth=2
-        ).encode(
-            y=alt.Y('low:Q', title='Price'),
-            y2='high:Q',
-            color=alt.condition(
-                alt.datum.is_increasing,
-                alt.value('#26a69a'),
-                alt.value('#ef5350')
-            )
-        )
-        
-        # Open ticks
-        open_ticks = base.mark_tick(
-            orient='left',
-            thickness=2,
-            size=20
-        ).encode(
-            y='open:Q',
-            color=alt.condition(
-                alt.datum.is_increasing,
-                alt.value('#26a69a'),
-                alt.value('#ef5350')
-            )
-        )
-        
-        # Close ticks
-        close_ticks = base.mark_tick(
-            orient='right',
-            thickness=2,
-            size=20
-        ).encode(
-            y='close:Q',
-            color=alt.condition(
-                alt.datum.is_increasing,
-                alt.value('#26a69a'),
-                alt.value('#ef5350')
-            )
-        )
-        
-        price_chart = alt.layer(high_low, open_ticks, close_ticks).resolve_scale(color='independent')
-        
-    else:  # line chart
-        price_chart = base.mark_line(
-            strokeWidth=2,
-            color='#2196F3'
-        ).encode(
-            y=alt.Y('close:Q', title='Price')
-        )
-    
-    # Add volume subplot if requested
-    if show_volume and any(v > 0 for v in chart_df['volume']):
-        volume_chart = base.mark_bar(
-            width=8,
-            opacity=0.7
-        ).encode(
-            y=alt.Y('volume:Q', title='Volume'),
-            color=alt.condition(
-                alt.datum.is_increasing,
-                alt.value('#26a69a'),
-                alt.value('#ef5350')
-            )
-        )
-        
-        # Combine price and volume charts
-        combined = alt.vconcat(
-            price_chart.properties(height=400, title='Price'),
-            volume_chart.properties(height=150, title='Volume')
-        ).resolve_scale(
-            x='shared'
-        )
-        
-        return combined.configure(
-            background='#1e1e1e',
-            view=alt.ViewConfig(stroke=None),
-            axis=alt.AxisConfig(
-                domainColor='white',
-                gridColor='#333333',
-                labelColor='white',
-                titleColor='white'
-            ),
-            legend=alt.LegendConfig(
-                labelColor='white',
-                titleColor='white'
-            )
-        )
-    else:
-        return price_chart.configure(
-            background='#1e1e1e',
-            view=alt.ViewConfig(stroke=None),
-            axis=alt.AxisConfig(
-                domainColor='white',
-                gridColor='#333333',
-                labelColor='white',
-                titleColor='white'
-            ),
-            legend=alt.LegendConfig(
-                labelColor='white',
-                titleColor='white'
-            )
-        )
+    # float32 is plenty for plotted prices and serializes to shorter numbers
+    return chart_df.astype({col: np.float32 for col in ('open', 'high', 'low', 'close', 'volume')})
 
 
-def create_altair_plot(
-    df: pd.DataFrame, 
-    series_id: Optional[str] = None, 
+def _has_volume(chart_df: pd.DataFrame) -> bool:
+    """Whether any row of a financial frame has traded volume."""
+    volume = pd.to_numeric(chart_df['volume'], errors='coerce').to_numpy()
+    return bool((volume > 0).any())
+
+
+def _series_frames(
+    df: pd.DataFrame,
+    series_id: Optional[str] = None,
     metric: Optional[str] = None
-):
-    """Create Altair time-series plot."""
-    if not ALTAIR_AVAILABLE:
-        return None
-    
+) -> List[Tuple[str, pd.DataFrame, str, List[str]]]:
+    """
+    Prepare one frame per series for a time-series chart.
+
+    Returns:
+        (title, rows, y field, tooltip fields) for every series with data
+    """
     if df is None or len(df) == 0:
-        return None
+        return []
     
     # Filter by series if specified
     if series_id and 'series_id' in df.columns:
-        plot_df = df[df['series_id'] == series_id].copy()
+        plot_df = df[df['series_id'] == series_id]
     else:
-        plot_df = df.copy()
+        plot_df = df
     
-    # Ensure timestamp is datetime
+    # Ensure timestamp is datetime (assign returns a new frame, df is untouched)
     if 'timestamp' in plot_df.columns:
-        plot_df['timestamp'] = pd.to_datetime(plot_df['timestamp'])
+        plot_df = plot_df.assign(timestamp=pd.to_datetime(plot_df['timestamp']))
     else:
-        return None
+        return []
     
-    # Get unique series
+    # Categorical series ids group in one pass instead of one mask per series
     if 'series_id' in plot_df.columns:
-        unique_series = plot_df['series_id'].unique()
+        plot_df['series_id'] = plot_df['series_id'].astype('category')
     else:
-        unique_series = ['default']
         plot_df['series_id'] = 'default'
     
-    charts = []
+    frames = []
     
     # Plot data for each series
-    for sid in unique_series:
-        series_data = plot_df[plot_df['series_id'] == sid].copy()
-        
+    for sid, series_data in plot_df.groupby('series_id', observed=True, sort=False):
         if metric:
             # Plot specific metric
-            values = []
-            for idx, row in series_data.iterrows():
-                if 'measurements' in row and isinstance(row['measurements'], dict):
-                    values.append(row['measurements'].get(metric))
-                elif metric in row:
-                    values.append(row[metric])
-                else:
-                    values.append(None)
-            
-            series_data['value'] = values
+            series_data = series_data.assign(value=extract_metric_values(series_data, metric))
             series_data = series_data.dropna(subset=['value', 'timestamp'])
+            series_data = _downsample(series_data, 'value')
             
             if len(series_data) > 0:
-                chart = alt.Chart(series_data).mark_line(
-                    point=True,
-                    strokeWidth=2
-                ).encode(
-                    x=alt.X('timestamp:T', title='Time', axis=alt.Axis(format='%Y-%m-%d')),
-                    y=alt.Y('value:Q', title='Value'),
-                    color=alt.value('#2196F3'),
-                    tooltip=['timestamp:T', 'value:Q']
-                ).properties(
-                    title=f"{sid} - {metric}"
-                )
-                charts.append(chart)
+                frames.append((f"{sid} - {metric}", series_data, 'value', ['timestamp', 'value']))
         else:
             # Plot default metric
             default_metrics = ['close', 'value', 'temperature', 'price']
@@ -268,83 +141,412 @@ def create_altair_plot(
                     break
             
             if metric_to_plot:
-                chart = alt.Chart(series_data).mark_line(
-                    point=True,
-                    strokeWidth=2
-                ).encode(
-                    x=alt.X('timestamp:T', title='Time', axis=alt.Axis(format='%Y-%m-%d')),
-                    y=alt.Y(f'{metric_to_plot}:Q', title='Value'),
-                    color=alt.value('#2196F3'),
-                    tooltip=[f'{metric_to_plot}:Q']
-                ).properties(
-                    title=f"{sid} - {metric_to_plot}"
-                )
-                charts.append(chart)
+                series_data = _downsample(series_data, metric_to_plot)
+                frames.append((f"{sid} - {metric_to_plot}", series_data, metric_to_plot, [metric_to_plot]))
+    
+    return frames
+
+
+def _plot_frame(
+    df: pd.DataFrame,
+    series_id: Optional[str] = None,
+    metric: Optional[str] = None
+) -> Optional[Tuple[str, pd.DataFrame, str, List[str], bool]]:
+    """
+    Prepare the rows of a time-series chart, all series in one frame.
+
+    Several series share one chart with a colour per series_id rather than
+    one chart each, so the spec carries a single view and dataset.
+
+    Returns:
+        (title, rows, y field, tooltip fields, colour by series) or None
+    """
+    frames = _series_frames(df, series_id, metric)
+    if not frames:
+        return None
+    if len(frames) == 1:
+        title, series_data, y_field, tooltip = frames[0]
+        return title, series_data, y_field, tooltip, False
+    
+    _, _, y_field, tooltip = frames[0]
+    series_data = pd.concat([frame[1] for frame in frames], ignore_index=True)
+    return metric or y_field, series_data, y_field, ['series_id', *tooltip], True
+
+
+def _field_type(field: str) -> str:
+    """Vega-Lite type of a time-series chart field."""
+    if field == 'timestamp':
+        return 'temporal'
+    if field == 'series_id':
+        return 'nominal'
+    return 'quantitative'
+
+
+# Charts are built as plain Vega-Lite dicts. Constructing them through Altair's
+# schema classes validates every node, which dominates build time for these
+# fixed templates.
+
+# Dark theme shared by every spec, with Altair's default view size included
+VL_DARK_CONFIG = {
+    "view": {"continuousWidth": 300, "continuousHeight": 300, "stroke": None},
+    "axis": {
+        "domainColor": "white",
+        "gridColor": "#333333",
+        "labelColor": "white",
+        "titleColor": "white",
+    },
+    "background": "#1e1e1e",
+    "legend": {"labelColor": "white", "titleColor": "white"},
+    "title": {"color": "white"},
+}
+
+_VL_TIME_X = {"field": "timestamp", "type": "temporal", "title": "Time", "axis": {"format": "%Y-%m-%d"}}
+_VL_UP_DOWN_COLOR = {"condition": {"test": "datum.is_increasing", "value": "#26a69a"}, "value": "#ef5350"}
+
+
+def _vl_data(df: pd.DataFrame, columns: List[str]) -> Dict[str, Any]:
+    """
+    Inline the given columns column-wise, as data plus the transforms that expand it.
+
+    Vega-Lite only reads row objects, so the columns travel as one row of
+    arrays that a flatten transform turns back into rows. Field names are sent
+    once instead of once per row, and no per-row dicts are built here.
+    Timestamps are ISO strings (NaN/NaT become null) parsed after the flatten;
+    float columns stay NumPy arrays until _dumps_spec writes them.
+    """
+    row = {}
+    transform = [{"flatten": list(columns)}]
+    for col in columns:
+        values = df[col]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            tz = values.dt.tz
+            naive = values.dt.tz_convert('UTC').dt.tz_localize(None) if tz is not None else values
+            text = np.datetime_as_string(naive.to_numpy(dtype='datetime64[ms]'), unit='ms')
+            if tz is not None:
+                text = np.char.add(text, 'Z')
+            row[col] = np.where(values.isna().to_numpy(), None, text.astype(object)).tolist()
+            transform.append({"calculate": f"toDate(datum[{json.dumps(col)}])", "as": col})
+        elif pd.api.types.is_float_dtype(values):
+            # Left as an array for _dumps_spec: NaN is written as null and
+            # float32 in its shortest form
+            row[col] = np.ascontiguousarray(values.to_numpy())
+        else:
+            row[col] = values.astype(object).where(values.notna(), None).tolist()
+    # parse: null stops Vega-Lite from parsing the array-valued source fields
+    return {"data": {"values": [row], "format": {"parse": None}}, "transform": transform}
+
+
+def _vl_top_level(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Attach the schema and dark theme to a view spec."""
+    return {"$schema": alt.SCHEMA_URL, "config": VL_DARK_CONFIG, **spec}
+
+
+def create_altair_plot(
+    df: pd.DataFrame,
+    series_id: Optional[str] = None,
+    metric: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Create Altair time-series plot as a Vega-Lite dict."""
+    if not ALTAIR_AVAILABLE:
+        return None
     
-    if not charts:
+    frame = _plot_frame(df, series_id, metric)
+    if frame is None:
         return None
+    title, series_data, y_field, tooltip, by_series = frame
     
-    # Combine charts
-    if len(charts) == 1:
-        combined = charts[0]
+    if by_series:
+        color = {"field": "series_id", "type": "nominal", "legend": {"title": "Series"}}
     else:
-        combined = alt.vconcat(*charts)
+        color = {"value": "#2196F3"}
     
-    return combined.configure(
-        background='#1e1e1e',
-        view=alt.ViewConfig(stroke=None),
-        axis=alt.AxisConfig(
-            domainColor='white',
-            gridColor='#333333',
-            labelColor='white',
-            titleColor='white'
-        ),
-        legend=alt.LegendConfig(
-            labelColor='white',
-            titleColor='white'
-        ),
-        title=alt.TitleConfig(
-            color='white'
-        )
-    )
+    return _vl_top_level({
+        **_vl_data(series_data, list(dict.fromkeys(['timestamp', y_field, *tooltip]))),
+        "mark": {"type": "line", "point": True, "strokeWidth": 2},
+        "encoding": {
+            "x": _VL_TIME_X,
+            "y": {"field": y_field, "type": "quantitative", "title": "Value"},
+            "color": color,
+            "tooltip": [{"field": field, "type": _field_type(field)} for field in tooltip],
+        },
+        "title": title,
+    })
+
+
+def create_altair_financial_plot(
+    df: pd.DataFrame,
+    series_id: Optional[str] = None,
+    chart_type: str = "candlestick",
+    show_volume: bool = True
+) -> Optional[Dict[str, Any]]:
+    """Create Altair financial chart (candlestick or OHLC) with optional volume subplot, as a Vega-Lite dict."""
+    if not ALTAIR_AVAILABLE:
+        return None
+    
+    chart_df = _financial_frame(df, series_id)
+    if chart_df is None:
+        return None
+    
+    price_y = {"field": "low", "type": "quantitative", "title": "Price"}
+    if chart_type == "candlestick":
+        price = {
+            "layer": [
+                {
+                    "mark": {"type": "rule", "color": "gray", "strokeWidth": 1},
+                    "encoding": {"x": _VL_TIME_X, "y": price_y, "y2": {"field": "high"}},
+                },
+                {
+                    "mark": {"type": "bar", "width": 8},
+                    "encoding": {
+                        "x": _VL_TIME_X,
+                        "y": {"field": "open", "type": "quantitative", "title": "Price"},
+                        "y2": {"field": "close"},
+                        "color": _VL_UP_DOWN_COLOR,
+                    },
+                },
+            ],
+            "resolve": {"scale": {"color": "independent"}},
+        }
+    elif chart_type == "ohlc":
+        price = {
+            "layer": [
+                {
+                    "mark": {"type": "rule", "strokeWidth": 2},
+                    "encoding": {"x": _VL_TIME_X, "y": price_y, "y2": {"field": "high"}, "color": _VL_UP_DOWN_COLOR},
+                },
+                {
+                    "mark": {"type": "tick", "thickness": 2, "size": 20},
+                    "encoding": {"x": _VL_TIME_X, "y": {"field": "open", "type": "quantitative"}, "color": _VL_UP_DOWN_COLOR},
+                },
+                {
+                    "mark": {"type": "tick", "thickness": 2, "size": 20},
+                    "encoding": {"x": _VL_TIME_X, "y": {"field": "close", "type": "quantitative"}, "color": _VL_UP_DOWN_COLOR},
+                },
+            ],
+            "resolve": {"scale": {"color": "independent"}},
+        }
+    else:  # line chart
+        price = {
+            "mark": {"type": "line", "color": "#2196F3", "strokeWidth": 2},
+            "encoding": {"x": _VL_TIME_X, "y": {"field": "close", "type": "quantitative", "title": "Price"}},
+        }
+    
+    data = _vl_data(chart_df, list(chart_df.columns))
+    if show_volume and _has_volume(chart_df):
+        volume = {
+            "mark": {"type": "bar", "width": 8, "opacity": 0.7},
+            "encoding": {
+                "x": _VL_TIME_X,
+                "y": {"field": "volume", "type": "quantitative", "title": "Volume"},
+                "color": _VL_UP_DOWN_COLOR,
+            },
+            "height": 150,
+            "title": "Volume",
+        }
+        return _vl_top_level({
+            **data,
+            "vconcat": [{**price, "height": 400, "title": "Price"}, volume],
+            "resolve": {"scale": {"x": "shared"}},
+        })
+    return _vl_top_level({**data, **price})
 
 
 def altair_chart_to_dict(chart) -> Dict[str, Any]:
-    """Convert Altair chart to dictionary for JSON serialization."""
+    """Convert Altair chart (or an already built Vega-Lite dict) to dictionary for JSON serialization."""
     if not ALTAIR_AVAILABLE or chart is None:
         return {}
+    if isinstance(chart, dict):
+        return chart
     
     try:
-        # Convert chart to dictionary
-        chart_dict = chart.to_dict()
+        # Convert chart to dictionary; with VegaFusion only the pre-transformed
+        # Vega spec can be produced
+        chart_dict = chart.to_dict(format="vega") if VEGAFUSION_AVAILABLE else chart.to_dict()
         return chart_dict
     except Exception as e:
         logger.error(f"Error converting Altair chart to dict: {e}")
         return {}
 
 
+def _json_default(obj):
+    """Make NumPy values from _vl_data JSON-serializable for the stdlib encoder."""
+    if isinstance(obj, np.ndarray):
+        values = obj.astype(object)
+        if obj.dtype.kind == 'f':
+            values[np.isnan(obj)] = None
+        return values.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_spec(spec: Dict[str, Any]) -> bytes:
+    """Serialize a Vega-Lite spec, with orjson when available."""
+    try:
+        import orjson
+        # NumPy scalars and arrays are written directly; NaN becomes null
+        return orjson.dumps(spec, option=orjson.OPT_SERIALIZE_NUMPY)
+    except ImportError:
+        pass
+    except TypeError as e:
+        # e.g. non-string dict keys, which json coerces
+        logger.debug(f"[_dumps_spec] orjson could not serialize spec, using json: {e}")
+    return json.dumps(spec, default=_json_default).encode()
+
+
+class _ServedSpec(NamedTuple):
+    """A serialized spec as the /chart route sends it."""
+    data: bytes
+    gzip: bytes
+    br: Optional[bytes]
+
+
+# Serialized specs behind /chart/{chart_id}, least recently used first
+CHART_CACHE_SIZE = 64
+_served_specs: "OrderedDict[str, _ServedSpec]" = OrderedDict()
+
+# Chart ids per spec dict (kept alongside it so a reused id() cannot match a
+# different spec), least recently used first. Re-rendering a memoized spec
+# then skips serialization while its id is still served.
+_spec_ids: "OrderedDict[int, Tuple[Dict[str, Any], str]]" = OrderedDict()
+
+# Guards _served_specs, _spec_ids and _spec_cache: charts are built in
+# run.io_bound workers and /chart is served from the threadpool. Held only for
+# the lookup, insert and eviction, not while building or serializing.
+_cache_lock = Lock()
+
+# Loads vega/vega-lite/vega-embed once per page, then embeds the spec by URL
+_EMBED_SCRIPT = """<script>
+(function() {{
+  var libs = {libs};
+  function embed() {{ vegaEmbed('#vis-{chart_id}', '/chart/{chart_id}', {embed_options}); }}
+  function load(i) {{
+    if (i === libs.length) {{ embed(); return; }}
+    var s = document.createElement('script');
+    s.src = libs[i];
+    s.onload = function() {{ load(i + 1); }};
+    document.head.appendChild(s);
+  }}
+  if (window.vegaEmbed) {{ embed(); }} else {{ load(0); }}
+}})();
+</script>"""
+
+
+def _serve_spec(spec: Dict[str, Any]) -> str:
+    """
+    Make a spec available at /chart/<id> and return its content-hash id.
+
+    Every render goes through here, so a spec evicted from the route's cache
+    is registered again before the browser asks for it.
+    """
+    with _cache_lock:
+        known = _spec_ids.get(id(spec))
+        if known is not None and known[0] is spec and known[1] in _served_specs:
+            chart_id = known[1]
+            _spec_ids.move_to_end(id(spec))
+            _served_specs.move_to_end(chart_id)
+            return chart_id
+
+    data = _dumps_spec(spec)
+    chart_id = hashlib.blake2b(data, digest_size=8).hexdigest()
+    with _cache_lock:
+        registered = chart_id in _served_specs
+    # Compress outside the lock; the rare id evicted meanwhile is compressed under it
+    served = None if registered else _ServedSpec(data, *precompress(data))
+
+    with _cache_lock:
+        if chart_id in _served_specs:
+            _served_specs.move_to_end(chart_id)
+        else:
+            _served_specs[chart_id] = served or _ServedSpec(data, *precompress(data))
+            while len(_served_specs) > CHART_CACHE_SIZE:
+                _served_specs.popitem(last=False)
+        _spec_ids[id(spec)] = (spec, chart_id)
+        _spec_ids.move_to_end(id(spec))
+        while len(_spec_ids) > CHART_CACHE_SIZE:
+            _spec_ids.popitem(last=False)
+    return chart_id
+
+
+@app.get("/chart/{chart_id}", include_in_schema=False)
+def chart_spec(chart_id: str, request: Request):
+    """Serve a spec registered by altair_chart_to_html."""
+    with _cache_lock:
+        served = _served_specs.get(chart_id)
+    if served is None:
+        return Response(status_code=404)
+    headers = {"Cache-Control": "public, max-age=60"}
+    return encoded_response(request, served.data, served.gzip, served.br, "application/json", headers)
+
+
 def altair_chart_to_html(chart) -> str:
-    """Convert Altair chart to HTML string."""
+    """
+    Convert Altair chart (or a Vega-Lite dict) to an HTML snippet.
+
+    The snippet holds only a container and a vega-embed call; the spec itself
+    is fetched (compressed) from /chart/<id>.
+    """
     if not ALTAIR_AVAILABLE or chart is None:
         return "<div>Chart not available</div>"
     
     try:
-        html = chart.to_html()
-        return html
+        mode = "vega-lite"
+        if isinstance(chart, dict):
+            spec = chart
+        elif VEGAFUSION_AVAILABLE:
+            # Transforms run server-side; the browser gets their results as a Vega spec
+            spec = chart.to_dict(format="vega")
+            mode = "vega"
+        else:
+            spec = chart.to_dict()
+        chart_id = _serve_spec(spec)
+        base_url = "https://cdn.jsdelivr.net/npm"
+        libs = [
+            f"{base_url}/vega@{alt.VEGA_VERSION}",
+            f"{base_url}/vega-lite@{alt.VEGALITE_VERSION}",
+            f"{base_url}/vega-embed@{alt.VEGAEMBED_VERSION}",
+        ]
+        script = _EMBED_SCRIPT.format(
+            libs=json.dumps(libs),
+            chart_id=chart_id,
+            embed_options=json.dumps({"mode": mode}),
+        )
+        return f'<div id="vis-{chart_id}" style="width: 100%;"></div>\n{script}'
     except Exception as e:
         logger.error(f"Error converting Altair chart to HTML: {e}")
         return f"<div>Error rendering chart: {str(e)}</div>"
 
 
+# Vega-Lite dicts from create_altair_plot_wrapper per (frame, selection), least
+# recently used first. Entries keep their frame so a reused id() cannot match a
+# different one; callers pass the same frame object while the data is unchanged.
+SPEC_CACHE_SIZE = 64
+_spec_cache: "OrderedDict[tuple, Tuple[pd.DataFrame, Dict[str, Any]]]" = OrderedDict()
+
+
 def create_altair_plot_wrapper(
     df: pd.DataFrame, 
     series_id: Optional[str] = None, 
     metric: Optional[str] = None, 
     chart_type: str = "auto"
 ):
-    """Wrapper function to create Altair plot, with financial chart support."""
+    """
+    Wrapper function to create Altair plot, with financial chart support.
+
+    Returns a Vega-Lite dict; render it with altair_chart_to_html.
+    """
     if df is None or len(df) == 0:
         return None
+    if not ALTAIR_AVAILABLE:
+        return None
+    
+    # Refreshes usually re-plot the same data and selection
+    cache_key = (id(df), series_id, metric, chart_type)
+    with _cache_lock:
+        cached = _spec_cache.get(cache_key)
+        if cached is not None and cached[0] is df:
+            _spec_cache.move_to_end(cache_key)
+            return cached[1]
     
     # Check if this is financial data
     is_financial = is_financial_data(df, series_id)
@@ -352,7 +554,15 @@ def create_altair_plot_wrapper(
     # Determine chart type
     if is_financial and (chart_type == "auto" or chart_type in ["candlestick", "ohlc"]):
         actual_chart_type = chart_type if chart_type != "auto" else "candlestick"
-        return create_altair_financial_plot(df, series_id, actual_chart_type, show_volume=True)
+        spec = create_altair_financial_plot(df, series_id, actual_chart_type, show_volume=True)
+    else:
+        # Otherwise, use standard time-series plot
+        spec = create_altair_plot(df, series_id, metric)
     
-    # Otherwise, use standard time-series plot
-    return create_altair_plot(df, series_id, metric)
+    if spec is not None:
+        with _cache_lock:
+            _spec_cache[cache_key] = (df, spec)
+            _spec_cache.move_to_end(cache_key)
+            while len(_spec_cache) > SPEC_CACHE_SIZE:
+                _spec_cache.popitem(last=False)
+    return spec
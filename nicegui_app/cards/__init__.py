@@ -1,19 +1,38 @@
 """
 Card Components Module
 Each card is an independent, resizable, floatable window.
+
+Card modules are imported on first access to their factory (PEP 562), so a
+page only loads the cards (and chart libraries) it actually creates.
 """
-from .live_sync_metrics import create_live_sync_metrics_card
-from .upload import create_upload_card
-from .storage import create_storage_card
-from .dialog_cards import (
-    create_user_info_card,
-    create_api_keys_card,
-    create_search_card,
-    create_payment_card,
-    create_settings_card,
-    create_download_card,
-    create_conversion_card,
-)
+import importlib
+
+_CARD_FACTORIES = {
+    'create_live_sync_metrics_card': '.live_sync_metrics',
+    'create_upload_card': '.upload',
+    'create_storage_card': '.storage',
+    'create_user_info_card': '.dialog_cards',
+    'create_api_keys_card': '.dialog_cards',
+    'create_search_card': '.dialog_cards',
+    'create_payment_card': '.dialog_cards',
+    'create_settings_card': '.dialog_cards',
+    'create_download_card': '.dialog_cards',
+    'create_conversion_card': '.dialog_cards',
+}
+
+
+def __getattr__(name):
+    module_name = _CARD_FACTORIES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    factory = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = factory
+    return factory
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_CARD_FACTORIES))
+
 
 __all__ = [
     'create_live_sync_metrics_card',
@@ -2,9 +2,24 @@
 Live Sync Metrics Card
 Independent resizable window for time-series visualization.
 """
-from nicegui import ui
+import base64
+import hashlib
+import importlib.util
+import logging
+import os
+import re
+import stat
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from fastapi.responses import Response
+from nicegui import app, run, ui
 import plotly.graph_objects as go
 from logger import get_logger
+from nicegui_app import MATPLOTLIB_AVAILABLE
 from nicegui_app.state import get_state
 from nicegui_app.visualization import (
     load_timeseries_data,
@@ -15,67 +30,371 @@ from nicegui_app.visualization import (
     get_available_metrics,
     create_matplotlib_financial_plot,
     create_matplotlib_plot,
-    matplotlib_figure_to_base64,
+    matplotlib_figure_to_png,
     create_plot,
+    downsample_for_plot,
+    PLOT_MAX_POINTS,
 )
 
 logger = get_logger()
 
-# Import availability flags
-try:
-    from nicegui_app import (
-        MATPLOTLIB_AVAILABLE,
-        ALTAIR_AVAILABLE,
-        HIGHCHARTS_AVAILABLE,
-        ECHARTS_AVAILABLE,
-    )
+# Chart libraries drawn through nicegui_app wrappers: the packages that make
+# them available, then the availability flag, wrapper and HTML renderer names.
+# The wrapper modules import their library, so they are loaded on first use.
+_CHART_BACKENDS = {
+    "altair": (("altair",), "ALTAIR_AVAILABLE", "create_altair_plot_wrapper", "altair_chart_to_html"),
+    "highcharts": (("highcharts_core",), "HIGHCHARTS_AVAILABLE", "create_highcharts_plot_wrapper", "highcharts_config_to_html"),
+    "echarts": (("pyecharts", "echarts"), "ECHARTS_AVAILABLE", "create_echarts_plot_wrapper", "echarts_config_to_html"),
+}
+_loaded_backends: Dict[str, Tuple[Optional[Callable], Optional[Callable]]] = {}
+
+
+def _chart_library_installed(library: str) -> bool:
+    """Check whether a chart library's package is installed, without importing it."""
+    packages = _CHART_BACKENDS[library][0]
     try:
-        from nicegui_app import create_altair_plot_wrapper, altair_chart_to_html
-    except (ImportError, AttributeError):
-        create_altair_plot_wrapper = None
-        altair_chart_to_html = None
-    
+        return any(importlib.util.find_spec(package) is not None for package in packages)
+    except (ImportError, ValueError):
+        return False
+
+
+def _chart_backend(library: str) -> Tuple[Optional[Callable], Optional[Callable]]:
+    """
+    Import a chart library's wrapper functions on first use.
+
+    Returns:
+        (plot wrapper, HTML renderer), or (None, None) if the library is unavailable
+    """
+    backend = _loaded_backends.get(library)
+    if backend is None:
+        backend = (None, None)
+        if library in _CHART_BACKENDS:
+            _, flag, wrapper, to_html = _CHART_BACKENDS[library]
+            import nicegui_app
+            try:
+                if getattr(nicegui_app, flag):
+                    backend = (getattr(nicegui_app, wrapper), getattr(nicegui_app, to_html))
+            except AttributeError as e:
+                logger.warning(f"[_chart_backend] {library} wrappers unavailable: {e}")
+        _loaded_backends[library] = backend
+    return backend
+
+
+# Selection changes within this window trigger a single plot update
+PLOT_DEBOUNCE_SECONDS = 0.2
+
+# Inline or external <script> blocks in chart HTML
+_SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL | re.IGNORECASE)
+
+
+# Loaded (df, records) per data source, least recently used first. Keys carry
+# the file's mtime/size or the storage save counter, so changed data misses;
+# refresh_plot clears it for changes those cannot see (e.g. deletes).
+# Plot builders copy before modifying, so the cached frames are shared.
+DATA_CACHE_SIZE = 4
+_data_cache: "OrderedDict[tuple, Tuple[Optional[pd.DataFrame], List[dict]]]" = OrderedDict()
+
+# Guards the shared caches filled from run.io_bound workers. Held only for the
+# lookup, insert and eviction; loads and chart builds run outside it.
+_cache_lock = Lock()
+
+
+def _load_plot_data(source: str, path: Optional[str] = None) -> Tuple[Optional[pd.DataFrame], List[dict]]:
+    """
+    Load the data to plot, reusing the last load while the source is unchanged.
+
+    Args:
+        source: "storage", "storage_file" or "file"
+        path: Storage key or file path for the file sources
+
+    Returns:
+        Tuple of (DataFrame, raw_records) as returned by the loaders
+    """
+    if source == "file":
+        try:
+            file_stat = os.stat(path)
+            cache_key = (source, path, file_stat.st_mtime_ns, file_stat.st_size)
+        except OSError:
+            return load_timeseries_from_file(path)
+    else:
+        from nicegui_app import get_app_instance
+        storage = get_app_instance().storage
+        seq = storage.current_seq() if storage is not None else 0
+        cache_key = (source, path, id(storage), seq)
+
+    with _cache_lock:
+        cached = _data_cache.get(cache_key)
+        if cached is not None:
+            _data_cache.move_to_end(cache_key)
+    if cached is not None:
+        logger.debug(f"[_load_plot_data] Cache hit for: {source} {path or ''}")
+        return cached
+
+    if source == "file":
+        result = load_timeseries_from_file(path)
+    elif source == "storage_file":
+        result = load_timeseries_from_storage_file(path)
+    else:
+        result = load_timeseries_data()
+
+    # Failed loads are retried next time
+    if result[0] is not None:
+        with _cache_lock:
+            _data_cache[cache_key] = result
+            _data_cache.move_to_end(cache_key)
+            while len(_data_cache) > DATA_CACHE_SIZE:
+                _data_cache.popitem(last=False)
+    return result
+
+
+def _zoom_window(
+    df: pd.DataFrame,
+    timestamps: pd.Series,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    series_id: Optional[str],
+    metric: Optional[str],
+    is_financial: bool
+) -> pd.DataFrame:
+    """
+    Rows of df between start and end, downsampled for plotting.
+
+    Args:
+        df: Full (unthinned) frame
+        timestamps: df["timestamp"] parsed to datetimes
+        start: First timestamp to keep
+        end: Last timestamp to keep
+        series_id: Selected series, if any
+        metric: Selected metric, if any
+        is_financial: Whether df holds OHLCV data
+
+    Returns:
+        The zoomed rows, thinned like the overview plot
+    """
+    window = df[(timestamps >= start) & (timestamps <= end)]
+    return downsample_for_plot(window, series_id, metric, is_financial)
+
+
+# Served Matplotlib image ids per (frame, selection), least recently used first.
+# Entries keep their frame so a reused id() cannot match a different one.
+MPL_IMAGE_CACHE_SIZE = 8
+_mpl_image_cache: "OrderedDict[tuple, Tuple[pd.DataFrame, str]]" = OrderedDict()
+
+# PNG bytes behind /plot-image/{image_id}.png, least recently used first.
+# Holds more than the image cache so cached ids are normally still served.
+SERVED_IMAGE_CACHE_SIZE = 2 * MPL_IMAGE_CACHE_SIZE
+_served_images: "OrderedDict[str, bytes]" = OrderedDict()
+
+
+def _serve_image(png: bytes) -> str:
+    """Keep PNG bytes in memory under their content hash and return the hash."""
+    image_id = hashlib.blake2b(png, digest_size=8).hexdigest()
+    if image_id in _served_images:
+        _served_images.move_to_end(image_id)
+    else:
+        _served_images[image_id] = png
+        while len(_served_images) > SERVED_IMAGE_CACHE_SIZE:
+            _served_images.popitem(last=False)
+    return image_id
+
+
+@app.get("/plot-image/{image_id}.png", include_in_schema=False)
+def served_plot_image(image_id: str):
+    """Serve a Matplotlib image rendered by the metrics card."""
+    png = _served_images.get(image_id)
+    if png is None:
+        return Response(status_code=404)
+    # The URL is a content hash, so the bytes behind it never change
+    return Response(png, media_type="image/png", headers={"Cache-Control": "public, max-age=31536000, immutable"})
+
+
+def _matplotlib_image(
+    df: pd.DataFrame,
+    series_id: Optional[str],
+    metric: Optional[str],
+    chart_type: str,
+    is_financial: bool
+) -> Optional[str]:
+    """
+    Render df with Matplotlib as a served PNG, reusing the image for repeated selections.
+
+    Returns:
+        Image URL, or None if no figure could be created
+    """
+    cache_key = (id(df), series_id, metric, chart_type, is_financial)
+    cached = _mpl_image_cache.get(cache_key)
+    if cached is not None and cached[0] is df and cached[1] in _served_images:
+        _mpl_image_cache.move_to_end(cache_key)
+        _served_images.move_to_end(cached[1])
+        logger.debug("[_matplotlib_image] Reusing rendered image")
+        return f"/plot-image/{cached[1]}.png"
+
+    if is_financial:
+        logger.debug(f"[_matplotlib_image] Creating Matplotlib financial plot, chart_type: {chart_type}")
+        mpl_fig = create_matplotlib_financial_plot(df, series_id, chart_type, show_volume=True)
+    else:
+        logger.debug(f"[_matplotlib_image] Creating Matplotlib plot, metric: {metric}")
+        mpl_fig = create_matplotlib_plot(df, series_id, metric)
+    if not mpl_fig:
+        return None
+
+    image_id = _serve_image(matplotlib_figure_to_png(mpl_fig))
+    _mpl_image_cache[cache_key] = (df, image_id)
+    _mpl_image_cache.move_to_end(cache_key)
+    if len(_mpl_image_cache) > MPL_IMAGE_CACHE_SIZE:
+        _mpl_image_cache.popitem(last=False)
+    return f"/plot-image/{image_id}.png"
+
+
+# Chart library HTML snippets per (library, frame, selection), least recently
+# used first. Entries keep their frame like the Matplotlib image cache. Filled
+# from run.io_bound workers, so it is only touched under _cache_lock.
+HTML_CACHE_SIZE = 16
+_html_cache: "OrderedDict[tuple, Tuple[pd.DataFrame, str]]" = OrderedDict()
+
+
+def _chart_html(
+    library: str,
+    df: pd.DataFrame,
+    series_id: Optional[str],
+    metric: Optional[str],
+    chart_type: str
+) -> Optional[str]:
+    """
+    Build the HTML snippet for an Altair, Highcharts or ECharts chart, reusing it for repeated selections.
+
+    Returns:
+        HTML with its scripts, or None if the library produced no chart
+    """
+    # Altair HTML only references a spec served from /chart/<id>; rebuilding it
+    # (from the wrapper's memoized spec) re-registers a spec that was evicted
+    cacheable = library != "altair"
+    cache_key = (library, id(df), series_id, metric, chart_type)
+    cached = None
+    if cacheable:
+        with _cache_lock:
+            cached = _html_cache.get(cache_key)
+            if cached is not None and cached[0] is df:
+                _html_cache.move_to_end(cache_key)
+    if cached is not None and cached[0] is df:
+        logger.debug(f"[_chart_html] Reusing {library} HTML")
+        return cached[1]
+
+    create_wrapper, to_html = _chart_backend(library)
+    chart = create_wrapper(df, series_id, metric, chart_type)
+    if not chart:
+        return None
+    if library == "altair":
+        html_content = to_html(chart)
+    else:
+        html_content = to_html(chart, container_id=f"{library}-dashboard")
+
+    if cacheable:
+        with _cache_lock:
+            _html_cache[cache_key] = (df, html_content)
+            _html_cache.move_to_end(cache_key)
+            while len(_html_cache) > HTML_CACHE_SIZE:
+                _html_cache.popitem(last=False)
+    return html_content
+
+
+def _figure_hash(fig_json: dict) -> str:
+    """Fingerprint a Plotly figure's to_plotly_json() dict, as it is sent to the browser."""
     try:
-        from nicegui_app import create_highcharts_plot_wrapper, highcharts_config_to_html
-    except (ImportError, AttributeError):
-        create_highcharts_plot_wrapper = None
-        highcharts_config_to_html = None
-    
+        import orjson
+        payload = orjson.dumps(fig_json, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    except (ImportError, TypeError):
+        from plotly.io.json import to_json_plotly
+        payload = to_json_plotly(fig_json).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _build_plotly_figure(
+    df: pd.DataFrame,
+    series_id: Optional[str],
+    metric: Optional[str],
+    chart_type: str
+) -> Optional[Tuple[go.Figure, dict, str]]:
+    """
+    Build a Plotly figure with its to_plotly_json() dict and fingerprint.
+
+    Returns:
+        (figure, figure dict, hash), or None if no figure could be created
+    """
+    fig = create_plot(df, series_id, metric, chart_type)
+    if fig is None:
+        return None
+    fig_json = fig.to_plotly_json()
+    return fig, fig_json, _figure_hash(fig_json)
+
+
+# Trace attributes that Plotly.extendTraces can append to
+_EXTENDABLE_KEYS = ("x", "y", "open", "high", "low", "close")
+
+
+def _trace_values(value) -> Optional[list]:
+    """A trace data array as a list (Plotly sends numeric arrays as base64 typed arrays)."""
+    if isinstance(value, dict) and "bdata" in value and "shape" not in value:
+        return np.frombuffer(base64.b64decode(value["bdata"]), dtype=value["dtype"]).tolist()
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return list(value)
+    return None
+
+
+def _appended_points(old_json: Optional[dict], new_json: dict) -> Optional[List[Tuple[dict, List[int]]]]:
+    """
+    Work out whether a new figure only appends points to the traces of the old one.
+
+    Args:
+        old_json: Figure dict currently shown, if any
+        new_json: Figure dict about to be shown
+
+    Returns:
+        (update, [trace index]) arguments for Plotly.extendTraces per trace that
+        grew, or None if anything else changed and the figure must be resent
+    """
+    if not isinstance(old_json, dict) or old_json.get("layout") != new_json.get("layout"):
+        return None
+    old_traces, new_traces = old_json.get("data", []), new_json.get("data", [])
+    if len(old_traces) != len(new_traces):
+        return None
+
+    extensions = []
     try:
-        from nicegui_app import create_echarts_plot_wrapper, echarts_config_to_html
-    except (ImportError, AttributeError):
-        create_echarts_plot_wrapper = None
-        echarts_config_to_html = None
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    ALTAIR_AVAILABLE = False
-    HIGHCHARTS_AVAILABLE = False
-    ECHARTS_AVAILABLE = False
-    create_altair_plot_wrapper = None
-    altair_chart_to_html = None
-    create_highcharts_plot_wrapper = None
-    highcharts_config_to_html = None
-    create_echarts_plot_wrapper = None
-    echarts_config_to_html = None
-
-# Helper function to render HTML with scripts
-def render_html_with_scripts(html_content: str, container_id: str = None):
-    """Render HTML content that may contain script tags."""
-    import re
-    script_pattern = r'<script[^>]*>.*?</script>'
-    
-    scripts = re.findall(script_pattern, html_content, re.DOTALL | re.IGNORECASE)
-    html_without_scripts = re.sub(script_pattern, '', html_content, flags=re.DOTALL | re.IGNORECASE).strip()
-    
-    if not scripts:
-        return ui.html(html_without_scripts, sanitize=False)
-    
-    container = ui.html(html_without_scripts, sanitize=False).classes("w-full").style("height: 600px;")
-    
-    for script in scripts:
-        ui.add_body_html(script)
-    
-    return container
+        for index, (old_trace, new_trace) in enumerate(zip(old_traces, new_traces)):
+            if old_trace.keys() != new_trace.keys():
+                return None
+            if any(old_trace[key] != new_trace[key] for key in new_trace if key not in _EXTENDABLE_KEYS):
+                return None
+            update, appended = {}, set()
+            for key in _EXTENDABLE_KEYS:
+                if key not in new_trace:
+                    continue
+                old_values, new_values = _trace_values(old_trace[key]), _trace_values(new_trace[key])
+                if old_values is None or new_values is None or new_values[:len(old_values)] != old_values:
+                    return None
+                update[key] = [new_values[len(old_values):]]
+                appended.add(len(new_values) - len(old_values))
+            if len(appended) > 1:
+                return None
+            if appended and appended.pop() > 0:
+                extensions.append((update, [index]))
+    except ValueError:
+        # Array-valued styling (e.g. per-point colours) cannot be compared this way
+        return None
+    return extensions
+
+
+# Chart library snippets carry their own script tags
+def _split_scripts(html_content: str) -> Tuple[str, List[str]]:
+    """Separate script tags from markup in one pass, returning (markup, scripts)."""
+    parts, scripts, last = [], [], 0
+    for match in _SCRIPT_RE.finditer(html_content):
+        parts.append(html_content[last:match.start()])
+        scripts.append(match.group(0))
+        last = match.end()
+    parts.append(html_content[last:])
+    return ''.join(parts).strip(), scripts
 
 
 def create_live_sync_metrics_card(panels_grid):
@@ -127,7 +446,7 @@ def create_live_sync_metrics_card(panels_grid):
                         from nicegui_app import get_app_instance
                         app = get_app_instance()
                         if app and app.storage:
-                            keys = app.storage.list_keys()[:100]
+                            keys = app.storage.list_keys(limit=100)
                             storage_file_select.options = keys if keys else []
                             if keys and not storage_file_select.value:
                                 storage_file_select.value = keys[0]
@@ -168,12 +487,9 @@ def create_live_sync_metrics_card(panels_grid):
                 chart_library_options = ["plotly"]
                 if MATPLOTLIB_AVAILABLE:
                     chart_library_options.append("matplotlib")
-                if ALTAIR_AVAILABLE:
-                    chart_library_options.append("altair")
-                if HIGHCHARTS_AVAILABLE:
-                    chart_library_options.append("highcharts")
-                if ECHARTS_AVAILABLE:
-                    chart_library_options.append("echarts")
+                chart_library_options.extend(
+                    library for library in _CHART_BACKENDS if _chart_library_installed(library)
+                )
                 
                 chart_library_select = ui.select(
                     options=chart_library_options,
@@ -188,8 +504,12 @@ def create_live_sync_metrics_card(panels_grid):
                     except Exception as e:
                         logger.warning(f"Error updating select options: {e}")
                 
-                ui.timer(0.2, update_select_options, once=True)
-                ui.timer(1.0, update_select_options, once=True)
+                # Push the options once the browser is connected and the select is mounted
+                client = ui.context.client
+                if hasattr(client, "on_connect"):
+                    client.on_connect(update_select_options)
+                else:
+                    ui.timer(0.2, update_select_options, once=True)
                 
                 # Series selector
                 series_select = ui.select(
@@ -213,6 +533,9 @@ def create_live_sync_metrics_card(panels_grid):
                     value="auto"
                 ).classes("w-40")
                 chart_type_select.visible = False
+
+                plot_spinner = ui.spinner(size="lg")
+                plot_spinner.visible = False
             
             # Store UI components in shared state
             state.set_component("dashboard.chart_library_select", chart_library_select)
@@ -234,26 +557,63 @@ def create_live_sync_metrics_card(panels_grid):
                 margin=dict(l=40, r=20, t=20, b=40)
             )
             plot_container = ui.plotly(plot_figure).classes("w-full").style("min-height: 350px; height: auto;")
-            plot_image = None
+            # One element per kind of output, created once and shown or hidden on
+            # library switches, so switching back does not re-initialise a chart
+            plot_image = ui.image().classes("w-full").style("max-height: 600px; object-fit: contain;")
+            plot_image.visible = False
+            plot_html = ui.html("", sanitize=False).classes("w-full").style("height: 600px;")
+            plot_html.visible = False
             
             state.set_component("dashboard.plot_container", plot_container)
+            state.set_component("dashboard.plot_html", plot_html)
             state.set_state("dashboard.plot_figure", plot_figure)
             state.set_state("dashboard.plot_image", plot_image)
             
-            def update_plot():
+            # Selector options for the last plotted frame. _load_plot_data returns
+            # the same DataFrame while the source is unchanged, so options are
+            # recomputed only when a different frame comes back.
+            plot_options = {"df": None, "series": None, "metrics": {}, "financial": {}, "thinned": {}, "timestamps": None}
+
+            def options_for(df):
+                """Get the option cache for df, resetting it for a new frame."""
+                if plot_options["df"] is not df:
+                    plot_options.update(df=df, series=None, metrics={}, financial={}, thinned={}, timestamps=None)
+                return plot_options
+
+            # Last (df, is_financial, chart_type) prepared by update_plot, so a
+            # chart library switch re-renders without reloading data
+            last_plot_prep = None
+
+            # Loading and chart building run in worker threads; each update and
+            # render takes a number so a slower, older one cannot overwrite a newer
+            plot_generation = 0
+            render_generation = 0
+
+            async def update_plot():
                 """Update the plot with current data and selections."""
+                nonlocal plot_generation
+                plot_generation += 1
+                generation = plot_generation
+                plot_spinner.visible = True
+                try:
+                    await prepare_plot(generation)
+                finally:
+                    if generation == plot_generation:
+                        plot_spinner.visible = False
+
+            async def prepare_plot(generation: int):
+                """Load data, refresh the selectors and render (body of update_plot)."""
+                nonlocal last_plot_prep
                 logger.debug("[update_plot] Starting plot update")
 
-                chart_library_select = state.get_component("dashboard.chart_library_select")
-                series_select = state.get_component("dashboard.series_select")
-                metric_select = state.get_component("dashboard.metric_select")
-                chart_type_select = state.get_component("dashboard.chart_type_select")
-                plot_container = state.get_component("dashboard.plot_container")
-                plot_figure = state.get_state("dashboard.plot_figure")
-                plot_image = state.get_state("dashboard.plot_image")
-                data_source = state.get_component("dashboard.data_source_select")
-                file_path_input = state.get_component("dashboard.file_path_input")
-                loaded_file_path = state.get_state("dashboard.loaded_file_path")
+                dashboard = state.snapshot("dashboard")
+                chart_library_select = dashboard.chart_library_select
+                series_select = dashboard.series_select
+                metric_select = dashboard.metric_select
+                chart_type_select = dashboard.chart_type_select
+                data_source = dashboard.data_source_select
+                loaded_file_path = dashboard.loaded_file_path
+                storage_file_select = dashboard.storage_file_select
 
                 # Log component states
                 logger.debug(f"[update_plot] Data source: {data_source.value if data_source else 'N/A'}")
@@ -264,26 +624,25 @@ def create_live_sync_metrics_card(panels_grid):
                     # Load data based on selected source
                     df = None
                     records = []
-                    storage_file_select = state.get_component("dashboard.storage_file_select")
                     selected_storage_file = storage_file_select.value if storage_file_select else None
 
                     if data_source and data_source.value == "storage_file" and selected_storage_file:
                         logger.info(f"[update_plot] Loading from storage file: {selected_storage_file}")
-                        df, records = load_timeseries_from_storage_file(selected_storage_file)
+                        df, records = await run.io_bound(_load_plot_data, "storage_file", selected_storage_file)
                         if df is not None:
                             logger.info(f"[update_plot] Loaded {len(df)} records from storage file: {selected_storage_file}")
                         else:
                             logger.warning(f"[update_plot] Failed to load data from storage file: {selected_storage_file}")
                     elif data_source and data_source.value == "file" and loaded_file_path:
                         logger.info(f"[update_plot] Loading from file: {loaded_file_path}")
-                        df, records = load_timeseries_from_file(loaded_file_path)
+                        df, records = await run.io_bound(_load_plot_data, "file", loaded_file_path)
                         if df is not None:
                             logger.info(f"[update_plot] Loaded {len(df)} records from file: {loaded_file_path}")
                         else:
                             logger.warning(f"[update_plot] Failed to load data from file: {loaded_file_path}")
                     else:
                         logger.debug("[update_plot] Loading from storage")
-                        df, records = load_timeseries_data()
+                        df, records = await run.io_bound(_load_plot_data, "storage")
                         if df is not None:
                             logger.info(f"[update_plot] Loaded {len(df)} records from storage")
                         else:
@@ -291,20 +650,29 @@ def create_live_sync_metrics_card(panels_grid):
 
                     # Log DataFrame info
                     if df is not None:
-                        logger.debug(f"[update_plot] DataFrame shape: {df.shape}")
-                        logger.debug(f"[update_plot] DataFrame columns: {list(df.columns)}")
-                        numeric_cols = list(df.select_dtypes(include=['number']).columns)
-                        logger.debug(f"[update_plot] Numeric columns: {numeric_cols}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"[update_plot] DataFrame shape: {df.shape}")
+                            logger.debug(f"[update_plot] DataFrame columns: {list(df.columns)}")
+                            numeric_cols = list(df.select_dtypes(include=['number']).columns)
+                            logger.debug(f"[update_plot] Numeric columns: {numeric_cols}")
                     else:
                         logger.warning("[update_plot] DataFrame is None - no data to plot")
 
-                    chart_library = chart_library_select.value if chart_library_select else "plotly"
-                    is_financial = is_financial_data(df, series_select.value) if df is not None else False
+                    if generation != plot_generation:
+                        return
+                    options = options_for(df)
+                    is_financial = options["financial"].get(series_select.value)
+                    if is_financial is None:
+                        is_financial = is_financial_data(df, series_select.value) if df is not None else False
+                        options["financial"][series_select.value] = is_financial
                     logger.debug(f"[update_plot] Is financial data: {is_financial}")
                     chart_type_select.visible = is_financial
                     
-                    available_series = get_available_series(df)
-                    logger.debug(f"[update_plot] Available series: {available_series}")
+                    if options["series"] is None:
+                        options["series"] = get_available_series(df)
+                    available_series = options["series"]
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"[update_plot] Available series: {available_series}")
                     series_select.options = available_series
                     if available_series and series_select.value not in available_series:
                         series_select.value = available_series[0] if available_series else None
@@ -318,8 +686,11 @@ def create_live_sync_metrics_card(panels_grid):
                         logger.debug("[update_plot] Financial data detected, hiding metric selector")
                     else:
                         metric_select.visible = True
-                        available_metrics = get_available_metrics(df, selected_series)
-                        logger.debug(f"[update_plot] Available metrics: {available_metrics}")
+                        available_metrics = options["metrics"].get(selected_series)
+                        if available_metrics is None:
+                            available_metrics = options["metrics"][selected_series] = get_available_metrics(df, selected_series)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"[update_plot] Available metrics: {available_metrics}")
                         metric_select.options = available_metrics
                         if available_metrics and metric_select.value not in available_metrics:
                             metric_select.value = available_metrics[0] if available_metrics else None
@@ -327,131 +698,246 @@ def create_live_sync_metrics_card(panels_grid):
 
                     chart_type = chart_type_select.value if is_financial else "auto"
                     logger.debug(f"[update_plot] Chart type: {chart_type}")
-                    
+
+                    # Thin long histories once per selection; the same frame object
+                    # is reused so downstream caches keyed on it still hit
+                    plot_metric = None if is_financial else metric_select.value
+                    thin_key = (selected_series, plot_metric, is_financial)
+                    plot_df = options["thinned"].get(thin_key)
+                    if plot_df is None:
+                        plot_df = options["thinned"][thin_key] = await run.io_bound(
+                            downsample_for_plot, df, selected_series, plot_metric, is_financial
+                        )
+                        if generation != plot_generation:
+                            return
+                        if df is not None and plot_df is not df:
+                            logger.debug(f"[update_plot] Downsampled {len(df)} rows to {len(plot_df)} for plotting")
+                    last_plot_prep = (plot_df, is_financial, chart_type)
+                except Exception as e:
+                    logger.error(f"[update_plot] Error updating plot: {e}", exc_info=True)
+                    ui.notify(f"Error updating plot: {str(e)}", type="negative")
+                    return
+
+                await render_plot(*last_plot_prep)
+
+            # (frame, selections) of the chart on screen, so repeated updates with
+            # nothing new (e.g. a second selector event) skip the chart build
+            last_rendered = None
+
+            async def render_plot(df, is_financial: bool, chart_type: str, force: bool = False):
+                """Draw prepared data with the selected chart library."""
+                nonlocal last_rendered, render_generation
+                dashboard = state.snapshot("dashboard")
+                chart_library_select = dashboard.chart_library_select
+                series_select = dashboard.series_select
+                metric_select = dashboard.metric_select
+
+                render_key = (
+                    chart_library_select.value if chart_library_select else None,
+                    series_select.value, metric_select.value, chart_type, is_financial
+                )
+                if not force and last_rendered is not None and last_rendered[0] is df and last_rendered[1] == render_key:
+                    logger.debug("[render_plot] Data and selections unchanged, keeping the current chart")
+                    return
+                render_generation += 1
+                generation = render_generation
+                plot_container = dashboard.plot_container
+                plot_figure = dashboard.plot_figure
+                plot_image = dashboard.plot_image
+                plot_html = dashboard.plot_html
+
+                def show_only(element):
+                    """Show element and hide the card's other plot elements."""
+                    for candidate in (plot_container, plot_image, plot_html):
+                        if candidate.visible != (candidate is element):
+                            candidate.visible = candidate is element
+
+                def show_html(html_content: str):
+                    """Show a chart library's HTML snippet in the shared HTML element."""
+                    markup, scripts = _split_scripts(html_content)
+                    plot_html.set_content(markup)
+                    if scripts:
+                        # One injection for all of them; script tags still run in document order
+                        ui.add_body_html('\n'.join(scripts))
+                    show_only(plot_html)
+
+                try:
+                    chart_library = chart_library_select.value if chart_library_select else "plotly"
+                    create_wrapper, _ = _chart_backend(chart_library)
+
                     # Create plot based on selected library
-                    logger.debug(f"[update_plot] Creating plot with library: {chart_library}")
+                    logger.debug(f"[render_plot] Creating plot with library: {chart_library}")
 
                     if chart_library == "matplotlib" and MATPLOTLIB_AVAILABLE:
-                        logger.debug("[update_plot] Using Matplotlib for plotting")
-                        if is_financial:
-                            logger.debug(f"[update_plot] Creating Matplotlib financial plot, chart_type: {chart_type}")
-                            mpl_fig = create_matplotlib_financial_plot(df, series_select.value, chart_type, show_volume=True)
-                        else:
-                            logger.debug(f"[update_plot] Creating Matplotlib plot, metric: {metric_select.value}")
-                            mpl_fig = create_matplotlib_plot(df, series_select.value, metric_select.value)
-
-                        if mpl_fig:
-                            logger.debug("[update_plot] Matplotlib figure created successfully")
-                            img_data = matplotlib_figure_to_base64(mpl_fig)
-                            try:
-                                plot_container.delete()
-                            except:
-                                pass
-                            plot_image = ui.image(img_data).classes("w-full").style("max-height: 600px; object-fit: contain;")
-                            plot_container = plot_image
-                            state.set_component("dashboard.plot_container", plot_container)
-                            state.set_state("dashboard.plot_image", plot_image)
+                        logger.debug("[render_plot] Using Matplotlib for plotting")
+                        # Stays on the event loop: pyplot's global state is not thread-safe
+                        img_url = _matplotlib_image(df, series_select.value, metric_select.value, chart_type, is_financial)
+
+                        if img_url:
+                            if plot_image.source == img_url:
+                                logger.debug("[render_plot] Matplotlib image unchanged, keeping the current one")
+                            else:
+                                logger.debug("[render_plot] Matplotlib image ready")
+                                plot_image.set_source(img_url)
+                            show_only(plot_image)
                         else:
-                            logger.warning("[update_plot] Matplotlib figure creation returned None")
-                    elif chart_library == "altair" and ALTAIR_AVAILABLE and create_altair_plot_wrapper:
+                            logger.warning("[render_plot] Matplotlib figure creation returned None")
+                    elif chart_library == "altair" and create_wrapper:
                         try:
-                            altair_chart = create_altair_plot_wrapper(df, series_select.value, metric_select.value, chart_type)
-                            if altair_chart:
-                                html_content = altair_chart_to_html(altair_chart)
-                                try:
-                                    plot_container.delete()
-                                except:
-                                    pass
-                                plot_container = render_html_with_scripts(html_content)
-                                state.set_component("dashboard.plot_container", plot_container)
+                            html_content = await run.io_bound(
+                                _chart_html, "altair", df, series_select.value, metric_select.value, chart_type
+                            )
+                            if generation != render_generation:
+                                return
+                            if html_content:
+                                show_html(html_content)
                         except Exception as e:
                             logger.error(f"Error creating Altair chart: {e}", exc_info=True)
                             ui.notify(f"Altair chart error: {str(e)}", type="negative")
-                    elif chart_library == "highcharts" and HIGHCHARTS_AVAILABLE and create_highcharts_plot_wrapper:
+                    elif chart_library == "highcharts" and create_wrapper:
                         try:
-                            hc_config = create_highcharts_plot_wrapper(df, series_select.value, metric_select.value, chart_type)
-                            if hc_config:
-                                html_content = highcharts_config_to_html(hc_config, container_id="highcharts-dashboard")
-                                try:
-                                    plot_container.delete()
-                                except:
-                                    pass
-                                plot_container = render_html_with_scripts(html_content)
-                                state.set_component("dashboard.plot_container", plot_container)
+                            html_content = await run.io_bound(
+                                _chart_html, "highcharts", df, series_select.value, metric_select.value, chart_type
+                            )
+                            if generation != render_generation:
+                                return
+                            if html_content:
+                                show_html(html_content)
                         except Exception as e:
                             logger.error(f"Error creating Highcharts chart: {e}", exc_info=True)
                             ui.notify(f"Highcharts chart error: {str(e)}", type="negative")
-                    elif chart_library == "echarts" and ECHARTS_AVAILABLE and create_echarts_plot_wrapper:
+                    elif chart_library == "echarts" and create_wrapper:
                         try:
-                            echarts_config = create_echarts_plot_wrapper(df, series_select.value, metric_select.value, chart_type)
-                            if echarts_config:
-                                html_content = echarts_config_to_html(echarts_config, container_id="echarts-dashboard")
-                                try:
-                                    plot_container.delete()
-                                except:
-                                    pass
-                                plot_container = render_html_with_scripts(html_content)
-                                state.set_component("dashboard.plot_container", plot_container)
+                            html_content = await run.io_bound(
+                                _chart_html, "echarts", df, series_select.value, metric_select.value, chart_type
+                            )
+                            if generation != render_generation:
+                                return
+                            if html_content:
+                                show_html(html_content)
                         except Exception as e:
                             logger.error(f"Error creating ECharts chart: {e}", exc_info=True)
                             ui.notify(f"ECharts chart error: {str(e)}", type="negative")
                     else:
                         # Use Plotly (default)
-                        logger.debug("[update_plot] Using Plotly for plotting")
-                        logger.debug(f"[update_plot] Plotly params - series: {series_select.value}, metric: {metric_select.value}, chart_type: {chart_type}")
-                        new_fig = create_plot(df, series_select.value, metric_select.value, chart_type)
-
-                        if new_fig is None:
-                            logger.error("[update_plot] Plotly create_plot returned None")
+                        logger.debug("[render_plot] Using Plotly for plotting")
+                        logger.debug(f"[render_plot] Plotly params - series: {series_select.value}, metric: {metric_select.value}, chart_type: {chart_type}")
+                        # The figure dict is built once, hashed and handed to ui.plotly
+                        # as is, which would otherwise call to_plotly_json() again
+                        built = await run.io_bound(
+                            _build_plotly_figure, df, series_select.value, metric_select.value, chart_type
+                        )
+                        if generation != render_generation:
+                            return
+
+                        if built is None:
+                            logger.error("[render_plot] Plotly create_plot returned None")
                         else:
+                            new_fig, fig_json, fig_hash = built
                             trace_count = len(new_fig.data) if hasattr(new_fig, 'data') else 0
-                            logger.debug(f"[update_plot] Plotly figure created with {trace_count} traces")
-
-                        has_subplots = hasattr(new_fig, '_grid_ref') and new_fig._grid_ref is not None
-                        logger.debug(f"[update_plot] Has subplots: {has_subplots}")
+                            logger.debug(f"[render_plot] Plotly figure created with {trace_count} traces")
 
-                        if has_subplots:
                             plot_figure = new_fig
-                            try:
-                                plot_container.delete()
-                            except:
-                                pass
-                            plot_container = ui.plotly(plot_figure).classes("w-full").style("min-height: 350px; height: auto;")
-                            state.set_component("dashboard.plot_container", plot_container)
                             state.set_state("dashboard.plot_figure", plot_figure)
-                        else:
-                            plot_figure.data = []
-                            plot_figure.add_traces(list(new_fig.data))
-                            plot_figure.update_layout(new_fig.layout)
-                            state.set_state("dashboard.plot_figure", plot_figure)
-                            
-                            try:
-                                if hasattr(plot_container, 'set_figure'):
-                                    plot_container.set_figure(plot_figure)
-                                elif hasattr(plot_container, 'update'):
-                                    plot_container.update()
-                                else:
-                                    plot_container.delete()
-                                    plot_container = ui.plotly(plot_figure).classes("w-full").style("min-height: 350px; height: auto;")
-                                    state.set_component("dashboard.plot_container", plot_container)
-                            except Exception:
-                                plot_container.delete()
-                                plot_container = ui.plotly(plot_figure).classes("w-full").style("min-height: 350px; height: auto;")
-                                state.set_component("dashboard.plot_container", plot_container)
+                            extensions = None
+                            if fig_hash != dashboard.last_fig_hash:
+                                extensions = _appended_points(plot_container.figure, fig_json)
+                            if fig_hash == dashboard.last_fig_hash:
+                                logger.debug("[render_plot] Plotly figure unchanged, not resending it")
+                            elif extensions is not None:
+                                # New rows were only appended: send just those points and
+                                # keep the server-side figure current for reconnects
+                                logger.debug(f"[render_plot] Extending {len(extensions)} Plotly traces")
+                                for update, indices in extensions:
+                                    plot_container.run_plot_method("extendTraces", update, indices)
+                                plot_container.figure = fig_json
+                                with plot_container.props.suspend_updates():
+                                    plot_container.props["options"] = fig_json
+                            else:
+                                # Reuse the widget: the client applies the new
+                                # figure (subplot grids included) with Plotly.react
+                                plot_container.update_figure(fig_json)
+                            show_only(plot_container)
+                            state.set_state("dashboard.last_fig_hash", fig_hash)
                     
+                    last_rendered = (df, render_key)
                     record_count = len(df) if df is not None else 0
-                    logger.info(f"[update_plot] Plot updated successfully with {record_count} records using {chart_library}")
+                    logger.info(f"[render_plot] Plot updated successfully with {record_count} records using {chart_library}")
                 except Exception as e:
-                    logger.error(f"[update_plot] Error updating plot: {e}", exc_info=True)
+                    logger.error(f"[render_plot] Error rendering plot: {e}", exc_info=True)
                     ui.notify(f"Error updating plot: {str(e)}", type="negative")
+
+            async def render_last_plot():
+                """Re-render the last prepared data, e.g. after a chart library change."""
+                if last_plot_prep is None:
+                    await update_plot()
+                else:
+                    await render_plot(*last_plot_prep)
+
+            async def show_plot_range(e):
+                """Re-downsample the zoomed time range at full resolution (Plotly only)."""
+                relayout = e.args or {}
+                full_df = plot_options["df"]
+                if last_plot_prep is None or full_df is None or len(full_df) <= PLOT_MAX_POINTS:
+                    # Nothing was thinned, so the browser already has every point
+                    return
+                plot_df, is_financial, chart_type = last_plot_prep
+                if relayout.get("xaxis.autorange"):
+                    await render_plot(plot_df, is_financial, chart_type, force=True)
+                    return
+                x_range = relayout.get("xaxis.range") or [relayout.get("xaxis.range[0]"), relayout.get("xaxis.range[1]")]
+                if None in x_range:
+                    return
+
+                dashboard = state.snapshot("dashboard")
+                plot_container = dashboard.plot_container
+                if not plot_container.visible:
+                    return
+                series_id = dashboard.series_select.value
+                metric = None if is_financial else dashboard.metric_select.value
+                try:
+                    # Parsed once per frame; every later zoom only filters
+                    options = options_for(full_df)
+                    timestamps = options["timestamps"]
+                    if timestamps is None:
+                        timestamps = options["timestamps"] = await run.io_bound(
+                            pd.to_datetime, full_df["timestamp"], errors="coerce"
+                        )
+                    start, end = pd.Timestamp(x_range[0]), pd.Timestamp(x_range[1])
+                    window = await run.io_bound(
+                        _zoom_window, full_df, timestamps, start, end, series_id, metric, is_financial
+                    )
+                    logger.debug(f"[show_plot_range] Showing {len(window)} points between {start} and {end}")
+                    new_fig = await run.io_bound(create_plot, window, series_id, metric, chart_type)
+                    new_fig.update_xaxes(range=x_range)
+                    fig_json = new_fig.to_plotly_json()
+                    plot_container.update_figure(fig_json)
+                    state.set_state("dashboard.last_fig_hash", _figure_hash(fig_json))
+                except Exception as e:
+                    logger.warning(f"[show_plot_range] Could not resample zoomed range: {e}")
             
-            def refresh_plot():
+            plot_container.on("plotly_relayout", show_plot_range)
+
+            # Changing one selector often cascades into the others (library ->
+            # series -> metric); re-render once, after the last change
+            pending_plot_timer = None
+
+            def schedule_update_plot():
+                """Update the plot once selections stop changing."""
+                nonlocal pending_plot_timer
+                if pending_plot_timer is not None:
+                    pending_plot_timer.cancel()
+                pending_plot_timer = ui.timer(PLOT_DEBOUNCE_SECONDS, update_plot, once=True)
+
+            async def refresh_plot():
                 """Refresh the time-series plot."""
                 logger.info("Refreshing plot...")
-                update_plot()
+                with _cache_lock:
+                    _data_cache.clear()
+                await update_plot()
                 ui.notify("Plot refreshed", type="info")
 
-            def load_from_file():
+            async def load_from_file():
                 """Load data from the specified file path."""
                 logger.debug("[load_from_file] Starting file load")
 
@@ -466,21 +952,21 @@ def create_live_sync_metrics_card(panels_grid):
                 file_path = file_path.strip()
                 logger.info(f"[load_from_file] Attempting to load: {file_path}")
 
-                from pathlib import Path
-                path_obj = Path(file_path)
-
-                if not path_obj.exists():
+                # One stat call, off the event loop (slow on network mounts)
+                try:
+                    file_stat = await run.io_bound(os.stat, file_path)
+                except OSError:
                     logger.error(f"[load_from_file] File not found: {file_path}")
                     ui.notify(f"File not found: {file_path}", type="negative")
                     return
 
-                if not path_obj.is_file():
+                if not stat.S_ISREG(file_stat.st_mode):
                     logger.error(f"[load_from_file] Path is not a file: {file_path}")
                     ui.notify(f"Path is not a file: {file_path}", type="negative")
                     return
 
                 # Log file info
-                file_size = path_obj.stat().st_size
+                file_size = file_stat.st_size
                 logger.info(f"[load_from_file] File: {file_path}, size: {file_size} bytes ({file_size / 1024:.2f} KB)")
 
                 if file_size == 0:
@@ -493,7 +979,7 @@ def create_live_sync_metrics_card(panels_grid):
                 logger.info(f"[load_from_file] Set loaded file path in state: {file_path}")
 
                 # Load and display record count
-                df, records = load_timeseries_from_file(file_path)
+                df, records = await run.io_bound(_load_plot_data, "file", file_path)
 
                 if df is None:
                     logger.error(f"[load_from_file] Failed to load DataFrame from: {file_path}")
@@ -509,16 +995,18 @@ def create_live_sync_metrics_card(panels_grid):
                 logger.debug(f"[load_from_file] Columns: {list(df.columns)}")
 
                 ui.notify(f"Loaded {len(df)} records from file", type="positive")
-                update_plot()
+                await update_plot()
 
             load_file_button.on_click(load_from_file)
 
             # Update plot when selections change
-            series_select.on('update:modelValue', update_plot)
-            metric_select.on('update:modelValue', update_plot)
-            chart_type_select.on('update:modelValue', update_plot)
-            chart_library_select.on('update:modelValue', update_plot)
-            storage_file_select.on('update:modelValue', update_plot)
+            series_select.on('update:modelValue', schedule_update_plot)
+            metric_select.on('update:modelValue', schedule_update_plot)
+            chart_type_select.on('update:modelValue', schedule_update_plot)
+            # Only the rendering depends on the chart library
+            chart_library_select.on('update:modelValue', render_last_plot)
+            storage_file_select.on('update:modelValue', schedule_update_plot)
 
             refresh_button.on_click(refresh_plot)
-            update_plot()
+            # First render (update_plot is a coroutine, so it is started from a timer)
+            schedule_update_plot()
@@ -2,19 +2,382 @@
 Storage Browser Card
 Independent resizable window for browsing and managing stored files.
 """
+import asyncio
+import atexit
+import hashlib
+import io
+import shutil
 import tempfile
 import os
-from pathlib import Path
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from html import escape
+from pathlib import PurePosixPath
+from typing import Deque, Dict, List, Optional, Tuple
 from nicegui import ui
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from logger import get_logger
 from file_loader import FileLoader
 from data_cleaner import DataCleaner
+from file_exporter import FileExporter
 from nicegui_app import get_app_instance
 
 logger = get_logger()
 
+# The export format table is fixed, so resolve it once instead of per dialog/click
+_FORMAT_OPTIONS = FileExporter.get_supported_formats()
+_FORMAT_INFO = {fmt: FileExporter.get_format_info(fmt) for fmt in _FORMAT_OPTIONS}
+
+# Shared worker pool for blocking export work triggered from the storage card
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="storage-card")
+
+# Scratch directory for temp files, created on first use and removed at exit
+_scratch_dir: Optional[str] = None
+
+
+def _scratch_path(suffix: str = "") -> str:
+    """
+    Get a fresh file path inside the shared scratch directory.
+
+    Args:
+        suffix: File extension to append (e.g. ".json")
+
+    Returns:
+        Path of a not-yet-created file
+    """
+    global _scratch_dir
+    if _scratch_dir is None:
+        _scratch_dir = tempfile.mkdtemp(prefix="variosync_")
+        atexit.register(shutil.rmtree, _scratch_dir, ignore_errors=True)
+    return os.path.join(_scratch_dir, f"{uuid.uuid4().hex}{suffix}")
+
+
+# Temp files waiting for deletion as (not-before monotonic time, path), flushed by _gc_temps()
+_TEMP_GC: Deque[Tuple[float, str]] = deque()
+TEMP_GC_INTERVAL = 30
+
+
+def _schedule_unlink(path: str, delay: float = 0.0) -> None:
+    """
+    Queue a temp file for deletion by the next _gc_temps() pass.
+
+    Args:
+        path: File to delete
+        delay: Minimum seconds to keep the file (e.g. while a browser downloads it)
+    """
+    _TEMP_GC.append((time.monotonic() + delay, path))
+
+
+def _gc_temps() -> None:
+    """Delete every queued temp file whose delay has elapsed."""
+    now = time.monotonic()
+    pending = []
+    while _TEMP_GC:
+        due, path = _TEMP_GC.popleft()
+        if due > now:
+            pending.append((due, path))
+            continue
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            # One undeletable file must not stop the sweep; the scratch
+            # directory is still removed at exit
+            logger.warning(f"[_gc_temps] Could not delete {path}: {e}")
+    _TEMP_GC.extend(pending)
+
+
+# Formats pyarrow reads into a table directly, so the editor can skip per-row records
+ARROW_NATIVE_SUFFIXES = {".parquet", ".pq", ".feather", ".arrow"}
+
+
+def _raw_preview(data: bytes, suffix: str, limit: int = 20) -> Optional[pd.DataFrame]:
+    """
+    Read only the first rows of a blob, without parsing the rest of the file.
+
+    CSV is parsed as-is (before FileLoader normalization); Parquet stops after
+    the first record batch and Arrow/Feather slices the first IPC batch.
+
+    Args:
+        data: Raw file contents
+        suffix: File extension of the stored file
+        limit: Maximum number of rows to return
+
+    Returns:
+        DataFrame with at most ``limit`` rows, or None for other formats (or parse errors)
+    """
+    suffix = suffix.lower()
+    try:
+        if suffix == ".csv":
+            # nrows stops the parser early, so only the head of the file is tokenized
+            return pd.read_csv(io.BytesIO(data), nrows=limit)
+        if suffix in ARROW_NATIVE_SUFFIXES:
+            import pyarrow as pa
+            source = pa.BufferReader(data)
+            if suffix in (".parquet", ".pq"):
+                import pyarrow.parquet as pq
+                parquet_file = pq.ParquetFile(source)
+                batch = next(parquet_file.iter_batches(batch_size=limit), None)
+                table = pa.Table.from_batches([batch]) if batch is not None else parquet_file.schema_arrow.empty_table()
+            else:
+                reader = pa.ipc.open_file(source)
+                if reader.num_record_batches:
+                    table = pa.Table.from_batches([reader.get_batch(0).slice(0, limit)])
+                else:
+                    table = reader.schema.empty_table()
+            # Match _arrow_dataframe: no stored index
+            df = table.to_pandas()
+            df.index = pd.RangeIndex(len(df))
+            return df
+    except ImportError:
+        logger.debug("[_raw_preview] pyarrow not installed, no partial preview")
+    except Exception as e:
+        logger.debug(f"[_raw_preview] Could not read {suffix} preview: {e}")
+    return None
+
+
+def _table_rows(df: pd.DataFrame, limit: int) -> List[dict]:
+    """
+    Rows for a ui.table, each with a "_row" position to use as the row key.
+
+    Args:
+        df: Frame to show
+        limit: Maximum number of rows
+
+    Returns:
+        List of row dicts
+    """
+    return [{**row, "_row": i} for i, row in enumerate(df.head(limit).to_dict('records'))]
+
+
+def _arrow_dataframe(data: bytes, suffix: str) -> Optional[pd.DataFrame]:
+    """
+    Load an Arrow-native file straight into pandas, keeping column dtypes.
+
+    Args:
+        data: Raw file contents
+        suffix: File extension used to pick the reader
+
+    Returns:
+        DataFrame, or None if the format is not Arrow-native or pyarrow cannot read it
+    """
+    suffix = suffix.lower()
+    if suffix not in ARROW_NATIVE_SUFFIXES:
+        return None
+    try:
+        import pyarrow as pa
+        # BufferReader wraps the bytes without copying them
+        source = pa.BufferReader(data)
+        if suffix in (".parquet", ".pq"):
+            import pyarrow.parquet as pq
+            table = pq.read_table(source)
+        else:
+            import pyarrow.feather as feather
+            table = feather.read_table(source)
+        # self_destruct frees Arrow buffers as columns are converted instead of holding both copies
+        df = table.to_pandas(self_destruct=True, split_blocks=True)
+        del table
+        # FileLoader records never carry the stored index, so match that here (no data copy)
+        df.index = pd.RangeIndex(len(df))
+        return df
+    except ImportError:
+        logger.debug("[_arrow_dataframe] pyarrow not installed, falling back to FileLoader")
+        return None
+    except Exception as e:
+        logger.debug(f"[_arrow_dataframe] pyarrow could not read {suffix} data: {e}")
+        return None
+
+
+def _content_key(file_key: str, file_data: bytes) -> Tuple[str, str]:
+    """
+    Build a cache key identifying the current contents of a stored file.
+
+    Args:
+        file_key: Storage key the bytes were loaded from
+        file_data: Raw file bytes
+
+    Returns:
+        (file_key, content fingerprint) tuple
+    """
+    return file_key, hashlib.blake2b(file_data, digest_size=16).hexdigest()
+
+
+# Data summaries keyed by _content_key(), least recently used first
+SUMMARY_CACHE_SIZE = 64
+_summary_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+
+
+def _cached_data_summary(content_key: Tuple[str, str], df: pd.DataFrame) -> dict:
+    """
+    Get DataCleaner.get_data_summary(df), reusing the result for unchanged files.
+
+    Args:
+        content_key: _content_key() of the file df was parsed from
+        df: Parsed DataFrame
+
+    Returns:
+        Summary dictionary (shared between callers, treat as read-only)
+    """
+    summary = _summary_cache.get(content_key)
+    if summary is not None:
+        _summary_cache.move_to_end(content_key)
+        logger.debug(f"[_cached_data_summary] Cache hit for: {content_key[0]}")
+        return summary
+
+    summary = DataCleaner.get_data_summary(df)
+    _summary_cache[content_key] = summary
+    if len(_summary_cache) > SUMMARY_CACHE_SIZE:
+        _summary_cache.popitem(last=False)
+    return summary
+
+
+# Parsed DataFrames keyed by (dialog, *_content_key()), least recently used first.
+# Kept small since each entry holds a whole file; callers must not mutate them.
+DF_CACHE_SIZE = 8
+_df_cache: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+
+
+def _get_cached_df(cache_key: tuple) -> Optional[pd.DataFrame]:
+    """
+    Look up a previously parsed DataFrame.
+
+    Args:
+        cache_key: Dialog name followed by the file's _content_key()
+
+    Returns:
+        Cached DataFrame, or None on a miss
+    """
+    df = _df_cache.get(cache_key)
+    if df is not None:
+        _df_cache.move_to_end(cache_key)
+        logger.debug(f"[_get_cached_df] Cache hit for: {cache_key[:2]}")
+    return df
+
+
+def _put_cached_df(cache_key: tuple, df: pd.DataFrame) -> None:
+    """
+    Store a parsed DataFrame, evicting the least recently used entry when full.
+
+    Args:
+        cache_key: Dialog name followed by the file's _content_key()
+        df: Parsed DataFrame
+    """
+    _df_cache[cache_key] = df
+    _df_cache.move_to_end(cache_key)
+    if len(_df_cache) > DF_CACHE_SIZE:
+        _df_cache.popitem(last=False)
+
+
+# Object sizes of the last listed storage keys; entries are dropped when the
+# storage save journal reports the key as rewritten or the key leaves the
+# listing (e.g. deleted), so refreshes only stat new or changed files. The
+# journal only sees this process's saves, so a manual refresh starts over.
+_size_cache: Dict[str, Optional[int]] = {}
+_size_cache_state = {"storage": None, "seq": 0}
+
+
+def _storage_sizes(storage, keys: List[str], rescan: bool = False) -> Dict[str, Optional[int]]:
+    """
+    Get the size of each key, stat-ing only keys not seen since their last save.
+
+    Args:
+        storage: Storage backend the keys belong to
+        keys: Storage keys to size (the current listing)
+        rescan: Forget every cached size first, e.g. to pick up changes made
+            by other processes
+
+    Returns:
+        Mapping of key to size in bytes (None if the backend cannot tell)
+    """
+    if rescan or _size_cache_state["storage"] is not storage:
+        _size_cache.clear()
+        _size_cache_state["storage"] = storage
+    else:
+        for key in storage.keys_added_since(_size_cache_state["seq"]):
+            _size_cache.pop(key, None)
+        # Keep only the listed keys: bounds the cache and drops deleted ones
+        listed = set(keys)
+        for key in [k for k in _size_cache if k not in listed]:
+            del _size_cache[key]
+    _size_cache_state["seq"] = storage.current_seq()
+
+    missing = [k for k in keys if k not in _size_cache]
+    if missing:
+        # get_size is a stat/HEAD request per key; overlap the round trips
+        _size_cache.update(zip(missing, _EXECUTOR.map(storage.get_size, missing)))
+    return {k: _size_cache[k] for k in keys}
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def _fmt_size(num_bytes: int) -> str:
+    """
+    Format a byte count with a binary unit (e.g. "1.50 MB").
+
+    Args:
+        num_bytes: Size in bytes
+
+    Returns:
+        Human-readable size string
+    """
+    # Each unit is 2**10 of the previous one, so the bit length picks the unit directly
+    unit = min(max(num_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    if unit == 0:
+        return f"{num_bytes} B"
+    return f"{num_bytes / (1 << (10 * unit)):.2f} {_SIZE_UNITS[unit]}"
+
+
+# Upper bound on rows shipped to a visualization card; roughly the chart's pixel width
+VIZ_MAX_POINTS = 2000
+# Point count above which visualization cards draw line/scatter/area traces with WebGL
+VIZ_WEBGL_THRESHOLD = 1000
+
+
+def _downsample_rows(df: pd.DataFrame, value_columns: list, max_points: int = VIZ_MAX_POINTS) -> pd.DataFrame:
+    """
+    Reduce a DataFrame to a bounded number of rows while keeping each column's peaks.
+
+    Rows are split into equal buckets and, per bucket, the rows holding the minimum
+    and maximum of every value column are kept (plus the first and last row), so
+    spikes survive the reduction the way they would on screen.
+
+    Args:
+        df: Source DataFrame, in plotting order
+        value_columns: Numeric columns whose extremes must be preserved
+        max_points: Target number of rows per value column
+
+    Returns:
+        DataFrame with the selected rows (df itself if it is already small enough)
+    """
+    n = len(df)
+    if n <= max_points:
+        return df
+
+    n_buckets = max(max_points // 2, 1)
+    bucket_size = -(-n // n_buckets)
+    if not value_columns:
+        return df.iloc[::bucket_size]
+
+    keep = [np.array([0, n - 1])]
+    pad = n_buckets * bucket_size - n
+    for col in value_columns:
+        values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        values = np.concatenate([values, np.full(pad, np.nan)]).reshape(n_buckets, bucket_size)
+        missing = np.isnan(values)
+        offsets = np.arange(n_buckets) * bucket_size
+        keep.append(offsets + np.where(missing, np.inf, values).argmin(axis=1))
+        keep.append(offsets + np.where(missing, -np.inf, values).argmax(axis=1))
+
+    positions = np.unique(np.concatenate(keep))
+    return df.iloc[positions[positions < n]]
+
 
 def create_storage_card(panels_grid):
     """
@@ -29,17 +392,26 @@ def create_storage_card(panels_grid):
             
             refresh_storage_button = ui.button("🔄 Refresh Storage", icon="refresh")
             
+            # One table for all files: per-row actions are rendered by a slot template and
+            # virtual scrolling only materializes the rows in view
             storage_table = ui.table(
                 columns=[
-                    {"name": "key", "label": "Key", "field": "key", "required": True},
+                    {"name": "key", "label": "Key", "field": "key", "required": True, "align": "left"},
                     {"name": "size", "label": "Size", "field": "size"},
-                    {"name": "type", "label": "Type", "field": "type"}
+                    {"name": "type", "label": "Type", "field": "type"},
+                    {"name": "actions", "label": "Actions", "field": "key"}
                 ],
                 rows=[],
                 row_key="key"
-            ).classes("w-full")
-            
-            storage_files_container = ui.column().classes("w-full gap-2 mt-4")
+            ).classes("w-full").style("max-height: 32rem").props('virtual-scroll no-data-label="No files in storage"')
+            storage_table.add_slot("body-cell-actions", r"""
+                <q-td :props="props">
+                    <q-btn size="sm" color="primary" icon="download" label="Download"
+                           @click="() => $parent.$emit('download', props.row.key)" />
+                    <q-btn size="sm" color="secondary" icon="edit" label="Edit" class="q-ml-sm"
+                           @click="() => $parent.$emit('edit', props.row.key)" />
+                </q-td>
+            """)
             
             def show_download_format_dialog(file_key: str):
                 """Show dialog to download file in different formats."""
@@ -51,6 +423,11 @@ def create_storage_card(panels_grid):
                         ui.notify("Invalid file key", type="negative")
                         return
 
+                    # Parse the key once; suffix/name/stem are reused throughout
+                    key_path = PurePosixPath(file_key)
+                    file_name = key_path.name
+                    file_suffix = key_path.suffix
+
                     app = get_app_instance()
                     if not app or not app.storage:
                         logger.error("[show_download_format_dialog] App or storage not available")
@@ -66,111 +443,81 @@ def create_storage_card(panels_grid):
                     data_size = len(file_data)
                     logger.info(f"[show_download_format_dialog] Loaded {data_size} bytes for: {file_key}")
 
-                    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=Path(file_key).suffix)
-                    temp_file.write(file_data)
-                    temp_file.close()
-                    logger.debug(f"[show_download_format_dialog] Created temp file: {temp_file.name}")
+                    records = FileLoader.load_bytes(file_data, file_suffix)
 
-                    try:
-                        loader = FileLoader()
-                        records = loader.load(temp_file.name)
+                    if records is None:
+                        logger.error(f"[show_download_format_dialog] FileLoader returned None for: {file_key}")
+                        ui.notify("Failed to parse file", type="negative")
+                        return
 
-                        if records is None:
-                            logger.error(f"[show_download_format_dialog] FileLoader returned None for: {file_key}")
-                            ui.notify("Failed to parse file", type="negative")
-                            return
+                    if not records:
+                        logger.warning(f"[show_download_format_dialog] No records in file: {file_key}")
+                        ui.notify("No data found in file", type="warning")
+                        return
 
-                        if not records:
-                            logger.warning(f"[show_download_format_dialog] No records in file: {file_key}")
-                            ui.notify("No data found in file", type="warning")
-                            return
+                    logger.info(f"[show_download_format_dialog] Loaded {len(records)} records for download")
+                    
+                    with ui.dialog() as download_dialog, ui.card().classes("w-full max-w-lg"):
+                        ui.label(f"📥 Download: {file_name}").classes("text-xl font-semibold mb-4")
+                        ui.label(f"Found {len(records)} records. Choose export format:").classes("text-sm mb-4")
+                        
+                        format_select = ui.select(
+                            _FORMAT_OPTIONS,
+                            label="Export Format",
+                            value="json"
+                        ).classes("w-full mb-4")
+                        
+                        status_label = ui.label("Ready to download").classes("text-sm mb-4")
+                        
+                        async def download_file():
+                            try:
+                                export_format = format_select.value
+                                status_label.text = f"⏳ Exporting to {export_format.upper()}..."
+                                
+                                original_name = key_path.stem
+                                format_info = _FORMAT_INFO.get(export_format)
+                                ext = format_info["ext"] if format_info else f".{export_format}"
+                                output_filename = f"{original_name}_export{ext}"
+                                
+                                output_path = _scratch_path(ext)
+                                
+                                export_kwargs = {}
+                                if export_format in ["gzip", "bzip2", "zstandard"]:
+                                    export_kwargs["base_format"] = "json"
+                                
+                                # Export off the event loop so the UI stays responsive for large files
+                                success = await asyncio.get_running_loop().run_in_executor(
+                                    _EXECUTOR,
+                                    partial(FileExporter.export, records, output_path, export_format, **export_kwargs)
+                                )
+                                
+                                if success:
+                                    # Serve the file over HTTP instead of pushing a data URL through the websocket
+                                    mime_type = format_info["mime"] if format_info else "application/octet-stream"
+                                    ui.download(output_path, output_filename, media_type=mime_type)
+
+                                    status_label.text = f"✅ Downloaded as {output_filename}"
+                                    ui.notify(f"Downloaded {output_filename}", type="positive")
+                                    download_dialog.close()
+
+                                    # The browser fetches the file asynchronously, so keep it around for a while
+                                    _schedule_unlink(output_path, delay=60)
+                                else:
+                                    status_label.text = "❌ Export failed. Check logs."
+                                    ui.notify("Export failed", type="negative")
+                                    _schedule_unlink(output_path)
 
-                        logger.info(f"[show_download_format_dialog] Loaded {len(records)} records for download")
+                            except Exception as e:
+                                logger.error(f"Error downloading file: {e}", exc_info=True)
+                                status_label.text = f"❌ Error: {str(e)}"
+                                ui.notify(f"Download error: {str(e)}", type="negative")
                         
-                        with ui.dialog() as download_dialog, ui.card().classes("w-full max-w-lg"):
-                            ui.label(f"📥 Download: {Path(file_key).name}").classes("text-xl font-semibold mb-4")
-                            ui.label(f"Found {len(records)} records. Choose export format:").classes("text-sm mb-4")
-                            
-                            from file_exporter import FileExporter
-                            exporter = FileExporter()
-                            all_formats = exporter.get_supported_formats()
-                            
-                            format_select = ui.select(
-                                all_formats,
-                                label="Export Format",
-                                value="json"
-                            ).classes("w-full mb-4")
-                            
-                            status_label = ui.label("Ready to download").classes("text-sm mb-4")
-                            
-                            def download_file():
-                                try:
-                                    export_format = format_select.value
-                                    status_label.text = f"⏳ Exporting to {export_format.upper()}..."
-                                    
-                                    from file_exporter import FileExporter
-                                    import base64
-                                    
-                                    original_name = Path(file_key).stem
-                                    format_info = FileExporter.get_format_info(export_format)
-                                    ext = format_info["ext"] if format_info else f".{export_format}"
-                                    output_filename = f"{original_name}_export{ext}"
-                                    
-                                    temp_output = tempfile.NamedTemporaryFile(delete=False, suffix=ext)
-                                    temp_output.close()
-                                    
-                                    export_kwargs = {}
-                                    if export_format in ["gzip", "bzip2", "zstandard"]:
-                                        export_kwargs["base_format"] = "json"
-                                    
-                                    success = FileExporter.export(records, temp_output.name, export_format, **export_kwargs)
-                                    
-                                    if success:
-                                        with open(temp_output.name, "rb") as f:
-                                            export_data = f.read()
-                                        
-                                        b64_data = base64.b64encode(export_data).decode()
-                                        mime_type = format_info["mime"] if format_info else "application/octet-stream"
-                                        data_url = f"data:{mime_type};base64,{b64_data}"
-                                        
-                                        ui.run_javascript(f'''
-                                            const link = document.createElement('a');
-                                            link.href = '{data_url}';
-                                            link.download = '{output_filename}';
-                                            document.body.appendChild(link);
-                                            link.click();
-                                            document.body.removeChild(link);
-                                        ''')
-                                        
-                                        status_label.text = f"✅ Downloaded as {output_filename}"
-                                        ui.notify(f"Downloaded {output_filename}", type="positive")
-                                        download_dialog.close()
-                                    else:
-                                        status_label.text = "❌ Export failed. Check logs."
-                                        ui.notify("Export failed", type="negative")
-                                    
-                                    try:
-                                        os.unlink(temp_output.name)
-                                    except:
-                                        pass
-                                        
-                                except Exception as e:
-                                    logger.error(f"Error downloading file: {e}", exc_info=True)
-                                    status_label.text = f"❌ Error: {str(e)}"
-                                    ui.notify(f"Download error: {str(e)}", type="negative")
-                            
-                            with ui.row().classes("w-full gap-2"):
-                                ui.button("Download", icon="download", color="primary", on_click=download_file)
-                                ui.button("Cancel", on_click=download_dialog.close).props("flat")
-                            
-                            download_dialog.open()
-                            
-                    finally:
-                        try:
-                            os.unlink(temp_file.name)
-                        except:
-                            pass
-                            
+                        with ui.row().classes("w-full gap-2"):
+                            ui.button("Download", icon="download", color="primary", on_click=download_file)
+                            ui.button("Cancel", on_click=download_dialog.close).props("flat")
+                        
+                        download_dialog.open()
+
                 except Exception as e:
                     logger.error(f"Error showing download dialog: {e}", exc_info=True)
                     ui.notify(f"Error: {str(e)}", type="negative")
@@ -185,6 +532,10 @@ def create_storage_card(panels_grid):
                         ui.notify("Invalid file key", type="negative")
                         return
 
+                    key_path = PurePosixPath(file_key)
+                    file_name = key_path.name
+                    file_suffix = key_path.suffix
+
                     app = get_app_instance()
                     if not app or not app.storage:
                         logger.error("[show_data_editor] App or storage not available")
@@ -200,126 +551,179 @@ def create_storage_card(panels_grid):
                     data_size = len(file_data)
                     logger.info(f"[show_data_editor] Loaded {data_size} bytes for: {file_key}")
 
-                    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=Path(file_key).suffix)
-                    temp_file.write(file_data)
-                    temp_file.close()
-                    logger.debug(f"[show_data_editor] Created temp file: {temp_file.name}")
-
-                    try:
-                        loader = FileLoader()
-                        records = loader.load(temp_file.name)
-
-                        if records is None:
-                            logger.error(f"[show_data_editor] FileLoader returned None for: {file_key}")
-                            ui.notify("Failed to parse file", type="negative")
-                            return
-
-                        if not records:
-                            logger.warning(f"[show_data_editor] No records in file: {file_key}")
-                            ui.notify("No data found in file", type="warning")
-                            return
-
-                        logger.info(f"[show_data_editor] Loaded {len(records)} records for editing")
-
-                        df = pd.DataFrame(records)
-                        logger.debug(f"[show_data_editor] DataFrame shape: {df.shape}, columns: {list(df.columns)}")
+                    # Reopening an unchanged file reuses the parsed frame
+                    content_key = _content_key(file_key, file_data)
+                    df = _get_cached_df(("editor", *content_key))
+
+                    def load_df() -> pd.DataFrame:
+                        """Parse the whole file; only the summary and the cleaning operations need it."""
+                        nonlocal df
+                        if df is None:
+                            # Parse straight from the loaded bytes; no scratch file round trip
+                            df = _arrow_dataframe(file_data, file_suffix)
+                            if df is None:
+                                df = pd.DataFrame.from_records(FileLoader.load_bytes(file_data, file_suffix))
+                            _put_cached_df(("editor", *content_key), df)
+                            logger.info(f"[show_data_editor] Loaded {len(df)} records for editing")
+                            logger.debug(f"[show_data_editor] DataFrame shape: {df.shape}, columns: {list(df.columns)}")
+                        return df
+
+                    # CSV, Parquet and Arrow files are previewed from their first rows only;
+                    # other formats (and cached frames) preview the parsed frame
+                    raw_preview_df = _raw_preview(file_data, file_suffix) if df is None else None
+                    if raw_preview_df is None:
+                        raw_preview_df = load_df().head(20)
+
+                    if raw_preview_df.empty:
+                        logger.warning(f"[show_data_editor] No records in file: {file_key}")
+                        ui.notify("No data found in file", type="warning")
+                        return
+                    
+                    with ui.dialog() as editor_dialog, ui.card().classes("w-full max-w-6xl max-h-[90vh] overflow-auto"):
+                        ui.label(f"✏️ Data Editor: {file_name}").classes("text-xl font-semibold mb-4")
                         
-                        with ui.dialog() as editor_dialog, ui.card().classes("w-full max-w-6xl max-h-[90vh] overflow-auto"):
-                            ui.label(f"✏️ Data Editor: {Path(file_key).name}").classes("text-xl font-semibold mb-4")
-                            
-                            summary = DataCleaner.get_data_summary(df)
-                            
-                            with ui.expansion("📊 Data Summary", icon="info").classes("w-full mb-4"):
-                                with ui.column().classes("gap-2 text-sm"):
-                                    ui.label(f"Total Rows: {summary['total_rows']}").classes("font-semibold")
-                                    ui.label(f"Total Columns: {summary['total_columns']}")
-                                    ui.label(f"Duplicate Rows: {summary['duplicate_rows']}")
-                            
-                            ui.label("🧹 Cleaning Operations").classes("text-lg font-semibold mb-2")
-                            
-                            operations = []
-                            operations_container = ui.column().classes("w-full gap-2 mb-4")
-                            
-                            def add_operation():
-                                with operations_container:
-                                    with ui.card().classes("w-full p-3 border") as card_element:
-                                        with ui.row().classes("w-full items-center gap-2"):
-                                            op_type = ui.select(
-                                                ["drop_na", "fill_na", "remove_duplicates", "remove_outliers", 
-                                                 "normalize_timestamps", "filter_rows", "rename_columns", 
-                                                 "drop_columns", "add_column", "convert_type", "resample", 
-                                                 "interpolate", "clip_values", "round_values"],
-                                                label="Operation",
-                                                value="drop_na"
-                                            ).classes("flex-1")
-                                            
-                                            def remove_op():
-                                                card_element.delete()
-                                                if op in operations:
-                                                    operations.remove(op)
-                                            
-                                            ui.button("❌", icon="close", on_click=remove_op).props("size=sm flat")
+                        with ui.expansion("📊 Data Summary", icon="info").classes("w-full mb-4") as summary_expansion:
+                            summary_column = ui.column().classes("gap-2 text-sm")
+
+                        def show_summary():
+                            if summary_column.default_slot.children:
+                                return
+                            summary = _cached_data_summary(content_key, load_df())
+                            with summary_column:
+                                ui.label(f"Total Rows: {summary['total_rows']}").classes("font-semibold")
+                                ui.label(f"Total Columns: {summary['total_columns']}")
+                                ui.label(f"Duplicate Rows: {summary['duplicate_rows']}")
+
+                                # One HTML element for the per-column breakdown instead of a label per cell
+                                rows_html = "".join(
+                                    f"<tr><td class='pr-4'>{escape(str(col))}</td><td class='pr-4'>{escape(str(dtype))}</td>"
+                                    f"<td class='pr-4'>{summary['missing_values'].get(col, 0)}</td>"
+                                    f"<td>{summary['missing_percentage'].get(col, 0.0):.1f}%</td></tr>"
+                                    for col, dtype in summary['dtypes'].items()
+                                )
+                                ui.html(
+                                    "<table class='text-xs font-mono'>"
+                                    "<thead><tr><th class='text-left pr-4'>Column</th><th class='text-left pr-4'>Type</th>"
+                                    "<th class='text-left pr-4'>Missing</th><th class='text-left'>Missing %</th></tr></thead>"
+                                    f"<tbody>{rows_html}</tbody></table>",
+                                    sanitize=False
+                                )
+
+                        # The summary scans every row, so it waits until it is opened
+                        # unless the frame is already parsed
+                        if df is not None:
+                            show_summary()
+                        summary_expansion.on_value_change(lambda e: show_summary() if e.value else None)
+
+                        with ui.expansion("👀 Raw Preview (first 20 rows)", icon="table_view").classes("w-full mb-4"):
+                            ui.table(
+                                columns=[{"name": col, "label": col, "field": col} for col in raw_preview_df.columns[:10]],
+                                rows=_table_rows(raw_preview_df, 20),
+                                row_key="_row"
+                            ).classes("w-full")
+
+                        ui.label("🧹 Cleaning Operations").classes("text-lg font-semibold mb-2")
+                        
+                        operations = []
+                        operations_container = ui.column().classes("w-full gap-2 mb-4")
+                        
+                        def add_operation():
+                            with operations_container:
+                                with ui.card().classes("w-full p-3 border") as card_element:
+                                    with ui.row().classes("w-full items-center gap-2"):
+                                        op_type = ui.select(
+                                            ["drop_na", "fill_na", "remove_duplicates", "remove_outliers", 
+                                             "normalize_timestamps", "filter_rows", "rename_columns", 
+                                             "drop_columns", "add_column", "convert_type", "resample", 
+                                             "interpolate", "clip_values", "round_values"],
+                                            label="Operation",
+                                            value="drop_na"
+                                        ).classes("flex-1")
                                         
-                                        op = {"operation": op_type.value, "params": {}}
-                                        operations.append(op)
-                            
-                            with ui.row().classes("w-full gap-2 mb-2"):
-                                ui.button("➕ Add Operation", icon="add", on_click=add_operation).props("outline")
-                            
-                            preview_df = df.copy()
-                            preview_container = ui.column().classes("w-full")
-                            save_btn = None
-                            
-                            def apply_operations():
-                                nonlocal preview_df, save_btn
-                                try:
-                                    preview_df = DataCleaner.clean_dataframe(df.copy(), operations)
-                                    preview_container.clear()
-                                    with preview_container:
-                                        ui.label(f"✅ Preview: {len(preview_df)} rows (was {len(df)} rows)").classes("text-sm font-semibold text-green-600 mb-2")
-                                        preview_table = ui.table(
-                                            columns=[{"name": col, "label": col, "field": col} for col in preview_df.columns[:10]],
-                                            rows=preview_df.head(200).to_dict('records'),
-                                            row_key="index"
-                                        ).classes("w-full")
+                                        def remove_op():
+                                            card_element.delete()
+                                            if op in operations:
+                                                operations.remove(op)
+                                        
+                                        ui.button("❌", icon="close", on_click=remove_op).props("size=sm flat")
                                     
-                                    if save_btn:
-                                        save_btn.set_enabled(True)
-                                    ui.notify("Operations applied. Review preview.", type="positive")
-                                except Exception as e:
-                                    logger.error(f"Error applying operations: {e}", exc_info=True)
-                                    ui.notify(f"Error: {str(e)}", type="negative")
-                            
-                            def save_cleaned():
+                                    op = {"operation": op_type.value, "params": {}}
+                                    operations.append(op)
+
+                                    # Sync on every change so Preview always runs the selected operation
+                                    op_type.on_value_change(lambda e: op.update(operation=e.value))
+                        
+                        with ui.row().classes("w-full gap-2 mb-2"):
+                            ui.button("➕ Add Operation", icon="add", on_click=add_operation).props("outline")
+                        
+                        preview_df = None
+                        preview_container = ui.column().classes("w-full")
+                        save_btn = None
+                        
+                        def apply_operations():
+                            nonlocal preview_df, save_btn
+                            try:
+                                # Run the pipeline in DuckDB when every operation has a SQL form;
+                                # both paths leave source_df untouched, so no defensive copy is needed
+                                source_df = load_df()
+                                preview_df = DataCleaner.clean_dataframe_sql(source_df, operations)
+                                if preview_df is None:
+                                    preview_df = DataCleaner.clean_dataframe(source_df, operations)
+                                preview_container.clear()
+                                with preview_container:
+                                    ui.label(f"✅ Preview: {len(preview_df)} rows (was {len(source_df)} rows)").classes("text-sm font-semibold text-green-600 mb-2")
+                                    preview_table = ui.table(
+                                        columns=[{"name": col, "label": col, "field": col} for col in preview_df.columns[:10]],
+                                        rows=_table_rows(preview_df, 200),
+                                        row_key="_row"
+                                    ).classes("w-full")
+                                
+                                if save_btn:
+                                    save_btn.set_enabled(True)
+                                ui.notify("Operations applied. Review preview.", type="positive")
+                            except Exception as e:
+                                logger.error(f"Error applying operations: {e}", exc_info=True)
+                                ui.notify(f"Error: {str(e)}", type="negative")
+                        
+                        def save_cleaned():
+                            try:
+                                suffix = file_suffix
+                                base_key = file_key[:-len(suffix)] if suffix else file_key
                                 try:
-                                    cleaned_records = preview_df.to_dict('records')
-                                    import json
-                                    cleaned_data = json.dumps(cleaned_records, indent=2, default=str).encode('utf-8')
-                                    new_key = file_key.replace('.json', '_cleaned.json')
-                                    app.storage.save(new_key, cleaned_data)
-                                    ui.notify(f"Saved cleaned data to {new_key}", type="positive")
-                                    editor_dialog.close()
-                                    refresh_storage()
+                                    # Columnar write straight from the DataFrame, no per-row dicts
+                                    buffer = io.BytesIO()
+                                    preview_df.to_parquet(buffer, engine='pyarrow', compression='zstd', index=False)
+                                    cleaned_data = buffer.getvalue()
+                                    new_key = f"{base_key}_cleaned.parquet"
                                 except Exception as e:
-                                    logger.error(f"Error saving cleaned data: {e}")
-                                    ui.notify(f"Error saving: {str(e)}", type="negative")
-                            
-                            with ui.row().classes("w-full gap-2 mb-4"):
-                                ui.button("🔍 Preview", icon="preview", on_click=apply_operations).props("outline")
-                                save_btn = ui.button("💾 Save Cleaned Data", icon="save", on_click=save_cleaned, color="primary")
-                                save_btn.set_enabled(False)
-                            
-                            with ui.row().classes("w-full justify-end"):
-                                ui.button("Close", on_click=editor_dialog.close).props("flat")
-                            
-                            editor_dialog.open()
-                            
-                    finally:
-                        try:
-                            os.unlink(temp_file.name)
-                        except:
-                            pass
-                            
+                                    # pyarrow missing or columns it cannot encode (e.g. mixed nested objects)
+                                    logger.debug(f"[save_cleaned] Parquet write failed, saving JSON instead: {e}")
+                                    cleaned_records = preview_df.to_dict('records')
+                                    try:
+                                        import orjson
+                                        cleaned_data = orjson.dumps(cleaned_records, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+                                    except ImportError:
+                                        import json
+                                        cleaned_data = json.dumps(cleaned_records, default=str).encode('utf-8')
+                                    new_key = f"{base_key}_cleaned.json"
+                                app.storage.save(new_key, cleaned_data)
+                                ui.notify(f"Saved cleaned data to {new_key}", type="positive")
+                                editor_dialog.close()
+                                refresh_storage()
+                            except Exception as e:
+                                logger.error(f"Error saving cleaned data: {e}")
+                                ui.notify(f"Error saving: {str(e)}", type="negative")
+                        
+                        with ui.row().classes("w-full gap-2 mb-4"):
+                            ui.button("🔍 Preview", icon="preview", on_click=apply_operations).props("outline")
+                            save_btn = ui.button("💾 Save Cleaned Data", icon="save", on_click=save_cleaned, color="primary")
+                            save_btn.set_enabled(False)
+                        
+                        with ui.row().classes("w-full justify-end"):
+                            ui.button("Close", on_click=editor_dialog.close).props("flat")
+                        
+                        editor_dialog.open()
+
                 except Exception as e:
                     logger.error(f"Error showing data editor: {e}", exc_info=True)
                     ui.notify(f"Error: {str(e)}", type="negative")
@@ -337,6 +741,10 @@ def create_storage_card(panels_grid):
                         ui.notify("Invalid file key", type="negative")
                         return
 
+                    key_path = PurePosixPath(file_key)
+                    file_name = key_path.name
+                    file_suffix = key_path.suffix
+
                     app = get_app_instance()
                     if not app or not app.storage:
                         logger.error("[show_data_visualizer] App or storage not available")
@@ -360,14 +768,12 @@ def create_storage_card(panels_grid):
                         ui.notify("File is empty", type="warning")
                         return
 
-                    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=Path(file_key).suffix)
-                    temp_file.write(file_data)
-                    temp_file.close()
-                    logger.debug(f"[show_data_visualizer] Created temp file: {temp_file.name}")
+                    # Reopening an unchanged file skips parsing and record expansion
+                    content_key = _content_key(file_key, file_data)
+                    df = _get_cached_df(("visualizer", *content_key))
 
-                    try:
-                        loader = FileLoader()
-                        records = loader.load(temp_file.name)
+                    if df is None:
+                        records = FileLoader.load_bytes(file_data, file_suffix)
 
                         if records is None:
                             logger.error(f"[show_data_visualizer] FileLoader returned None for: {file_key}")
@@ -429,270 +835,308 @@ def create_storage_card(panels_grid):
                             logger.warning(f"[show_data_visualizer] No 'timestamp' column in data")
                             logger.debug(f"[show_data_visualizer] Available columns: {list(df.columns)}")
 
-                        if len(df) == 0:
-                            logger.warning(f"[show_data_visualizer] No valid data points after processing: {file_key}")
-                            ui.notify("No valid data points found after processing", type="warning")
-                            return
+                        _put_cached_df(("visualizer", *content_key), df)
 
-                        logger.info(f"[show_data_visualizer] Ready to visualize {len(df)} data points")
+                    if len(df) == 0:
+                        logger.warning(f"[show_data_visualizer] No valid data points after processing: {file_key}")
+                        ui.notify("No valid data points found after processing", type="warning")
+                        return
 
-                        # Generate unique card ID
-                        import time
-                        card_id = f"viz-{Path(file_key).stem}-{int(time.time() * 1000)}"
-                        card_title = f"📈 {Path(file_key).name}"
+                    logger.info(f"[show_data_visualizer] Ready to visualize {len(df)} data points")
 
-                        # Store dataframe for this card
-                        viz_card_data[card_id] = df.copy()
+                    # Generate unique card ID
+                    card_id = f"viz-{key_path.stem}-{int(time.time() * 1000)}"
+                    card_title = f"📈 {file_name}"
 
-                        # Create the visualization card using JavaScript
-                        ui.run_javascript(f'''
-                            window.createVizCard("{card_id}", "{card_title}");
-                        ''')
+                    # Store dataframe for this card; plotting only reads it, so it
+                    # can share the cached frame instead of copying every column
+                    viz_card_data[card_id] = df
 
-                        # Small delay to allow card creation, then populate
-                        def populate_viz_card():
-                            try:
-                                # Create card content in panels_grid
-                                with panels_grid:
-                                    with ui.card().classes("w-full h-full").props(f'data-viz-card="{card_id}"').style("display: none;") as viz_card:
-                                        # This hidden card holds our NiceGUI elements
-                                        pass
-
-                                # Get dataframe for this card
-                                card_df = viz_card_data.get(card_id)
-                                if card_df is None:
-                                    return
-
-                                x_options = [col for col in card_df.columns if col not in ['series_id', 'metadata', 'format']]
-                                numeric_cols = list(card_df.select_dtypes(include=['number']).columns)
-                                y_options = [col for col in numeric_cols if col != 'timestamp']
-                                if not y_options:
-                                    y_options = [col for col in card_df.columns if col != 'timestamp' and col not in ['series_id', 'metadata', 'format']]
-
-                                # Create card content via JavaScript injection
-                                x_opts_str = ','.join([f'"{opt}"' for opt in x_options])
-                                y_opts_str = ','.join([f'"{opt}"' for opt in y_options])
-                                default_y = y_options[:3] if len(y_options) >= 3 else y_options
-                                default_y_str = ','.join([f'"{opt}"' for opt in default_y])
-                                default_x = 'timestamp' if 'timestamp' in x_options else (x_options[0] if x_options else '')
-
-                                # Prepare data for JavaScript
-                                import json
-                                chart_data = card_df.to_dict('list')
-                                for key in chart_data:
-                                    chart_data[key] = [str(v) if pd.notna(v) else None for v in chart_data[key]]
-                                data_json = json.dumps(chart_data)
-
-                                js_code = f'''
-                                (function() {{
-                                    const bodyEl = document.getElementById('viz-body-{card_id}');
-                                    if (!bodyEl) {{
-                                        console.error('Viz body not found: viz-body-{card_id}');
-                                        return;
+                    # Create the visualization card using JavaScript
+                    ui.run_javascript(f'''
+                        window.createVizCard("{card_id}", "{card_title}");
+                    ''')
+
+                    # Small delay to allow card creation, then populate
+                    def populate_viz_card():
+                        try:
+                            # Create card content in panels_grid
+                            with panels_grid:
+                                with ui.card().classes("w-full h-full").props(f'data-viz-card="{card_id}"').style("display: none;") as viz_card:
+                                    # This hidden card holds our NiceGUI elements
+                                    pass
+
+                            # Get dataframe for this card
+                            card_df = viz_card_data.get(card_id)
+                            if card_df is None:
+                                return
+
+                            x_options = [col for col in card_df.columns if col not in ['series_id', 'metadata', 'format']]
+                            # One dtype scan feeds both the Y options and the downsampler
+                            value_cols = [col for col in card_df.select_dtypes(include=['number']).columns if col != 'timestamp']
+                            y_options = value_cols
+                            if not y_options:
+                                y_options = [col for col in card_df.columns if col != 'timestamp' and col not in ['series_id', 'metadata', 'format']]
+
+                            # Create card content via JavaScript injection
+                            x_opts_str = ','.join([f'"{opt}"' for opt in x_options])
+                            y_opts_str = ','.join([f'"{opt}"' for opt in y_options])
+                            default_y = y_options[:3] if len(y_options) >= 3 else y_options
+                            default_y_str = ','.join([f'"{opt}"' for opt in default_y])
+                            default_x = 'timestamp' if 'timestamp' in x_options else (x_options[0] if x_options else '')
+
+                            # Prepare data for JavaScript
+                            import json
+                            # Every row is stringified and pushed through the websocket, so
+                            # only ship about as many points as the chart can show
+                            plot_df = _downsample_rows(card_df, value_cols)
+                            if len(plot_df) < len(card_df):
+                                logger.info(f"[show_data_visualizer] Downsampled {len(card_df)} -> {len(plot_df)} rows for {card_id}")
+                            chart_data = plot_df.to_dict('list')
+                            for key in chart_data:
+                                chart_data[key] = [str(v) if pd.notna(v) else None for v in chart_data[key]]
+                            data_json = json.dumps(chart_data)
+
+                            js_code = f'''
+                            (function() {{
+                                const bodyEl = document.getElementById('viz-body-{card_id}');
+                                if (!bodyEl) {{
+                                    console.error('Viz body not found: viz-body-{card_id}');
+                                    return;
+                                }}
+
+                                // Store data globally for this card
+                                window.vizData = window.vizData || {{}};
+                                window.vizData['{card_id}'] = {data_json};
+
+                                // Create control panel
+                                const controlsDiv = document.createElement('div');
+                                controlsDiv.className = 'viz-controls';
+                                controlsDiv.style.cssText = 'padding: 8px; display: flex; flex-wrap: wrap; gap: 8px; align-items: center; background: #2d2d3d; border-radius: 4px; margin-bottom: 8px;';
+
+                                // Chart type selector
+                                const chartTypeLabel = document.createElement('label');
+                                chartTypeLabel.textContent = 'Chart: ';
+                                chartTypeLabel.style.color = 'white';
+                                const chartTypeSelect = document.createElement('select');
+                                chartTypeSelect.id = 'chart-type-{card_id}';
+                                chartTypeSelect.style.cssText = 'padding: 4px; border-radius: 4px; background: #1e1e2e; color: white; border: 1px solid #3b82f6;';
+                                ['line', 'scatter', 'bar', 'area'].forEach(t => {{
+                                    const opt = document.createElement('option');
+                                    opt.value = t;
+                                    opt.textContent = t.charAt(0).toUpperCase() + t.slice(1);
+                                    chartTypeSelect.appendChild(opt);
+                                }});
+
+                                // X-axis selector
+                                const xLabel = document.createElement('label');
+                                xLabel.textContent = 'X: ';
+                                xLabel.style.color = 'white';
+                                const xSelect = document.createElement('select');
+                                xSelect.id = 'x-axis-{card_id}';
+                                xSelect.style.cssText = 'padding: 4px; border-radius: 4px; background: #1e1e2e; color: white; border: 1px solid #3b82f6;';
+                                [{x_opts_str}].forEach(col => {{
+                                    const opt = document.createElement('option');
+                                    opt.value = col;
+                                    opt.textContent = col;
+                                    if (col === '{default_x}') opt.selected = true;
+                                    xSelect.appendChild(opt);
+                                }});
+
+                                // Y-axis multi-select
+                                const yLabel = document.createElement('label');
+                                yLabel.textContent = 'Y: ';
+                                yLabel.style.color = 'white';
+                                const ySelect = document.createElement('select');
+                                ySelect.id = 'y-axis-{card_id}';
+                                ySelect.multiple = true;
+                                ySelect.style.cssText = 'padding: 4px; border-radius: 4px; background: #1e1e2e; color: white; border: 1px solid #3b82f6; min-width: 120px; max-height: 60px;';
+                                const defaultY = [{default_y_str}];
+                                [{y_opts_str}].forEach(col => {{
+                                    const opt = document.createElement('option');
+                                    opt.value = col;
+                                    opt.textContent = col;
+                                    if (defaultY.includes(col)) opt.selected = true;
+                                    ySelect.appendChild(opt);
+                                }});
+
+                                // Update button
+                                const updateBtn = document.createElement('button');
+                                updateBtn.textContent = '🔄 Update';
+                                updateBtn.style.cssText = 'padding: 4px 12px; border-radius: 4px; background: #3b82f6; color: white; border: none; cursor: pointer;';
+                                updateBtn.onmouseover = () => updateBtn.style.background = '#2563eb';
+                                updateBtn.onmouseout = () => updateBtn.style.background = '#3b82f6';
+
+                                controlsDiv.appendChild(chartTypeLabel);
+                                controlsDiv.appendChild(chartTypeSelect);
+                                controlsDiv.appendChild(xLabel);
+                                controlsDiv.appendChild(xSelect);
+                                controlsDiv.appendChild(yLabel);
+                                controlsDiv.appendChild(ySelect);
+                                controlsDiv.appendChild(updateBtn);
+
+                                // Plot container
+                                const plotDiv = document.createElement('div');
+                                plotDiv.id = 'plot-{card_id}';
+                                plotDiv.style.cssText = 'flex: 1; min-height: 250px; width: 100%;';
+
+                                bodyEl.innerHTML = '';
+                                bodyEl.style.cssText = 'display: flex; flex-direction: column; height: 100%; padding: 8px;';
+                                bodyEl.appendChild(controlsDiv);
+                                bodyEl.appendChild(plotDiv);
+
+                                // Parsed numeric columns, reused across redraws
+                                const parsedColumns = {{}};
+                                function numericColumn(col) {{
+                                    if (!(col in parsedColumns)) {{
+                                        const data = window.vizData['{card_id}'] || {{}};
+                                        parsedColumns[col] = (data[col] || []).map(v => v === null ? null : parseFloat(v));
                                     }}
+                                    return parsedColumns[col];
+                                }}
 
-                                    // Store data globally for this card
-                                    window.vizData = window.vizData || {{}};
-                                    window.vizData['{card_id}'] = {data_json};
-
-                                    // Create control panel
-                                    const controlsDiv = document.createElement('div');
-                                    controlsDiv.className = 'viz-controls';
-                                    controlsDiv.style.cssText = 'padding: 8px; display: flex; flex-wrap: wrap; gap: 8px; align-items: center; background: #2d2d3d; border-radius: 4px; margin-bottom: 8px;';
-
-                                    // Chart type selector
-                                    const chartTypeLabel = document.createElement('label');
-                                    chartTypeLabel.textContent = 'Chart: ';
-                                    chartTypeLabel.style.color = 'white';
-                                    const chartTypeSelect = document.createElement('select');
-                                    chartTypeSelect.id = 'chart-type-{card_id}';
-                                    chartTypeSelect.style.cssText = 'padding: 4px; border-radius: 4px; background: #1e1e2e; color: white; border: 1px solid #3b82f6;';
-                                    ['line', 'scatter', 'bar', 'area'].forEach(t => {{
-                                        const opt = document.createElement('option');
-                                        opt.value = t;
-                                        opt.textContent = t.charAt(0).toUpperCase() + t.slice(1);
-                                        chartTypeSelect.appendChild(opt);
-                                    }});
+                                // The card's data never changes, so an unchanged selection needs no redraw
+                                let lastSelection = null;
+                                const colors = ['#3b82f6', '#10b981', '#f59e0b', '#ec4899', '#8b5cf6'];
 
-                                    // X-axis selector
-                                    const xLabel = document.createElement('label');
-                                    xLabel.textContent = 'X: ';
-                                    xLabel.style.color = 'white';
-                                    const xSelect = document.createElement('select');
-                                    xSelect.id = 'x-axis-{card_id}';
-                                    xSelect.style.cssText = 'padding: 4px; border-radius: 4px; background: #1e1e2e; color: white; border: 1px solid #3b82f6;';
-                                    [{x_opts_str}].forEach(col => {{
-                                        const opt = document.createElement('option');
-                                        opt.value = col;
-                                        opt.textContent = col;
-                                        if (col === '{default_x}') opt.selected = true;
-                                        xSelect.appendChild(opt);
-                                    }});
+                                // Function to update plot
+                                function updatePlot() {{
+                                    const data = window.vizData['{card_id}'];
+                                    if (!data) return;
 
-                                    // Y-axis multi-select
-                                    const yLabel = document.createElement('label');
-                                    yLabel.textContent = 'Y: ';
-                                    yLabel.style.color = 'white';
-                                    const ySelect = document.createElement('select');
-                                    ySelect.id = 'y-axis-{card_id}';
-                                    ySelect.multiple = true;
-                                    ySelect.style.cssText = 'padding: 4px; border-radius: 4px; background: #1e1e2e; color: white; border: 1px solid #3b82f6; min-width: 120px; max-height: 60px;';
-                                    const defaultY = [{default_y_str}];
-                                    [{y_opts_str}].forEach(col => {{
-                                        const opt = document.createElement('option');
-                                        opt.value = col;
-                                        opt.textContent = col;
-                                        if (defaultY.includes(col)) opt.selected = true;
-                                        ySelect.appendChild(opt);
-                                    }});
+                                    const chartType = chartTypeSelect.value;
+                                    const xCol = xSelect.value;
+                                    const ySelected = Array.from(ySelect.selectedOptions).map(o => o.value);
 
-                                    // Update button
-                                    const updateBtn = document.createElement('button');
-                                    updateBtn.textContent = '🔄 Update';
-                                    updateBtn.style.cssText = 'padding: 4px 12px; border-radius: 4px; background: #3b82f6; color: white; border: none; cursor: pointer;';
-                                    updateBtn.onmouseover = () => updateBtn.style.background = '#2563eb';
-                                    updateBtn.onmouseout = () => updateBtn.style.background = '#3b82f6';
-
-                                    controlsDiv.appendChild(chartTypeLabel);
-                                    controlsDiv.appendChild(chartTypeSelect);
-                                    controlsDiv.appendChild(xLabel);
-                                    controlsDiv.appendChild(xSelect);
-                                    controlsDiv.appendChild(yLabel);
-                                    controlsDiv.appendChild(ySelect);
-                                    controlsDiv.appendChild(updateBtn);
-
-                                    // Plot container
-                                    const plotDiv = document.createElement('div');
-                                    plotDiv.id = 'plot-{card_id}';
-                                    plotDiv.style.cssText = 'flex: 1; min-height: 250px; width: 100%;';
-
-                                    bodyEl.innerHTML = '';
-                                    bodyEl.style.cssText = 'display: flex; flex-direction: column; height: 100%; padding: 8px;';
-                                    bodyEl.appendChild(controlsDiv);
-                                    bodyEl.appendChild(plotDiv);
-
-                                    // Function to update plot
-                                    function updatePlot() {{
-                                        const data = window.vizData['{card_id}'];
-                                        if (!data) return;
-
-                                        const chartType = chartTypeSelect.value;
-                                        const xCol = xSelect.value;
-                                        const ySelected = Array.from(ySelect.selectedOptions).map(o => o.value);
-
-                                        if (ySelected.length === 0) {{
-                                            plotDiv.innerHTML = '<p style="color: #ef4444; padding: 20px;">Please select at least one Y axis column</p>';
-                                            return;
-                                        }}
+                                    const selection = JSON.stringify([chartType, xCol, ySelected]);
+                                    if (selection === lastSelection) return;
+                                    lastSelection = selection;
 
-                                        const traces = [];
-                                        const xData = data[xCol] || [];
-
-                                        ySelected.forEach((yCol, idx) => {{
-                                            const yData = (data[yCol] || []).map(v => v === null ? null : parseFloat(v));
-                                            const colors = ['#3b82f6', '#10b981', '#f59e0b', '#ec4899', '#8b5cf6'];
-
-                                            if (chartType === 'line') {{
-                                                traces.push({{
-                                                    x: xData,
-                                                    y: yData,
-                                                    type: 'scatter',
-                                                    mode: 'lines+markers',
-                                                    name: yCol,
-                                                    line: {{ width: 2, color: colors[idx % colors.length] }}
-                                                }});
-                                            }} else if (chartType === 'scatter') {{
-                                                traces.push({{
-                                                    x: xData,
-                                                    y: yData,
-                                                    type: 'scatter',
-                                                    mode: 'markers',
-                                                    name: yCol,
-                                                    marker: {{ color: colors[idx % colors.length] }}
-                                                }});
-                                            }} else if (chartType === 'bar') {{
-                                                traces.push({{
-                                                    x: xData,
-                                                    y: yData,
-                                                    type: 'bar',
-                                                    name: yCol,
-                                                    marker: {{ color: colors[idx % colors.length] }}
-                                                }});
-                                            }} else if (chartType === 'area') {{
-                                                traces.push({{
-                                                    x: xData,
-                                                    y: yData,
-                                                    type: 'scatter',
-                                                    mode: 'lines',
-                                                    fill: 'tozeroy',
-                                                    name: yCol,
-                                                    line: {{ width: 2, color: colors[idx % colors.length] }}
-                                                }});
-                                            }}
-                                        }});
-
-                                        const layout = {{
-                                            title: {{ text: '{Path(file_key).name}', font: {{ color: 'white' }} }},
-                                            paper_bgcolor: '#1e1e2e',
-                                            plot_bgcolor: '#1e1e2e',
-                                            xaxis: {{
-                                                title: {{ text: xCol, font: {{ color: 'white' }} }},
-                                                gridcolor: '#374151',
-                                                tickfont: {{ color: 'white' }}
-                                            }},
-                                            yaxis: {{
-                                                title: {{ text: ySelected.length <= 2 ? ySelected.join(', ') : 'Values', font: {{ color: 'white' }} }},
-                                                gridcolor: '#374151',
-                                                tickfont: {{ color: 'white' }}
-                                            }},
-                                            legend: {{ font: {{ color: 'white' }} }},
-                                            margin: {{ t: 40, b: 50, l: 60, r: 20 }},
-                                            autosize: true
-                                        }};
-
-                                        Plotly.newPlot(plotDiv, traces, layout, {{ responsive: true }});
+                                    if (ySelected.length === 0) {{
+                                        Plotly.purge(plotDiv);
+                                        plotDiv.innerHTML = '<p style="color: #ef4444; padding: 20px;">Please select at least one Y axis column</p>';
+                                        return;
+                                    }}
+                                    if (!plotDiv.data) {{
+                                        plotDiv.innerHTML = '';
                                     }}
 
-                                    // Bind update event
-                                    updateBtn.onclick = updatePlot;
-                                    chartTypeSelect.onchange = updatePlot;
-                                    xSelect.onchange = updatePlot;
-                                    ySelect.onchange = updatePlot;
-
-                                    // Initial plot
-                                    setTimeout(updatePlot, 100);
-
-                                    // Handle resize
-                                    const resizeObserver = new ResizeObserver(() => {{
-                                        const plotEl = document.getElementById('plot-{card_id}');
-                                        if (plotEl && plotEl.data) {{
-                                            Plotly.Plots.resize(plotEl);
+                                    const traces = [];
+                                    const xData = data[xCol] || [];
+                                    // WebGL draws large series far faster than SVG, but browsers cap the
+                                    // number of live WebGL contexts, so small cards stay on SVG
+                                    const scatterType = xData.length > {VIZ_WEBGL_THRESHOLD} ? 'scattergl' : 'scatter';
+
+                                    ySelected.forEach((yCol, idx) => {{
+                                        const yData = numericColumn(yCol);
+
+                                        if (chartType === 'line') {{
+                                            traces.push({{
+                                                x: xData,
+                                                y: yData,
+                                                type: scatterType,
+                                                mode: 'lines+markers',
+                                                name: yCol,
+                                                line: {{ width: 2, color: colors[idx % colors.length] }}
+                                            }});
+                                        }} else if (chartType === 'scatter') {{
+                                            traces.push({{
+                                                x: xData,
+                                                y: yData,
+                                                type: scatterType,
+                                                mode: 'markers',
+                                                name: yCol,
+                                                marker: {{ color: colors[idx % colors.length] }}
+                                            }});
+                                        }} else if (chartType === 'bar') {{
+                                            traces.push({{
+                                                x: xData,
+                                                y: yData,
+                                                type: 'bar',
+                                                name: yCol,
+                                                marker: {{ color: colors[idx % colors.length] }}
+                                            }});
+                                        }} else if (chartType === 'area') {{
+                                            traces.push({{
+                                                x: xData,
+                                                y: yData,
+                                                type: scatterType,
+                                                mode: 'lines',
+                                                fill: 'tozeroy',
+                                                name: yCol,
+                                                line: {{ width: 2, color: colors[idx % colors.length] }}
+                                            }});
                                         }}
                                     }});
-                                    resizeObserver.observe(bodyEl);
-                                }})();
-                                '''
-                                ui.run_javascript(js_code)
-                                ui.notify(f"Visualization card created for {Path(file_key).name}", type="positive")
 
-                            except Exception as e:
-                                logger.error(f"Error populating viz card: {e}", exc_info=True)
+                                    const layout = {{
+                                        title: {{ text: '{file_name}', font: {{ color: 'white' }} }},
+                                        paper_bgcolor: '#1e1e2e',
+                                        plot_bgcolor: '#1e1e2e',
+                                        xaxis: {{
+                                            title: {{ text: xCol, font: {{ color: 'white' }} }},
+                                            gridcolor: '#374151',
+                                            tickfont: {{ color: 'white' }}
+                                        }},
+                                        yaxis: {{
+                                            title: {{ text: ySelected.length <= 2 ? ySelected.join(', ') : 'Values', font: {{ color: 'white' }} }},
+                                            gridcolor: '#374151',
+                                            tickfont: {{ color: 'white' }}
+                                        }},
+                                        legend: {{ font: {{ color: 'white' }} }},
+                                        margin: {{ t: 40, b: 50, l: 60, r: 20 }},
+                                        autosize: true
+                                    }};
+
+                                    // react() diffs against the current plot and only redraws what changed
+                                    Plotly.react(plotDiv, traces, layout, {{ responsive: true }});
+                                }}
+
+                                // Bind update event
+                                updateBtn.onclick = updatePlot;
+                                chartTypeSelect.onchange = updatePlot;
+                                xSelect.onchange = updatePlot;
+                                ySelect.onchange = updatePlot;
+
+                                // Initial plot
+                                setTimeout(updatePlot, 100);
+
+                                // Handle resize: the observer fires on every frame of a drag, so only
+                                // relayout when the body's size actually changed, at most once per frame
+                                let lastSize = '';
+                                let resizePending = false;
+                                const resizeObserver = new ResizeObserver(entries => {{
+                                    const rect = entries[entries.length - 1].contentRect;
+                                    const size = Math.round(rect.width) + 'x' + Math.round(rect.height);
+                                    if (size === lastSize) return;
+                                    lastSize = size;
+                                    if (resizePending) return;
+                                    resizePending = true;
+                                    requestAnimationFrame(() => {{
+                                        resizePending = false;
+                                        if (plotDiv.data) {{
+                                            Plotly.Plots.resize(plotDiv);
+                                        }}
+                                    }});
+                                }});
+                                resizeObserver.observe(bodyEl);
+                            }})();
+                            '''
+                            ui.run_javascript(js_code)
+                            ui.notify(f"Visualization card created for {file_name}", type="positive")
 
-                        # Delay to allow JS card creation
-                        ui.timer(0.3, populate_viz_card, once=True)
+                        except Exception as e:
+                            logger.error(f"Error populating viz card: {e}", exc_info=True)
 
-                    finally:
-                        try:
-                            os.unlink(temp_file.name)
-                        except:
-                            pass
+                    # Delay to allow JS card creation
+                    ui.timer(0.3, populate_viz_card, once=True)
 
                 except Exception as e:
                     logger.error(f"Error showing visualizer: {e}", exc_info=True)
                     ui.notify(f"Error: {str(e)}", type="negative")
             
-            def refresh_storage():
-                """Refresh storage browser."""
+            def refresh_storage(rescan: bool = False):
+                """Refresh storage browser (rescan re-reads every file size)."""
                 logger.debug("[refresh_storage] Starting storage refresh")
                 try:
                     app = get_app_instance()
@@ -707,68 +1151,26 @@ def create_storage_card(panels_grid):
                         return
 
                     if app.storage:
-                        keys = app.storage.list_keys()[:100]
+                        keys = app.storage.list_keys(limit=100)
                         logger.info(f"[refresh_storage] Found {len(keys)} files in storage")
                         rows = []
 
-                        storage_files_container.clear()
-
                         if not keys:
                             logger.debug("[refresh_storage] Storage is empty")
-                            with storage_files_container:
-                                ui.label("No files in storage").classes("text-gray-500")
                         
+                        sizes = _storage_sizes(app.storage, keys, rescan=rescan)
                         for k in keys:
-                            file_type = k.split('.')[-1].upper() if '.' in k else 'DATA'
+                            file_type = PurePosixPath(k).suffix[1:].upper() or 'DATA'
                             
-                            size_bytes = app.storage.get_size(k)
-                            if size_bytes is not None:
-                                if size_bytes >= 1024 * 1024 * 1024:
-                                    size_str = f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
-                                elif size_bytes >= 1024 * 1024:
-                                    size_str = f"{size_bytes / (1024 * 1024):.2f} MB"
-                                elif size_bytes >= 1024:
-                                    size_str = f"{size_bytes / 1024:.2f} KB"
-                                else:
-                                    size_str = f"{size_bytes} B"
-                            else:
-                                try:
-                                    file_data = app.storage.load(k)
-                                    size_bytes = len(file_data) if file_data else 0
-                                    if size_bytes >= 1024 * 1024:
-                                        size_str = f"{size_bytes / (1024 * 1024):.2f} MB"
-                                    elif size_bytes >= 1024:
-                                        size_str = f"{size_bytes / 1024:.2f} KB"
-                                    else:
-                                        size_str = f"{size_bytes} B"
-                                except:
-                                    size_str = "N/A"
+                            size_bytes = sizes[k]
+                            # Don't download the whole object just to measure it
+                            size_str = _fmt_size(size_bytes) if size_bytes is not None else "N/A"
                             
                             rows.append({
                                 "key": k,
                                 "size": size_str,
                                 "type": file_type
                             })
-                            
-                            with storage_files_container:
-                                with ui.card().classes("w-full p-3 hover:bg-gray-50"):
-                                    with ui.row().classes("w-full items-center justify-between"):
-                                        with ui.column().classes("flex-1"):
-                                            ui.label(Path(k).name).classes("font-semibold")
-                                            with ui.row().classes("gap-4 text-xs text-gray-500 mt-1"):
-                                                ui.label(f"Size: {size_str}")
-                                                ui.label(f"Type: {file_type}")
-                                                ui.label(f"Key: {k}").classes("text-xs font-mono")
-                                        
-                                        def make_download_handler(file_key=k):
-                                            return lambda: show_download_format_dialog(file_key)
-
-                                        def make_edit_handler(file_key=k):
-                                            return lambda: show_data_editor(file_key)
-
-                                        with ui.row().classes("gap-2"):
-                                            ui.button("📥 Download", icon="download", on_click=make_download_handler(k)).props("size=sm color=primary")
-                                            ui.button("✏️ Edit", icon="edit", on_click=make_edit_handler(k)).props("size=sm color=secondary")
                         
                         storage_table.rows = rows
                         ui.notify("Storage refreshed", type="info")
@@ -776,5 +1178,11 @@ def create_storage_card(panels_grid):
                     logger.error(f"Error refreshing storage: {e}")
                     ui.notify(f"Error: {str(e)}", type="negative")
             
-            refresh_storage_button.on_click(refresh_storage)
+            storage_table.on("download", lambda e: show_download_format_dialog(e.args))
+            storage_table.on("edit", lambda e: show_data_editor(e.args))
+            # The button also picks up size changes made outside this process
+            refresh_storage_button.on_click(lambda: refresh_storage(rescan=True))
             refresh_storage()
+
+            # Batch-delete temp files queued by the dialogs above
+            ui.timer(TEMP_GC_INTERVAL, _gc_temps)
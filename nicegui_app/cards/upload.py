@@ -372,13 +372,12 @@ def create_upload_card(panels_grid, refresh_callbacks=None):
                         if format_selector.value != "Auto-detect":
                             file_format = format_selector.value
                         
-                        keys_before = set(app.storage.list_keys() if app.storage else [])
+                        seq_before = app.storage.current_seq() if app.storage else 0
                         logger.info(f"Processing file: {file_name}, type: {record_type.value}, format: {file_format}")
                         
                         success = app.process_data_file(temp_path, record_type.value, file_format=file_format)
                         
-                        keys_after = set(app.storage.list_keys() if app.storage else [])
-                        new_keys = list(keys_after - keys_before)
+                        new_keys = app.storage.keys_added_since(seq_before) if app.storage else []
                         
                         progress_card.delete()
                         
@@ -6,6 +6,7 @@ import json
 import os
 import tempfile
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 from nicegui import ui
@@ -283,6 +284,14 @@ def show_download_dialog():
                     ui.label("ℹ️ How to Use").classes("font-semibold text-green-800 mb-1")
                     ui.label("Browse APIs by category using the tabs below. Each API card shows free tier limits, real-time capabilities, historical depth, and data types. Click 'Use This API' to automatically configure the API preset in the form.").classes("text-sm text-green-700")
                 
+                def select_api(api_name):
+                    source_type_select.value = "API (Requires Key)"
+                    if api_name in api_presets:
+                        api_preset_select.value = api_name
+                        apply_preset()
+                    api_browser_container.visible = False
+                    api_form_container.visible = True
+                
                 # Category tabs
                 with ui.tabs().classes("w-full mb-4") as category_tabs:
                     financial_tab = ui.tab("Financial")
@@ -305,16 +314,7 @@ def show_download_dialog():
                                     ui.label(f"Data Types: {api['data_types']}").classes("text-sm text-gray-600 mt-1")
                                     ui.label(f"Note: {api['note']}").classes("text-xs text-gray-500 mt-1")
                                     ui.label(f"Website: {api['website']}").classes("text-xs text-blue-500 mt-1")
-                                    def make_select_handler(api_name):
-                                        def handler():
-                                            source_type_select.value = "API (Requires Key)"
-                                            if api_name in api_presets:
-                                                api_preset_select.value = api_name
-                                                apply_preset()
-                                            api_browser_container.visible = False
-                                            api_form_container.visible = True
-                                        return handler
-                                    ui.button("Use This API", icon="arrow_forward", on_click=make_select_handler(api["name"])).classes("mt-2").props("flat size=sm")
+                                    ui.button("Use This API", icon="arrow_forward", on_click=partial(select_api, api["name"])).classes("mt-2").props("flat size=sm")
                     
                     # Weather APIs panel
                     with ui.tab_panel(weather_tab):
@@ -329,16 +329,7 @@ def show_download_dialog():
                                     ui.label(f"Data Types: {api['data_types']}").classes("text-sm text-gray-600 mt-1")
                                     ui.label(f"Note: {api['note']}").classes("text-xs text-gray-500 mt-1")
                                     ui.label(f"Website: {api['website']}").classes("text-xs text-blue-500 mt-1")
-                                    def make_select_handler(api_name):
-                                        def handler():
-                                            source_type_select.value = "API (Requires Key)"
-                                            if api_name in api_presets:
-                                                api_preset_select.value = api_name
-                                                apply_preset()
-                                            api_browser_container.visible = False
-                                            api_form_container.visible = True
-                                        return handler
-                                    ui.button("Use This API", icon="arrow_forward", on_click=make_select_handler(api["name"])).classes("mt-2").props("flat size=sm")
+                                    ui.button("Use This API", icon="arrow_forward", on_click=partial(select_api, api["name"])).classes("mt-2").props("flat size=sm")
                     
                     # Economic APIs panel
                     with ui.tab_panel(economic_tab):
@@ -353,16 +344,7 @@ def show_download_dialog():
                                     ui.label(f"Data Types: {api['data_types']}").classes("text-sm text-gray-600 mt-1")
                                     ui.label(f"Note: {api['note']}").classes("text-xs text-gray-500 mt-1")
                                     ui.label(f"Website: {api['website']}").classes("text-xs text-blue-500 mt-1")
-                                    def make_select_handler(api_name):
-                                        def handler():
-                                            source_type_select.value = "API (Requires Key)"
-                                            if api_name in api_presets:
-                                                api_preset_select.value = api_name
-                                                apply_preset()
-                                            api_browser_container.visible = False
-                                            api_form_container.visible = True
-                                        return handler
-                                    ui.button("Use This API", icon="arrow_forward", on_click=make_select_handler(api["name"])).classes("mt-2").props("flat size=sm")
+                                    ui.button("Use This API", icon="arrow_forward", on_click=partial(select_api, api["name"])).classes("mt-2").props("flat size=sm")
                     
                     # Crypto APIs panel
                     with ui.tab_panel(crypto_tab):
@@ -377,16 +359,7 @@ def show_download_dialog():
                                     ui.label(f"Data Types: {api['data_types']}").classes("text-sm text-gray-600 mt-1")
                                     ui.label(f"Note: {api['note']}").classes("text-xs text-gray-500 mt-1")
                                     ui.label(f"Website: {api['website']}").classes("text-xs text-blue-500 mt-1")
-                                    def make_select_handler(api_name):
-                                        def handler():
-                                            source_type_select.value = "API (Requires Key)"
-                                            if api_name in api_presets:
-                                                api_preset_select.value = api_name
-                                                apply_preset()
-                                            api_browser_container.visible = False
-                                            api_form_container.visible = True
-                                        return handler
-                                    ui.button("Use This API", icon="arrow_forward", on_click=make_select_handler(api["name"])).classes("mt-2").props("flat size=sm")
+                                    ui.button("Use This API", icon="arrow_forward", on_click=partial(select_api, api["name"])).classes("mt-2").props("flat size=sm")
                     
                     # Open Data Platforms panel
                     with ui.tab_panel(open_data_tab):
@@ -401,14 +374,7 @@ def show_download_dialog():
                                     ui.label(f"Data Types: {api['data_types']}").classes("text-sm text-gray-600 mt-1")
                                     ui.label(f"Note: {api['note']}").classes("text-xs text-gray-500 mt-1")
                                     ui.label(f"Website: {api['website']}").classes("text-xs text-blue-500 mt-1")
-                                    def select_api(api_name=api["name"]):
-                                        source_type_select.value = "API (Requires Key)"
-                                        if api_name in api_presets:
-                                            api_preset_select.value = api_name
-                                            apply_preset()
-                                        api_browser_container.visible = False
-                                        api_form_container.visible = True
-                                    ui.button("Use This API", icon="arrow_forward", on_click=lambda n=api["name"]: select_api(n)).classes("mt-2").props("flat size=sm")
+                                    ui.button("Use This API", icon="arrow_forward", on_click=partial(select_api, api["name"])).classes("mt-2").props("flat size=sm")
                 
                 ui.separator().classes("my-4")
                 ui.label("💡 Tip: Click 'Use This API' to automatically configure the API preset, or see API_SOURCES.md for detailed documentation.").classes("text-sm text-blue-600")
@@ -2,7 +2,6 @@
 NiceGUI App ECharts Visualization Functions
 ECharts-based plotting functions for time-series and financial data.
 """
-import json
 from typing import Optional, Tuple, List, Dict, Any
 
 import pandas as pd
@@ -14,6 +13,7 @@ from .visualization import (
     is_financial_data,
     get_available_metrics,
     extract_ohlcv_data,
+    dumps_chart_config,
 )
 
 logger = get_logger()
@@ -436,7 +436,7 @@ def echarts_config_to_html(chart_config: Dict[str, Any], container_id: str = "ec
     if not ECHARTS_AVAILABLE or chart_config is None:
         return f"<div id='{container_id}'>ECharts not available</div>"
     
-    config_json = json.dumps(chart_config, default=str, ensure_ascii=False)
+    config_json = dumps_chart_config(chart_config)
     
     html = f"""
     <div id="{container_id}" style="width: 100%; height: 500px;"></div>
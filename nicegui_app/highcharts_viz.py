@@ -2,7 +2,6 @@
 NiceGUI App Highcharts Visualization Functions
 Highcharts-based plotting functions for time-series and financial data.
 """
-import json
 from typing import Optional, Tuple, List, Dict, Any
 
 import pandas as pd
@@ -14,6 +13,7 @@ from .visualization import (
     is_financial_data,
     get_available_metrics,
     extract_ohlcv_data,
+    dumps_chart_config,
 )
 
 logger = get_logger()
@@ -366,7 +366,7 @@ def highcharts_config_to_html(chart_config: Dict[str, Any], container_id: str =
     if not HIGHCHARTS_AVAILABLE or chart_config is None:
         return f"<div id='{container_id}'>Highcharts not available</div>"
     
-    config_json = json.dumps(chart_config, default=str)
+    config_json = dumps_chart_config(chart_config)
     
     html = f"""
     <div id="{container_id}" style="width: 100%; height: 500px;"></div>
@@ -4,12 +4,22 @@ Manages shared UI state across modules.
 """
 from typing import Optional, Dict, Any, List
 from threading import Lock
+from types import SimpleNamespace
 
 from logger import get_logger
 
 logger = get_logger()
 
 
+class StateSnapshot(SimpleNamespace):
+    """Components and state values under one key prefix; missing keys read as None."""
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return None
+
+
 class UIState:
     """Manages shared UI state across NiceGUI app modules."""
     
@@ -55,6 +65,24 @@ class UIState:
             self._state.update(updates)
             logger.debug(f"Updated state: {list(updates.keys())}")
     
+    def snapshot(self, prefix: str) -> StateSnapshot:
+        """
+        Get every component and state value under a key prefix in one call.
+
+        Args:
+            prefix: Key prefix without the trailing dot, e.g. "dashboard"
+
+        Returns:
+            Namespace keyed by the rest of each key ("dashboard.series_select"
+            becomes .series_select); state values win over components on clashes
+        """
+        start = prefix + "."
+        cut = len(start)
+        with self._lock:
+            values = {k[cut:]: v for k, v in self._ui_components.items() if k.startswith(start)}
+            values.update((k[cut:], v) for k, v in self._state.items() if k.startswith(start))
+        return StateSnapshot(**values)
+    
     def set_preference(self, key: str, value: Any) -> None:
         """Set a user preference."""
         with self._lock:
@@ -0,0 +1,196 @@
+"""
+Static file serving for NiceGUI app.
+Files are read and compressed once, then served from memory with a gzip/brotli
+variant when the client accepts it; each variant has its own ETag. URLs
+carrying a content version (?v=...) are cached as immutable; plain URLs are
+revalidated.
+"""
+import gzip
+import hashlib
+import mimetypes
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response
+from nicegui import app
+
+from logger import get_logger
+
+logger = get_logger()
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+STATIC_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Unversioned URLs may point at changed content, so browsers revalidate them (304 via ETag)
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Text formats worth compressing; images and fonts are already compressed
+COMPRESSIBLE_SUFFIXES = {".css", ".js", ".mjs", ".json", ".map", ".svg", ".html", ".txt", ".xml", ".ico"}
+
+# Larger files are streamed from disk instead of being held in memory
+MAX_CACHED_BYTES = 4 * 1024 * 1024
+
+
+class _StaticAsset(NamedTuple):
+    """A static file as it is served, plus the stat it was read with."""
+    mtime_ns: int
+    size: int
+    etag: str
+    media_type: str
+    data: bytes
+    gzip: Optional[bytes]
+    br: Optional[bytes]
+
+
+def precompress(data: bytes) -> Tuple[bytes, Optional[bytes]]:
+    """
+    Compress a response body once for every client that will fetch it.
+
+    Returns:
+        (gzip body, brotli body or None when brotli is not installed)
+    """
+    gzipped = gzip.compress(data, compresslevel=9)
+    compressed = brotli.compress(data, quality=11) if BROTLI_AVAILABLE else None
+    return gzipped, compressed
+
+
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """
+    Parse an Accept-Encoding header into {coding: q-value}.
+
+    Codings without a q parameter get 1.0; a malformed q counts as 0.
+    """
+    accepted: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value.strip())
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def _pick_encoding(accept_encoding: str, gzip_available: bool, br_available: bool) -> Optional[str]:
+    """
+    Choose "br" or "gzip" for the response, or None for the identity body.
+
+    Codings the client lists with q=0 (directly or through "*") are never
+    picked; among acceptable ones the higher q wins, brotli on a tie.
+    """
+    accepted = _accepted_encodings(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding, available in (("br", br_available), ("gzip", gzip_available)):
+        q = accepted.get(coding, wildcard)
+        if available and q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def _variant_etag(etag: str, coding: Optional[str]) -> str:
+    """Entity-tag of one encoding of a body, e.g. '"abc"' -> '"abc-br"'."""
+    return f'{etag[:-1]}-{coding}"' if coding else etag
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak If-None-Match comparison of a list of entity-tags against etag."""
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def encoded_response(
+    request: Request,
+    data: bytes,
+    gzipped: Optional[bytes],
+    compressed: Optional[bytes],
+    media_type: str,
+    headers: Dict[str, str],
+    etag: Optional[str] = None,
+) -> Response:
+    """
+    Send the brotli, gzip or identity body, whichever the client accepts.
+
+    With etag, each encoding is tagged separately and a matching
+    If-None-Match gets a 304.
+    """
+    headers = dict(headers)
+    if gzipped is not None:
+        headers["Vary"] = "Accept-Encoding"
+    coding = _pick_encoding(
+        request.headers.get("accept-encoding", ""), gzipped is not None, compressed is not None
+    )
+    body = {"br": compressed, "gzip": gzipped}.get(coding, data)
+    if etag is not None:
+        headers["ETag"] = _variant_etag(etag, coding)
+        if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+    if coding:
+        headers["Content-Encoding"] = coding
+    return Response(body, media_type=media_type, headers=headers)
+
+
+def _load_asset(path: Path, mtime_ns: int, size: int) -> _StaticAsset:
+    """Read a static file and precompress it if it is a text format."""
+    data = path.read_bytes()
+    gzipped = compressed = None
+    if path.suffix.lower() in COMPRESSIBLE_SUFFIXES:
+        gzipped, compressed = precompress(data)
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    etag = '"' + hashlib.blake2b(data, digest_size=8).hexdigest() + '"'
+    return _StaticAsset(mtime_ns, size, etag, media_type, data, gzipped, compressed)
+
+
+def register_static_files(url_path: str, directory: Path) -> None:
+    """
+    Serve a directory under url_path (replacement for app.add_static_files).
+
+    Args:
+        url_path: URL prefix, e.g. "/static"
+        directory: Directory holding the files
+    """
+    root = Path(directory).resolve()
+    assets: Dict[Path, _StaticAsset] = {}
+
+    # Precompress everything that is already there at startup
+    for path in root.rglob("*"):
+        if path.is_file():
+            stat = path.stat()
+            if stat.st_size <= MAX_CACHED_BYTES:
+                assets[path] = _load_asset(path, stat.st_mtime_ns, stat.st_size)
+    logger.debug(f"[register_static_files] Cached {len(assets)} files from {root}")
+
+    @app.get(url_path.rstrip("/") + "/{file_path:path}", include_in_schema=False)
+    def static_file(file_path: str, request: Request):
+        path = (root / file_path).resolve()
+        if root not in path.parents or not path.is_file():
+            return Response(status_code=404)
+
+        cache_control = STATIC_CACHE_CONTROL if "v" in request.query_params else REVALIDATE_CACHE_CONTROL
+        stat = path.stat()
+        if stat.st_size > MAX_CACHED_BYTES:
+            return FileResponse(path, headers={"Cache-Control": cache_control})
+
+        # A changed file (new mtime or size) is re-read and recompressed
+        asset = assets.get(path)
+        if asset is None or (asset.mtime_ns, asset.size) != (stat.st_mtime_ns, stat.st_size):
+            asset = assets[path] = _load_asset(path, stat.st_mtime_ns, stat.st_size)
+
+        headers = {"Cache-Control": cache_control}
+        return encoded_response(
+            request, asset.data, asset.gzip, asset.br, asset.media_type, headers, etag=asset.etag
+        )
@@ -2,25 +2,22 @@
 NiceGUI App Visualization Functions
 Plotting functions for time-series and financial data.
 """
+import base64
 import json
+import logging
+from io import BytesIO
 from typing import Optional, Tuple, List, Dict, Any
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 from logger import get_logger
-from . import get_app_instance, MATPLOTLIB_AVAILABLE
+from . import get_app_instance, get_matplotlib, MATPLOTLIB_AVAILABLE
 
 logger = get_logger()
 
-# Matplotlib imports
-if MATPLOTLIB_AVAILABLE:
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    from io import BytesIO
-    import base64
-
 
 def load_timeseries_data() -> Tuple[Optional[pd.DataFrame], List[Dict[str, Any]]]:
     """Load time-series data from storage."""
@@ -32,7 +29,7 @@ def load_timeseries_data() -> Tuple[Optional[pd.DataFrame], List[Dict[str, Any]]
             return None, []
 
         # Load all records from storage
-        keys = app.storage.list_keys("data/")[:10000]  # Increased limit for better visualization
+        keys = app.storage.list_keys("data/", limit=10000)  # Increased limit for better visualization
         logger.info(f"[load_timeseries_data] Found {len(keys)} keys in storage with prefix 'data/'")
 
         if not keys:
@@ -213,9 +210,10 @@ def load_timeseries_from_storage_file(storage_key: str) -> Tuple[Optional[pd.Dat
                 logger.warning(f"[load_timeseries_from_storage_file] No valid data points after processing: {storage_key}")
                 return None, []
 
-            # Log available numeric columns for plotting
-            numeric_cols = list(df.select_dtypes(include=['number']).columns)
-            logger.debug(f"[load_timeseries_from_storage_file] Numeric columns available for plotting: {numeric_cols}")
+            # Log available numeric columns for plotting (the dtype scan only feeds this log line)
+            if logger.isEnabledFor(logging.DEBUG):
+                numeric_cols = list(df.select_dtypes(include=['number']).columns)
+                logger.debug(f"[load_timeseries_from_storage_file] Numeric columns available for plotting: {numeric_cols}")
 
             logger.info(f"[load_timeseries_from_storage_file] Ready to visualize {len(df)} data points")
             return df, records
@@ -354,9 +352,10 @@ def load_timeseries_from_file(file_path: str) -> Tuple[Optional[pd.DataFrame], L
         else:
             logger.info(f"[load_timeseries_from_file] Successfully loaded {len(df)} records (no timestamp column)")
 
-        # Log available numeric columns for plotting
-        numeric_cols = list(df.select_dtypes(include=['number']).columns)
-        logger.debug(f"[load_timeseries_from_file] Numeric columns available for plotting: {numeric_cols}")
+        # Log available numeric columns for plotting (the dtype scan only feeds this log line)
+        if logger.isEnabledFor(logging.DEBUG):
+            numeric_cols = list(df.select_dtypes(include=['number']).columns)
+            logger.debug(f"[load_timeseries_from_file] Numeric columns available for plotting: {numeric_cols}")
 
         return df, records
 
@@ -377,29 +376,27 @@ def is_financial_data(df: Optional[pd.DataFrame], series_id: Optional[str] = Non
     if df is None or len(df) == 0:
         return False
     
-    # Filter by series if specified
+    # Positions of the series' rows (no filtered copy of the frame)
     if series_id and 'series_id' in df.columns:
-        check_df = df[df['series_id'] == series_id]
+        positions = np.flatnonzero((df['series_id'] == series_id).to_numpy())
+        if len(positions) == 0:
+            return False
     else:
-        check_df = df
-    
-    if len(check_df) == 0:
-        return False
+        positions = None
     
     # Check for direct OHLCV columns
     ohlcv_cols = ['open', 'high', 'low', 'close']
-    has_direct_ohlcv = all(col in check_df.columns for col in ohlcv_cols)
+    has_direct_ohlcv = all(col in df.columns for col in ohlcv_cols)
+    if has_direct_ohlcv or 'measurements' not in df.columns:
+        return has_direct_ohlcv
     
-    # Check for OHLCV in measurements
-    has_measurements_ohlcv = False
-    for idx, row in check_df.head(10).iterrows():  # Check first 10 rows
-        if 'measurements' in row and isinstance(row['measurements'], dict):
-            measurements = row['measurements']
-            if all(key in measurements for key in ohlcv_cols):
-                has_measurements_ohlcv = True
-                break
-    
-    return has_direct_ohlcv or has_measurements_ohlcv
+    # Check for OHLCV in measurements of the first 10 rows
+    measurements_col = df['measurements']
+    sample = measurements_col.iloc[:10] if positions is None else measurements_col.iloc[positions[:10]]
+    return any(
+        isinstance(measurements, dict) and all(key in measurements for key in ohlcv_cols)
+        for measurements in sample
+    )
 
 
 def get_available_metrics(df: Optional[pd.DataFrame], series_id: Optional[str] = None) -> List[str]:
@@ -426,12 +423,91 @@ def get_available_metrics(df: Optional[pd.DataFrame], series_id: Optional[str] =
     return sorted(list(metrics))
 
 
+def extract_metric_values(df: pd.DataFrame, metric: str) -> pd.Series:
+    """
+    Get one metric for every row, preferring the measurements dict over a flat column.
+
+    Args:
+        df: Time-series rows
+        metric: Metric name
+
+    Returns:
+        Series aligned with df; missing values are None/NaN
+    """
+    if metric in df.columns:
+        values = df[metric]
+    else:
+        values = pd.Series(None, index=df.index, dtype=object)
+
+    if 'measurements' in df.columns:
+        measurements = df['measurements']
+        is_dict = measurements.map(lambda m: isinstance(m, dict)).astype(bool)
+        if is_dict.any():
+            nested = measurements.map(lambda m: m.get(metric) if isinstance(m, dict) else None)
+            values = nested.where(is_dict, values)
+
+    return values.infer_objects()
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Pick the rows to keep when downsampling a series with Largest-Triangle-Three-Buckets.
+
+    Args:
+        x: Monotonic x values (e.g. int64 nanosecond timestamps)
+        y: Values to preserve the shape of
+        n_out: Number of points to keep
+
+    Returns:
+        Sorted row positions, always including the first and last row
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    try:
+        from tsdownsample import LTTBDownsampler
+        return np.asarray(LTTBDownsampler().downsample(x, y, n_out=n_out))
+    except ImportError:
+        pass
+    except Exception as e:
+        logger.debug(f"[lttb_indices] tsdownsample failed, using NumPy fallback: {e}")
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    edges[-1] = n - 1
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start = end
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        next_y = y[next_start:next_end]
+        next_y = next_y[~np.isnan(next_y)]
+        avg_y = next_y.mean() if len(next_y) else y[a]
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        area = np.nan_to_num(area, nan=-1.0)
+        a = start + int(np.argmax(area))
+        out[i + 1] = a
+
+    return out
+
+
 def extract_ohlcv_data(df: pd.DataFrame, series_id: Optional[str] = None) -> Dict[str, List]:
     """Extract OHLCV data from DataFrame, handling both direct columns and measurements dict."""
+    # Only read below: the mask and sort_values already return new frames
     if series_id and 'series_id' in df.columns:
-        plot_df = df[df['series_id'] == series_id].copy()
+        plot_df = df[df['series_id'] == series_id]
     else:
-        plot_df = df.copy()
+        plot_df = df
     
     # Sort by timestamp
     if 'timestamp' in plot_df.columns:
@@ -495,10 +571,153 @@ def extract_ohlcv_data(df: pd.DataFrame, series_id: Optional[str] = None) -> Dic
     }
 
 
+def extract_ohlcv_frame(df: pd.DataFrame, series_id: Optional[str] = None) -> pd.DataFrame:
+    """
+    Columnar extract_ohlcv_data: the same rows as a DataFrame.
+
+    Timestamps stay datetime64 and prices float64, with no per-row
+    conversion to ISO strings and Python lists.
+
+    Args:
+        df: Time-series rows
+        series_id: Optional series to keep
+
+    Returns:
+        DataFrame with timestamp, open, high, low, close and volume columns,
+        sorted by timestamp and without rows missing an OHLC value
+    """
+    columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+    if series_id and 'series_id' in df.columns:
+        plot_df = df[df['series_id'] == series_id]
+    else:
+        plot_df = df
+    if 'timestamp' not in plot_df.columns:
+        return pd.DataFrame(columns=columns)
+    plot_df = plot_df.sort_values('timestamp')
+
+    # Direct columns win over the measurements dict when all four are present
+    direct = all(col in plot_df.columns for col in ['open', 'high', 'low', 'close'])
+
+    def values(key: str) -> pd.Series:
+        if direct:
+            series = plot_df[key] if key in plot_df.columns else pd.Series(np.nan, index=plot_df.index)
+        else:
+            series = extract_metric_values(plot_df, key)
+        return pd.to_numeric(series, errors='coerce')
+
+    # 'vol' when set and non-zero, else 'volume', else 0
+    vol = values('vol')
+    volume = vol.where(vol.notna() & (vol != 0), values('volume')).fillna(0)
+
+    frame = pd.DataFrame({
+        'timestamp': pd.to_datetime(plot_df['timestamp']).to_numpy(),
+        'open': values('open').to_numpy(dtype=np.float64),
+        'high': values('high').to_numpy(dtype=np.float64),
+        'low': values('low').to_numpy(dtype=np.float64),
+        'close': values('close').to_numpy(dtype=np.float64),
+        'volume': volume.to_numpy(dtype=np.float64),
+    }, copy=False)
+    return frame.dropna(subset=['open', 'high', 'low', 'close']).reset_index(drop=True)
+
+
+# Rows per series handed to the plotting functions; the browser (or Matplotlib)
+# cannot show more points than this on a card-sized chart anyway
+PLOT_MAX_POINTS = 5000
+
+
+def _resample_ohlcv(df: pd.DataFrame, series_id: Optional[str], n_out: int) -> pd.DataFrame:
+    """Aggregate OHLCV rows into at most about n_out equal-width time bars."""
+    frame = extract_ohlcv_frame(df, series_id)
+    if len(frame) <= n_out:
+        return df
+    # Undated rows cannot be placed in a bar
+    frame = frame.dropna(subset=['timestamp'])
+    if len(frame) <= n_out:
+        return df
+    timestamps = frame['timestamp']
+    span = timestamps.iloc[-1] - timestamps.iloc[0]
+    if span <= pd.Timedelta(0):
+        return df
+    bars = frame.set_index('timestamp').resample(span / n_out).agg(
+        {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}
+    )
+    bars = bars.dropna(subset=['open']).reset_index()
+    if series_id:
+        bars['series_id'] = series_id
+    return bars
+
+
+def _default_plot_values(df: pd.DataFrame) -> Optional[pd.Series]:
+    """The values create_plot shows when no metric is selected, if they can be found."""
+    for metric in ['close', 'value', 'temperature', 'price']:
+        values = pd.to_numeric(extract_metric_values(df, metric), errors='coerce')
+        if values.notna().any():
+            return values
+    return None
+
+
+def downsample_for_plot(
+    df: Optional[pd.DataFrame],
+    series_id: Optional[str] = None,
+    metric: Optional[str] = None,
+    is_financial: bool = False,
+    n_out: int = PLOT_MAX_POINTS
+) -> Optional[pd.DataFrame]:
+    """
+    Thin a frame before plotting so charts stay responsive on long histories.
+
+    Financial data is aggregated into OHLCV bars; other series keep the rows
+    LTTB picks for the plotted metric (or every k-th row if it is unknown).
+
+    Args:
+        df: Time-series rows, sorted by timestamp
+        series_id: Selected series, if any
+        metric: Selected metric, if any
+        is_financial: Whether df holds OHLCV data
+        n_out: Maximum rows per series
+
+    Returns:
+        df itself when it is small enough, otherwise a thinned frame
+    """
+    if df is None or len(df) <= n_out or 'timestamp' not in df.columns:
+        return df
+    if series_id and 'series_id' in df.columns:
+        df = df[df['series_id'] == series_id]
+        if len(df) <= n_out:
+            return df
+    if is_financial:
+        return _resample_ohlcv(df, series_id, n_out)
+
+    timestamps = pd.to_datetime(df['timestamp'], errors='coerce')
+    x_all = timestamps.astype('int64').to_numpy(dtype=np.float64)
+    if metric:
+        y_all = pd.to_numeric(extract_metric_values(df, metric), errors='coerce')
+    else:
+        y_all = _default_plot_values(df)
+    if y_all is not None:
+        y_all = y_all.to_numpy(dtype=np.float64)
+
+    if 'series_id' in df.columns:
+        groups = df.groupby('series_id', sort=False).indices.values()
+    else:
+        groups = [np.arange(len(df))]
+    keep = []
+    for positions in groups:
+        if len(positions) <= n_out:
+            keep.append(positions)
+        elif y_all is None:
+            keep.append(positions[np.linspace(0, len(positions) - 1, n_out).astype(np.int64)])
+        else:
+            keep.append(positions[lttb_indices(x_all[positions], y_all[positions], n_out)])
+    return df.iloc[np.sort(np.concatenate(keep))]
+
+
 def create_matplotlib_financial_plot(df: pd.DataFrame, series_id: Optional[str] = None, chart_type: str = "candlestick", show_volume: bool = True):
     """Create Matplotlib financial chart (candlestick or OHLC) with optional volume subplot."""
     if not MATPLOTLIB_AVAILABLE:
         return None
+    mpl = get_matplotlib()
+    plt, mdates = mpl.plt, mpl.mdates
     
     ohlcv = extract_ohlcv_data(df, series_id)
     
@@ -592,6 +811,8 @@ def create_matplotlib_plot(df: pd.DataFrame, series_id: Optional[str] = None, me
     """Create Matplotlib time-series plot."""
     if not MATPLOTLIB_AVAILABLE:
         return None
+    mpl = get_matplotlib()
+    plt, mdates = mpl.plt, mpl.mdates
     
     if df is None or len(df) == 0:
         fig, ax = plt.subplots(figsize=(12, 6))
@@ -669,19 +890,80 @@ def create_matplotlib_plot(df: pd.DataFrame, series_id: Optional[str] = None, me
     return fig
 
 
-def matplotlib_figure_to_base64(fig) -> str:
-    """Convert matplotlib figure to base64 encoded image."""
+def matplotlib_figure_to_png(fig) -> bytes:
+    """Render matplotlib figure to PNG bytes and close it."""
     if not MATPLOTLIB_AVAILABLE:
-        return ""
-    
+        return b""
+    plt = get_matplotlib().plt
+
     buf = BytesIO()
     fig.savefig(buf, format='png', facecolor='#1e1e1e', dpi=100, bbox_inches='tight')
-    buf.seek(0)
-    img_base64 = base64.b64encode(buf.read()).decode('utf-8')
     plt.close(fig)
+    return buf.getvalue()
+
+
+def matplotlib_figure_to_base64(fig) -> str:
+    """Convert matplotlib figure to base64 encoded image."""
+    if not MATPLOTLIB_AVAILABLE:
+        return ""
+    img_base64 = base64.b64encode(matplotlib_figure_to_png(fig)).decode('utf-8')
     return f"data:image/png;base64,{img_base64}"
 
 
+def dumps_chart_config(config: Dict[str, Any]) -> str:
+    """
+    Serialize a chart configuration for embedding in a script tag.
+
+    Uses orjson when available (NumPy values written directly, NaN as null);
+    anything else neither serializer knows is written as its str().
+    """
+    try:
+        import orjson
+        return orjson.dumps(
+            config, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode('utf-8')
+    except ImportError:
+        return json.dumps(config, default=str, ensure_ascii=False)
+
+
+# Above this many bars, candlestick/OHLC charts are drawn as WebGL line segments
+# instead of one SVG shape per bar
+CANDLE_SEGMENT_THRESHOLD = 2000
+
+
+def _candle_segment_traces(ohlcv: Dict[str, List[Any]], series_name: str, chart_type: str) -> List[go.Scattergl]:
+    """
+    Draw bars as NaN-separated high-low and open-close segments, one WebGL
+    trace per colour and part, so thousands of bars render as four traces.
+    """
+    timestamps = np.asarray(ohlcv['timestamp'], dtype=object)
+    prices = {key: np.asarray(ohlcv[key], dtype=np.float64) for key in ('open', 'high', 'low', 'close')}
+    rising = prices['close'] >= prices['open']
+    body_width = 4 if chart_type == "candlestick" else 2
+
+    traces = []
+    for is_rising, color in ((True, '#26a69a'), (False, '#ef5350')):
+        bars = rising if is_rising else ~rising
+        for start_key, end_key, width in (('high', 'low', 1), ('open', 'close', body_width)):
+            x = np.full(3 * int(bars.sum()), None, dtype=object)
+            x[0::3] = timestamps[bars]
+            x[1::3] = timestamps[bars]
+            y = np.full(len(x), np.nan)
+            y[0::3] = prices[start_key][bars]
+            y[1::3] = prices[end_key][bars]
+            traces.append(go.Scattergl(
+                x=x,
+                y=y,
+                mode='lines',
+                connectgaps=False,
+                line=dict(width=width, color=color),
+                name=series_name,
+                legendgroup=series_name,
+                showlegend=not traces,
+            ))
+    return traces
+
+
 def create_financial_plot(df: pd.DataFrame, series_id: Optional[str] = None, chart_type: str = "candlestick", show_volume: bool = True) -> go.Figure:
     """Create financial chart (candlestick or OHLC) with optional volume subplot."""
     # Extract OHLCV data
@@ -724,7 +1006,9 @@ def create_financial_plot(df: pd.DataFrame, series_id: Optional[str] = None, cha
         series_name = "Financial Data"
     
     # Add price chart
-    if chart_type == "candlestick":
+    if chart_type in ("candlestick", "ohlc") and len(ohlcv['timestamp']) > CANDLE_SEGMENT_THRESHOLD:
+        trace = _candle_segment_traces(ohlcv, series_name, chart_type)
+    elif chart_type == "candlestick":
         trace = go.Candlestick(
             x=ohlcv['timestamp'],
             open=ohlcv['open'],
@@ -756,8 +1040,9 @@ def create_financial_plot(df: pd.DataFrame, series_id: Optional[str] = None, cha
             marker=dict(size=4)
         )
     
+    traces = trace if isinstance(trace, list) else [trace]
     if show_volume and any(v > 0 for v in ohlcv['volume']):
-        fig.add_trace(trace, row=1, col=1)
+        fig.add_traces(traces, rows=1, cols=1)
         # Add volume bars
         colors = ['#26a69a' if ohlcv['close'][i] >= ohlcv['open'][i] else '#ef5350' 
                  for i in range(len(ohlcv['close']))]
@@ -773,7 +1058,7 @@ def create_financial_plot(df: pd.DataFrame, series_id: Optional[str] = None, cha
         )
         fig.update_yaxes(title_text="Volume", row=2, col=1)
     else:
-        fig.add_trace(trace)
+        fig.add_traces(traces)
     
     # Update layout
     fig.update_layout(
@@ -794,6 +1079,35 @@ def create_financial_plot(df: pd.DataFrame, series_id: Optional[str] = None, cha
     return fig
 
 
+# Significant decimal digits float32 always round-trips (FLT_DIG)
+FLOAT32_DIGITS = 6
+
+
+def _fits_float32(values: np.ndarray) -> bool:
+    """Whether float32 shows every float64 value unchanged (hover text included)."""
+    narrowed = values.astype(np.float32)
+    if np.array_equal(narrowed.astype(np.float64), values, equal_nan=True):
+        return True
+    # Otherwise every value must have at most FLOAT32_DIGITS significant digits
+    finite = values[np.isfinite(values) & (values != 0)]
+    with np.errstate(over='ignore'):
+        scaled = finite * 10.0 ** (FLOAT32_DIGITS - 1 - np.floor(np.log10(np.abs(finite))))
+    return bool(np.isfinite(scaled).all() and np.allclose(scaled, np.round(scaled), rtol=0, atol=1e-6))
+
+
+def _plotly_values(values: pd.Series):
+    """
+    Values for a Plotly trace; numeric data is sent as float32 when that loses
+    no visible precision, which halves the typed-array payload Plotly
+    serializes for the browser.
+    """
+    values = values.infer_objects()
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        values = values.to_numpy(dtype=np.float64)
+        return values.astype(np.float32) if _fits_float32(values) else values
+    return values
+
+
 def create_plot(df: pd.DataFrame, series_id: Optional[str] = None, metric: Optional[str] = None, chart_type: str = "auto") -> go.Figure:
     """Create Plotly time-series plot, with financial chart support."""
     if df is None or len(df) == 0:
@@ -873,7 +1187,7 @@ def create_plot(df: pd.DataFrame, series_id: Optional[str] = None, metric: Optio
                 
                 fig.add_trace(go.Scatter(
                     x=timestamps,
-                    y=series_data['value'],
+                    y=_plotly_values(series_data['value']),
                     mode='lines+markers',
                     name=f"{sid} - {metric}",
                     line=dict(width=2),
@@ -935,7 +1249,7 @@ def create_plot(df: pd.DataFrame, series_id: Optional[str] = None, metric: Optio
                     
                     fig.add_trace(go.Scatter(
                         x=timestamps,
-                        y=series_data['value'],
+                        y=_plotly_values(series_data['value']),
                         mode='lines+markers',
                         name=f"{sid} - {metric_to_plot}",
                         line=dict(width=2),
@@ -162,7 +162,7 @@ def create_dashboard(supabase_client=None):
         refresh_storage_button.loading = True
         try:
             if app.storage:
-                keys = app.storage.list_keys()[:100]
+                keys = app.storage.list_keys(limit=100)
                 df_data = []
                 for k in keys:
                     file_type = k.split('.')[-1].upper() if '.' in k else 'DATA'
@@ -197,36 +197,51 @@ def create_dashboard(supabase_client=None):
         """Refresh aggregate table with hourly aggregates."""
         try:
             if app.storage:
-                keys = app.storage.list_keys("data/")[:100]
-                records = []
-                for key in keys:
-                    data_bytes = app.storage.load(key)
-                    if data_bytes:
-                        import json
-                        try:
-                            record = json.loads(data_bytes.decode('utf-8'))
-                            if 'timestamp' in record:
-                                records.append(record)
-                        except:
-                            pass
+                from concurrent.futures import ThreadPoolExecutor
+                try:
+                    import orjson
+                    loads = orjson.loads
+                except ImportError:
+                    import json
+                    loads = json.loads
+
+                def decode(data_bytes):
+                    try:
+                        return loads(data_bytes) if data_bytes else None
+                    except Exception:
+                        return None
+
+                keys = app.storage.list_keys("data/", limit=100)
+                # Loads are I/O bound (disk or S3 round trips), so overlap them
+                with ThreadPoolExecutor(max_workers=16) as pool:
+                    blobs = list(pool.map(app.storage.load, keys))
+                records = [
+                    record for record in map(decode, blobs)
+                    if isinstance(record, dict) and 'timestamp' in record
+                ]
 
                 if records:
                     df = pd.DataFrame(records)
                     if 'timestamp' in df.columns:
-                        df['timestamp'] = pd.to_datetime(df['timestamp'])
+                        # Records are ISO-8601 strings; a fixed format skips per-value format
+                        # inference and cache=True parses repeated timestamps only once
+                        try:
+                            df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', cache=True)
+                        except (ValueError, TypeError):
+                            df['timestamp'] = pd.to_datetime(df['timestamp'], cache=True)
                         df['hour'] = df['timestamp'].dt.floor('h')  # Use 'h' instead of deprecated 'H'
 
-                        aggregates = []
-                        for hour in sorted(df['hour'].unique(), reverse=True):
-                            hour_data = df[df['hour'] == hour]
-                            agg_row = {
-                                'Hour': hour.strftime('%Y-%m-%d %H:00'),
-                                'Records': len(hour_data),
-                                'Series': hour_data.get('series_id', pd.Series()).nunique() if 'series_id' in hour_data.columns else 0
-                            }
-                            aggregates.append(agg_row)
-
-                        aggregate_table.value = pd.DataFrame(aggregates)
+                        # One groupby pass instead of a boolean mask per hour
+                        agg_spec = {'Records': ('hour', 'size')}
+                        if 'series_id' in df.columns:
+                            agg_spec['Series'] = ('series_id', 'nunique')
+                        aggregates = df.groupby('hour').agg(**agg_spec).sort_index(ascending=False)
+                        if 'Series' not in aggregates.columns:
+                            aggregates['Series'] = 0
+                        aggregates = aggregates.reset_index()
+                        aggregates['Hour'] = aggregates['hour'].dt.strftime('%Y-%m-%d %H:00')
+
+                        aggregate_table.value = aggregates[['Hour', 'Records', 'Series']]
                     else:
                         aggregate_table.value = pd.DataFrame(columns=["Hour", "Records", "Series"])
                 else:
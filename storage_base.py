@@ -3,11 +3,18 @@ VARIOSYNC Storage Base Module
 Abstract base class for storage backends.
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 
 class StorageBackend(ABC):
     """Abstract base class for storage backends."""
+
+    # Maximum number of saves remembered for keys_added_since()
+    SAVE_JOURNAL_SIZE = 100_000
+
+    _save_seq = 0
+    _save_journal: Optional[Deque[Tuple[int, str]]] = None
     
     @abstractmethod
     def save(self, key: str, data: bytes, metadata: Optional[Dict[str, Any]] = None) -> bool:
@@ -64,12 +71,13 @@ class StorageBackend(ABC):
         pass
     
     @abstractmethod
-    def list_keys(self, prefix: str = "") -> List[str]:
+    def list_keys(self, prefix: str = "", limit: Optional[int] = None) -> List[str]:
         """
         List all keys with optional prefix.
         
         Args:
             prefix: Key prefix filter
+            limit: Maximum number of keys to return (None for all)
             
         Returns:
             List of keys
@@ -90,3 +98,48 @@ class StorageBackend(ABC):
         # Subclasses should override for efficiency
         data = self.load(key)
         return len(data) if data is not None else None
+
+    def current_seq(self) -> int:
+        """
+        Get the sequence number of the most recent successful save.
+        
+        Returns:
+            Monotonically increasing save counter (0 if nothing was saved)
+        """
+        return self._save_seq
+    
+    def keys_added_since(self, seq: int) -> List[str]:
+        """
+        List keys saved after a sequence marker from current_seq().
+        
+        Args:
+            seq: Marker previously returned by current_seq()
+            
+        Returns:
+            Keys saved since the marker, in save order, without duplicates
+        """
+        if not self._save_journal:
+            return []
+        
+        keys = []
+        for entry_seq, key in reversed(self._save_journal):
+            if entry_seq <= seq:
+                break
+            keys.append(key)
+        keys.reverse()
+        return list(dict.fromkeys(keys))
+    
+    def _record_save(self, key: str) -> None:
+        """
+        Record a successful save in the save journal.
+        
+        Backends call this from save() so callers can ask for new keys
+        without listing the whole store.
+        
+        Args:
+            key: Storage key/path that was saved
+        """
+        if self._save_journal is None:
+            self._save_journal = deque(maxlen=self.SAVE_JOURNAL_SIZE)
+        self._save_seq += 1
+        self._save_journal.append((self._save_seq, key))
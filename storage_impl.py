@@ -3,6 +3,7 @@ VARIOSYNC Storage Implementation Module
 Concrete storage backend implementations.
 """
 import os
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -42,6 +43,7 @@ class LocalStorage(StorageBackend):
             with open(file_path, "wb") as f:
                 f.write(data)
             
+            self._record_save(key)
             logger.debug(f"Saved {key} to local storage")
             return True
         except Exception as e:
@@ -87,17 +89,17 @@ class LocalStorage(StorageBackend):
             logger.error(f"Error deleting {key} from local storage: {e}")
             return False
     
-    def list_keys(self, prefix: str = "") -> List[str]:
-        """List files with optional prefix."""
+    def list_keys(self, prefix: str = "", limit: Optional[int] = None) -> List[str]:
+        """List files with optional prefix, stopping the walk after limit keys."""
         try:
             prefix_path = self.base_path / prefix if prefix else self.base_path
             keys = []
             
             if prefix_path.exists() and prefix_path.is_dir():
-                for file_path in prefix_path.rglob("*"):
-                    if file_path.is_file():
-                        rel_path = file_path.relative_to(self.base_path)
-                        keys.append(str(rel_path))
+                files = (p for p in prefix_path.rglob("*") if p.is_file())
+                for file_path in islice(files, limit):
+                    rel_path = file_path.relative_to(self.base_path)
+                    keys.append(str(rel_path))
             
             return keys
         except Exception as e:
@@ -212,6 +214,7 @@ class S3Storage(StorageBackend):
                 **extra_args
             )
 
+            self._record_save(key)
             logger.info(f"[S3Storage.save] Successfully saved {key} to S3 ({data_size} bytes)")
             return True
         except ClientError as e:
@@ -290,15 +293,15 @@ class S3Storage(StorageBackend):
             logger.error(f"[S3Storage.delete] Unexpected error deleting {key}: {e}", exc_info=True)
             return False
     
-    def list_keys(self, prefix: str = "") -> List[str]:
-        """List keys with optional prefix."""
+    def list_keys(self, prefix: str = "", limit: Optional[int] = None) -> List[str]:
+        """List keys with optional prefix, asking S3 for at most limit keys."""
         logger.debug(f"[S3Storage.list_keys] Listing keys with prefix: '{prefix}'")
 
         try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix
-            )
+            request = {"Bucket": self.bucket_name, "Prefix": prefix}
+            if limit is not None:
+                request["MaxKeys"] = limit
+            response = self.s3_client.list_objects_v2(**request)
 
             if "Contents" not in response:
                 logger.debug(f"[S3Storage.list_keys] No keys found with prefix: '{prefix}'")
@@ -309,7 +312,7 @@ class S3Storage(StorageBackend):
 
             logger.info(f"[S3Storage.list_keys] Found {len(keys)} keys with prefix '{prefix}' (total size: {total_size} bytes)")
 
-            if response.get("IsTruncated"):
+            if response.get("IsTruncated") and limit is None:
                 logger.warning(f"[S3Storage.list_keys] Results truncated, more keys exist")
 
             return keys
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test script for DuckDB pushdown of data cleaning operations.
+"""
+import numpy as np
+import pandas as pd
+
+from data_cleaner import DataCleaner
+
+
+def make_sample_df():
+    """Build a small frame with missing values, outliers and a text column."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "a": rng.normal(size=200),
+        "b": rng.normal(size=200),
+        "s": ["x"] * 200,
+    })
+    df.loc[[3, 7], "a"] = np.nan
+    df.loc[5, "a"] = 50.0
+    df.loc[9, "b"] = -40.0
+    df.loc[11, "s"] = None
+    return df
+
+
+def test_sql_matches_pandas():
+    """DuckDB results must match the pandas implementation."""
+    print("Testing DuckDB cleaning pushdown against pandas...")
+    df = make_sample_df()
+    cases = [
+        [{"operation": "drop_na", "params": {}}],
+        [{"operation": "drop_na", "params": {"subset": ["a", "s"], "how": "all"}}],
+        [{"operation": "remove_outliers", "params": {"columns": ["a", "b"]}}],
+        [{"operation": "remove_outliers", "params": {"columns": ["a"], "method": "zscore", "threshold": 2}}],
+        [{"operation": "clip_values", "params": {"column": "a", "min": -1, "max": 1.5}}],
+        [{"operation": "round_values", "params": {"columns": ["a", "b"], "decimals": 1}}],
+        [
+            {"operation": "drop_columns", "params": {"columns": ["s"]}},
+            {"operation": "rename_columns", "params": {"mapping": {"a": "A"}}},
+        ],
+    ]
+
+    for operations in cases:
+        sql_df = DataCleaner.clean_dataframe_sql(df, operations)
+        assert sql_df is not None, f"Expected pushdown for {operations}"
+        pandas_df = DataCleaner.clean_dataframe(df, operations).reset_index(drop=True)
+        pd.testing.assert_frame_equal(sql_df, pandas_df, check_dtype=False)
+        print(f"✅ {[op['operation'] for op in operations]}: {len(sql_df)} rows")
+
+
+def test_sql_falls_back():
+    """Operations without a SQL form (or invalid columns) return None."""
+    print("\nTesting DuckDB cleaning fallback...")
+    df = make_sample_df()
+    assert DataCleaner.to_sql([{"operation": "fill_na", "params": {}}], "src") is None
+    assert DataCleaner.to_sql([{"operation": "remove_outliers", "params": {}}], "src") is None
+    assert DataCleaner.clean_dataframe_sql(df, [{"operation": "drop_columns", "params": {"columns": ["missing"]}}]) is None
+    print("✅ Unsupported operations fall back to pandas")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Data Cleaner SQL Pushdown Test")
+    print("=" * 60)
+
+    test_sql_matches_pandas()
+    test_sql_falls_back()
+
+    print("\n" + "=" * 60)
+    print("✅ All tests passed!")
+    print("=" * 60)
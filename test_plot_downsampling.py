@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for downsampling time-series frames before plotting.
+"""
+import numpy as np
+import pandas as pd
+
+from nicegui_app.visualization import _resample_ohlcv, downsample_for_plot, lttb_indices
+
+
+def make_ohlcv_df(n=12_000, series_id="AAA"):
+    """Build a minute-bar OHLCV frame with direct columns."""
+    rng = np.random.default_rng(0)
+    close = 100 + rng.normal(size=n).cumsum()
+    return pd.DataFrame({
+        "series_id": series_id,
+        "timestamp": pd.date_range("2024-01-01", periods=n, freq="min"),
+        "open": close + rng.normal(scale=0.1, size=n),
+        "high": close + 1.0,
+        "low": close - 1.0,
+        "close": close,
+        "volume": np.ones(n),
+    })
+
+
+def test_lttb_indices():
+    """LTTB keeps n_out sorted rows including both ends and the extremes."""
+    print("Testing LTTB row selection...")
+    n = 10_000
+    x = np.arange(n, dtype=np.float64)
+    y = np.sin(x / 500)
+    y[4321] = 25.0
+    idx = lttb_indices(x, y, 500)
+    assert len(idx) == 500
+    assert idx[0] == 0 and idx[-1] == n - 1
+    assert np.all(np.diff(idx) > 0)
+    assert 4321 in idx, "Spike should survive downsampling"
+    assert len(lttb_indices(x[:100], y[:100], 500)) == 100
+    print(f"✅ Kept {len(idx)} of {n} points")
+
+
+def test_downsample_for_plot():
+    """Non-financial frames are thinned per series to at most n_out rows."""
+    print("\nTesting downsample_for_plot...")
+    df = pd.concat([make_ohlcv_df(series_id="AAA"), make_ohlcv_df(series_id="BBB")], ignore_index=True)
+    df = df.sort_values("timestamp", kind="stable", ignore_index=True)
+
+    small = df.head(100)
+    assert downsample_for_plot(small, n_out=500) is small
+
+    thinned = downsample_for_plot(df, metric="close", n_out=500)
+    assert thinned["series_id"].value_counts().tolist() == [500, 500]
+
+    one = downsample_for_plot(df, series_id="AAA", metric="close", n_out=500)
+    assert len(one) == 500 and set(one["series_id"]) == {"AAA"}
+    print(f"✅ {len(df)} rows thinned to {len(thinned)}")
+
+
+def test_resample_ohlcv():
+    """Financial frames become OHLCV bars; degenerate time spans are left alone."""
+    print("\nTesting OHLCV resampling...")
+    df = make_ohlcv_df()
+    bars = downsample_for_plot(df, series_id="AAA", is_financial=True, n_out=500)
+    assert 0 < len(bars) <= 501
+    assert bars["high"].max() == df["high"].max()
+    assert bars["low"].min() == df["low"].min()
+    assert bars["volume"].sum() == df["volume"].sum()
+
+    # Every row at the same instant: nothing to bucket by
+    same_time = df.assign(timestamp=pd.Timestamp("2024-01-01"))
+    assert _resample_ohlcv(same_time, "AAA", 500) is same_time
+
+    # Undated rows are ignored when measuring the span
+    with_nat = df.copy()
+    with_nat.loc[len(with_nat) - 1, "timestamp"] = pd.NaT
+    bars = downsample_for_plot(with_nat, series_id="AAA", is_financial=True, n_out=500)
+    assert 0 < len(bars) <= 501
+    print(f"✅ {len(df)} rows resampled to {len(bars)} bars")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Plot Downsampling Test")
+    print("=" * 60)
+
+    test_lttb_indices()
+    test_downsample_for_plot()
+    test_resample_ohlcv()
+
+    print("\n" + "=" * 60)
+    print("✅ All tests passed!")
+    print("=" * 60)
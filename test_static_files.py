@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test script for content negotiation in the static file and chart spec routes.
+"""
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from nicegui_app.static_files import _pick_encoding, encoded_response, precompress
+
+
+def test_pick_encoding():
+    """Codings refused with q=0 are never sent; the higher q wins."""
+    print("Testing Accept-Encoding negotiation...")
+    assert _pick_encoding("", True, True) is None
+    assert _pick_encoding("gzip, deflate, br", True, True) == "br"
+    assert _pick_encoding("gzip, deflate, br", True, False) == "gzip"
+    assert _pick_encoding("br;q=0, gzip", True, True) == "gzip"
+    assert _pick_encoding("br;q=0, gzip;q=0", True, True) is None
+    assert _pick_encoding("br;q=0.5, gzip;q=0.8", True, True) == "gzip"
+    assert _pick_encoding("*", True, True) == "br"
+    assert _pick_encoding("*;q=0, gzip", True, True) == "gzip"
+    assert _pick_encoding("GZIP;Q=1", True, True) == "gzip"
+    print("✅ Encodings picked from q-values")
+
+
+def test_variant_etags():
+    """Each encoding has its own ETag, and If-None-Match is compared per variant."""
+    print("\nTesting per-encoding ETags...")
+    data = b"variosync " * 200
+    gzipped, _ = precompress(data)
+    api = FastAPI()
+
+    @api.get("/asset")
+    def asset(request: Request):
+        return encoded_response(request, data, gzipped, None, "text/plain", {}, etag='"abc"')
+
+    client = TestClient(api)
+    plain = client.get("/asset", headers={"accept-encoding": "identity"})
+    packed = client.get("/asset", headers={"accept-encoding": "gzip"})
+    assert plain.headers["etag"] == '"abc"'
+    assert packed.headers["etag"] == '"abc-gzip"'
+    assert packed.headers["content-encoding"] == "gzip"
+    assert packed.content == data
+
+    # Weak comparison, and a tag from another encoding does not match
+    revalidated = client.get("/asset", headers={"accept-encoding": "gzip", "if-none-match": 'W/"abc-gzip"'})
+    assert revalidated.status_code == 304
+    other = client.get("/asset", headers={"accept-encoding": "identity", "if-none-match": '"abc-gzip"'})
+    assert other.status_code == 200
+    print("✅ ETags differ per encoding")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Static Files Test")
+    print("=" * 60)
+
+    test_pick_encoding()
+    test_variant_etags()
+
+    print("\n" + "=" * 60)
+    print("✅ All tests passed!")
+    print("=" * 60)